@@ -0,0 +1 @@
+# Offline benchmarking: Ollama-compatible stub server and latency harness
@@ -0,0 +1,190 @@
+"""
+VENOM LATENCY BENCHMARK
+=======================
+Drives VenomBrain.generate_stream (or CognitiveRouter.process_thought_stream)
+with N concurrent sessions against the Ollama stub and reports
+time-to-first-token, inter-token latency and end-to-end p50/p95/p99.
+Runs fully offline: the cloud backend is disabled.
+
+    python -m ai_core.bench.harness --sessions 8 --turns 5 --ttft 0.3 --tps 25
+"""
+
+import argparse
+import asyncio
+import json
+import tempfile
+import time
+
+import numpy as np
+
+from ai_core.core.circuit_breaker import backend_health
+from ai_core.core.config import config
+from ai_core.core.performance import http_pool
+from .ollama_stub import OllamaStub
+
+PROMPTS = [
+    "Explain how a circuit breaker protects a service",
+    "Summarize the last conversation in two sentences",
+    "Write a haiku about latency",
+    "What are the trade-offs of speculative decoding",
+]
+
+
+def percentiles(samples, points=(50, 95, 99)):
+    """{'p50': ..., 'p95': ..., 'p99': ...} in milliseconds (empty -> None)."""
+    if not len(samples):
+        return {f"p{p}": None for p in points}
+    values = np.percentile(np.asarray(samples) * 1000, points)
+    return {f"p{p}": round(float(v), 2) for p, v in zip(points, values)}
+
+
+async def measure_stream(stream, started=None):
+    """Consumes a text stream, timing the first chunk and the gaps between chunks."""
+    started = started or time.perf_counter()
+    ttft, gaps, chunks = None, [], 0
+    last = None
+    async for _ in stream:
+        now = time.perf_counter()
+        if ttft is None:
+            ttft = now - started
+        else:
+            gaps.append(now - last)
+        last = now
+        chunks += 1
+    return {
+        "ttft": ttft,
+        "gaps": gaps,
+        "e2e": time.perf_counter() - started,
+        "chunks": chunks,
+    }
+
+
+async def _brain_turn(brain, prompt, session_id):
+    stream = brain.generate_stream(prompt, complexity="SIMPLE", session_id=session_id)
+    return await measure_stream(stream)
+
+
+async def _router_turn(router, prompt, session_id):
+    started = time.perf_counter()
+    result, _, is_stream = await router.process_thought_stream(prompt)
+    if is_stream:
+        return await measure_stream(result, started)
+    elapsed = time.perf_counter() - started
+    return {"ttft": elapsed, "gaps": [], "e2e": elapsed, "chunks": 1}
+
+
+async def run_sessions(turn, target, sessions=4, turns=3, prompts=PROMPTS):
+    """Runs `sessions` concurrent conversations of `turns` sequential turns."""
+
+    async def session(index):
+        results = []
+        for t in range(turns):
+            prompt = prompts[(index + t) % len(prompts)]
+            try:
+                results.append(await turn(target, prompt, f"bench-{index}"))
+            except Exception as e:
+                results.append({"error": str(e)})
+        return results
+
+    started = time.perf_counter()
+    per_session = await asyncio.gather(*(session(i) for i in range(sessions)))
+    wall = time.perf_counter() - started
+    return summarize([r for results in per_session for r in results], wall)
+
+
+def summarize(results, wall=None):
+    ok = [r for r in results if "error" not in r and r["ttft"] is not None]
+    report = {
+        "requests": len(results),
+        "errors": len(results) - len(ok),
+        "ttft_ms": percentiles([r["ttft"] for r in ok]),
+        "inter_token_ms": percentiles([g for r in ok for g in r["gaps"]]),
+        "e2e_ms": percentiles([r["e2e"] for r in ok]),
+    }
+    if wall:
+        report["wall_s"] = round(wall, 3)
+        report["throughput_rps"] = round(len(ok) / wall, 2)
+    return report
+
+
+async def benchmark(
+    target="brain",
+    sessions=4,
+    turns=3,
+    ttft=0.2,
+    tokens_per_sec=30.0,
+    jitter=0.1,
+    error_rate=0.0,
+    drop_rate=0.0,
+    tokens=40,
+    seed=7,
+):
+    """Starts the stub, points the local backend at it and runs the load."""
+    stub = OllamaStub(
+        ttft=ttft,
+        tokens_per_sec=tokens_per_sec,
+        jitter=jitter,
+        error_rate=error_rate,
+        drop_rate=drop_rate,
+        tokens=tokens,
+        models=[config.LOCAL_MODEL, *config.LOCAL_ALT_MODELS],
+        seed=seed,
+    )
+    saved = (config.OLLAMA_URL, config.GEMINI_API_KEY, config.MEMORY_DIR)
+    config.OLLAMA_URL = await stub.start()
+    config.GEMINI_API_KEY = None  # offline: local backend only
+
+    try:
+        if target == "router":
+            # Keep benchmark turns out of the real episodic memory
+            config.MEMORY_DIR = tempfile.mkdtemp(prefix="venom_bench_")
+            from ai_core.brain.router import CognitiveRouter
+
+            report = await run_sessions(
+                _router_turn, CognitiveRouter(), sessions, turns
+            )
+        else:
+            from ai_core.brain.system_brain import VenomBrain
+
+            report = await run_sessions(_brain_turn, VenomBrain(), sessions, turns)
+    finally:
+        await backend_health.handle_shutdown()
+        await http_pool.close_all()
+        await stub.stop()
+        config.OLLAMA_URL, config.GEMINI_API_KEY, config.MEMORY_DIR = saved
+
+    report["stub_requests"] = stub.requests
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Venom brain latency benchmark")
+    parser.add_argument("--target", choices=["brain", "router"], default="brain")
+    parser.add_argument("--sessions", type=int, default=4)
+    parser.add_argument("--turns", type=int, default=3)
+    parser.add_argument("--ttft", type=float, default=0.2)
+    parser.add_argument("--tps", type=float, default=30.0)
+    parser.add_argument("--jitter", type=float, default=0.1)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--drop-rate", type=float, default=0.0)
+    parser.add_argument("--tokens", type=int, default=40)
+    args = parser.parse_args()
+
+    report = asyncio.run(
+        benchmark(
+            target=args.target,
+            sessions=args.sessions,
+            turns=args.turns,
+            ttft=args.ttft,
+            tokens_per_sec=args.tps,
+            jitter=args.jitter,
+            error_rate=args.error_rate,
+            drop_rate=args.drop_rate,
+            tokens=args.tokens,
+        )
+    )
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,204 @@
+"""
+OLLAMA STUB SERVER
+==================
+Speaks enough of Ollama's HTTP API (/api/generate, /api/chat, /api/tags)
+to drive the brain paths offline, with configurable time-to-first-token,
+throughput, jitter and error injection.
+
+    python -m ai_core.bench.ollama_stub --port 11434 --ttft 0.3 --tps 25
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+
+from aiohttp import web
+
+_WORDS = (
+    "venom neural link stable signal symbiote core process stream answer "
+    "context memory vector latency token model cloud local system"
+).split()
+
+
+class OllamaStub:
+    """
+    In-process fake Ollama server.
+
+    ttft:            seconds before the first token
+    tokens_per_sec:  steady generation rate after the first token
+    jitter:          relative +/- variation applied to every delay
+    error_rate:      fraction of requests answered with HTTP 500
+    drop_rate:       fraction of streams cut off half way through
+    tokens:          tokens per answer
+    """
+
+    def __init__(
+        self,
+        ttft=0.2,
+        tokens_per_sec=30.0,
+        jitter=0.1,
+        error_rate=0.0,
+        drop_rate=0.0,
+        tokens=40,
+        models=("phi3",),
+        seed=None,
+    ):
+        self.ttft = ttft
+        self.tokens_per_sec = tokens_per_sec
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.drop_rate = drop_rate
+        self.tokens = tokens
+        self.models = list(models)
+        self.random = random.Random(seed)
+        self.requests = 0
+
+        self.app = web.Application()
+        self.app.router.add_post("/api/generate", self.generate)
+        self.app.router.add_post("/api/chat", self.chat)
+        self.app.router.add_get("/api/tags", self.tags)
+        self._runner = None
+        self.url = None
+
+    # --- Lifecycle ---
+    async def start(self, host="127.0.0.1", port=0):
+        """Starts serving; port 0 picks a free port. Returns the base URL."""
+        self._runner = web.AppRunner(self.app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.url = f"http://{host}:{port}"
+        return self.url
+
+    async def stop(self):
+        if self._runner:
+            await self._runner.cleanup()
+            self._runner = None
+
+    # --- Simulation ---
+    def _delay(self, seconds):
+        return max(0.0, seconds * (1 + self.random.uniform(-self.jitter, self.jitter)))
+
+    def _answer(self):
+        return [self.random.choice(_WORDS) + " " for _ in range(self.tokens)]
+
+    async def _tokens(self):
+        """Yields (token, is_last) with TTFT and throughput pacing."""
+        answer = self._answer()
+        await asyncio.sleep(self._delay(self.ttft))
+        for i, token in enumerate(answer):
+            if i:
+                await asyncio.sleep(self._delay(1 / self.tokens_per_sec))
+            yield token, i == len(answer) - 1
+
+    async def _stream(self, request, body, frame):
+        """Writes NDJSON frames; `frame(token, done)` builds each object."""
+        response = web.StreamResponse(headers={"Content-Type": "application/x-ndjson"})
+        await response.prepare(request)
+        drop_at = self.tokens // 2 if self.random.random() < self.drop_rate else None
+
+        count = 0
+        async for token, last in self._tokens():
+            if count == drop_at:
+                request.transport.close()  # simulated connection reset
+                return response
+            await response.write(json.dumps(frame(token, False)).encode() + b"\n")
+            count += 1
+        await response.write(json.dumps(frame("", True)).encode() + b"\n")
+        await response.write_eof()
+        return response
+
+    def _meta(self, body):
+        return {
+            "model": body.get("model", self.models[0]),
+            "created_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        }
+
+    def _failed(self):
+        return self.random.random() < self.error_rate
+
+    # --- Endpoints ---
+    async def generate(self, request):
+        self.requests += 1
+        body = await request.json()
+        if self._failed():
+            return web.json_response({"error": "injected failure"}, status=500)
+
+        # KV context: prior tokens plus a fake id per prompt word and answer token
+        context = list(body.get("context") or [])
+        context += list(range(len(body.get("prompt", "").split()) + self.tokens))
+
+        def frame(token, done):
+            data = {**self._meta(body), "response": token, "done": done}
+            if done:
+                data.update(context=context, eval_count=self.tokens)
+            return data
+
+        if body.get("stream", True) is False:
+            text = "".join([token async for token, _ in self._tokens()])
+            data = frame(text, True)
+            return web.json_response(data)
+        return await self._stream(request, body, frame)
+
+    async def chat(self, request):
+        self.requests += 1
+        body = await request.json()
+        if self._failed():
+            return web.json_response({"error": "injected failure"}, status=500)
+
+        def frame(token, done):
+            data = {
+                **self._meta(body),
+                "message": {"role": "assistant", "content": token},
+                "done": done,
+            }
+            if done:
+                data["eval_count"] = self.tokens
+            return data
+
+        if body.get("stream", True) is False:
+            text = "".join([token async for token, _ in self._tokens()])
+            return web.json_response(frame(text, True))
+        return await self._stream(request, body, frame)
+
+    async def tags(self, request):
+        return web.json_response({"models": [{"name": m} for m in self.models]})
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Ollama-compatible stub server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=11434)
+    parser.add_argument("--ttft", type=float, default=0.2)
+    parser.add_argument("--tps", type=float, default=30.0)
+    parser.add_argument("--jitter", type=float, default=0.1)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--drop-rate", type=float, default=0.0)
+    parser.add_argument("--tokens", type=int, default=40)
+    args = parser.parse_args()
+
+    stub = OllamaStub(
+        ttft=args.ttft,
+        tokens_per_sec=args.tps,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        drop_rate=args.drop_rate,
+        tokens=args.tokens,
+    )
+
+    async def serve():
+        url = await stub.start(args.host, args.port)
+        print(f"Ollama stub listening on {url}")
+        await asyncio.Event().wait()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
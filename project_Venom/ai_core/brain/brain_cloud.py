@@ -1,3 +1,5 @@
+import asyncio
+
 try:
     import google.generativeai as genai
 
@@ -33,26 +35,74 @@ class CloudBrain:
             genai.configure(api_key=config.GEMINI_API_KEY)
             self.model = genai.GenerativeModel(config.SMART_MODEL)
             self.chat = self.model.start_chat(history=[])
+            self._chat_lock = asyncio.Lock()
             logger.success("Cloud Brain (Gemini) Connected")
         except Exception as e:
             logger.error(f"Cloud Brain Init Failed: {e}")
             self.model = None
 
-    async def think_complex(self, prompt, context=""):
+    async def think_stream(self, prompt, context="", use_chat=False, timeout=None):
         """
-        Executes deep reasoning via Cloud.
+        Streams a cloud answer through the SDK's async API.
+        `timeout` bounds the wait for the response and for each chunk
+        (CONNECTION_TIMEOUT by default). Closing or cancelling the consumer
+        cancels the request. With `use_chat`, the turn goes through the shared
+        chat session; callers are serialized and an unfinished turn is rolled
+        back so the history stays consistent.
         """
         if not self.model:
-            return "Thinking capacity limited (No Cloud Connection)."
+            yield "Thinking capacity limited (No Cloud Connection)."
+            return
 
+        timeout = timeout or config.CONNECTION_TIMEOUT
         full_message = f"SYSTEM_CONTEXT: {context}\nUSER_REQUEST: {prompt}"
 
+        if not use_chat:
+            request = self.model.generate_content_async(full_message, stream=True)
+            async for text in self._stream(request, timeout):
+                yield text
+            return
+
+        async with self._chat_lock:
+            history = list(self.chat.history)
+            completed = False
+            try:
+                request = self.chat.send_message_async(full_message, stream=True)
+                async for text in self._stream(request, timeout):
+                    yield text
+                completed = True
+            finally:
+                if not completed:
+                    self.chat = self.model.start_chat(history=history)
+
+    @staticmethod
+    async def _stream(request, timeout):
+        response = await asyncio.wait_for(request, timeout)
+        chunks = response.__aiter__()
+        while True:
+            try:
+                chunk = await asyncio.wait_for(chunks.__anext__(), timeout)
+            except StopAsyncIteration:
+                break
+            if chunk.text:
+                yield chunk.text
+
+    async def think_complex(self, prompt, context="", use_chat=False, timeout=None):
+        """
+        Executes deep reasoning via Cloud (non-blocking).
+        """
+        if not self.model:
+            return "Thinking capacity limited (No Cloud Connection)."
+
         try:
-            # Gemini async call (simulated async wrapper if needed, or native if supported)
-            # The google-generativeai lib is synchronous by default, wrapping in executor recommended for production.
-            # For simplicity in this step, we run sync (blocking) but note it for future optimization.
-            response = self.model.generate_content(full_message)
-            return response.text
+            chunks = [
+                text
+                async for text in self.think_stream(prompt, context, use_chat, timeout)
+            ]
+            return "".join(chunks)
+        except asyncio.TimeoutError:
+            logger.error("Cloud Thought Failed: timed out")
+            return None
         except Exception as e:
             logger.error(f"Cloud Thought Failed: {e}")
             return None
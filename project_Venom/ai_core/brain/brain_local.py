@@ -1,49 +1,99 @@
 
-import aiohttp
-import json
 from ai_core.core.logger import logger
 from ai_core.core.config import config
+from ai_core.core.performance import http_pool
+from ai_core.core.context_budget import truncate_to_budget
+from ai_core.brain.local_sessions import LocalSessions
+from ai_core.brain.streaming import coalesce, iter_ndjson
 
 class LocalBrain:
     """
     Interface for Local LLM (e.g., Ollama or LlamaCPP).
     Optimized for RTX 3050 (4GB VRAM) - assumes quantized models.
     """
-    def __init__(self, model_name="phi3", base_url="http://localhost:11434"):
+    def __init__(self, model_name=config.LOCAL_MODEL, base_url=config.OLLAMA_URL,
+                 system_prompt="You are Venom. Be concise and direct."):
         self.model_name = model_name
+        self.system_prompt = system_prompt
         self.base_url = base_url
         self.generate_endpoint = f"{base_url}/api/generate"
         self.chat_endpoint = f"{base_url}/api/chat"
+        self.sessions = LocalSessions(max_tokens=config.LOCAL_NUM_CTX)
         # self.check_connection()
 
-    async def think(self, prompt, context="", stream=False):
+    async def think(self, prompt, context="", stream=False, session_id=None):
         """
         Generates a thought using the local model.
+        With a session_id, follow-up turns reuse the server's KV context and
+        send only the new turn with its context; the session is keyed on the
+        system prompt, so only a changed system prompt starts a new one.
+        With stream=True, returns an async generator of text chunks instead.
         """
-        full_prompt = f"Context: {context}\nUser: {prompt}\nVenom:"
-        
+        # Keep the newest context lines that fit the local budget
+        context = truncate_to_budget(context, config.CONTEXT_BUDGETS.get('ollama', 1500))
+        payload = self._payload(prompt, context, session_id, stream)
+        if stream:
+            return self._think_stream(payload, session_id)
+
+        try:
+            session = await http_pool.acquire()
+            async with session.post(self.generate_endpoint, json=payload) as response:
+                if response.status == 200:
+                    data = await response.json()
+                    if session_id and data.get("context"):
+                        self.sessions.update(session_id, self.model_name, self.system_prompt, data["context"])
+                    return data.get("response", "")
+                else:
+                    logger.error(f"Local Brain Error {response.status}: {await response.text()}")
+                    return None
+        except Exception as e:
+            logger.error(f"Local Brain Connection Failed: {e}")
+            return None
+
+    async def _think_stream(self, payload, session_id):
+        """Streams the answer through the incremental NDJSON decoder."""
+        session = await http_pool.acquire()
+        async with session.post(self.generate_endpoint, json=payload) as response:
+            if response.status != 200:
+                logger.error(f"Local Brain Error {response.status}: {await response.text()}")
+                return
+
+            async for text in coalesce(
+                self._frames(response, session_id),
+                config.STREAM_CHUNK_SIZE,
+                config.STREAM_FLUSH_INTERVAL
+            ):
+                yield text
+
+    async def _frames(self, response, session_id):
+        async for text, final in iter_ndjson(response.content):
+            if text:
+                yield text
+            if final is not None and session_id and final.get("context"):
+                self.sessions.update(session_id, self.model_name, self.system_prompt, final["context"])
+
+    def _payload(self, prompt, context, session_id, stream):
+        turn = f"Context: {context}\nUser: {prompt}\nVenom:" if context else f"User: {prompt}\nVenom:"
+        full_prompt = f"System: {self.system_prompt}\n{turn}"
+
         payload = {
             "model": self.model_name,
             "prompt": full_prompt,
-            "stream": False,
+            "stream": stream,
+            "keep_alive": config.OLLAMA_KEEP_ALIVE,
             "options": {
                 "temperature": 0.7,
-                "num_ctx": 4096
+                "num_ctx": config.LOCAL_NUM_CTX
             }
         }
-        
-        try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(self.generate_endpoint, json=payload) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        return data.get("response", "")
-                    else:
-                        logger.error(f"Local Brain Error {response.status}: {await response.text()}")
-                        return None
-        except Exception as e:
-            logger.error(f"Local Brain Connection Failed: {e}")
-            return None
+
+        if session_id:
+            kv_context = self.sessions.context_for(session_id, self.model_name, self.system_prompt)
+            if kv_context:
+                # The system prompt and earlier turns already live in the KV context
+                payload["prompt"] = turn
+                payload["context"] = kv_context
+        return payload
 
     def check_connection(self):
         # Implementation for health check
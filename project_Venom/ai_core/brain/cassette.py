@@ -0,0 +1,112 @@
+import asyncio
+import hashlib
+import json
+import os
+import time
+from collections import defaultdict
+
+from ai_core.core.logger import logger
+
+
+class Cassette:
+    """
+    Record/replay store for brain streams (append-only JSON lines).
+
+    Each line holds one completed stream:
+        {"key", "prompt", "model", "chunks": [[delay_s, text], ...], "at"}
+    where delay_s is the gap before the chunk (the first one is the TTFT).
+    Requests match on (prompt, system instruction, visual context); repeated
+    requests replay their recordings in order, cycling when exhausted.
+    `speed` scales replay delays (2.0 = twice as fast, 0 = no delays).
+    `reject(answer)` flags completed streams that must not be recorded,
+    such as canned failure texts.
+    """
+
+    def __init__(self, path, mode="replay", speed=1.0, reject=None):
+        self.path = path
+        self.mode = mode
+        self.speed = speed
+        self.reject = reject
+        self.recordings = defaultdict(list)
+        self._cursor = defaultdict(int)
+        self.stats = {"recorded": 0, "replayed": 0, "misses": 0, "rejected": 0}
+        if mode == "replay":
+            self.load()
+
+    @staticmethod
+    def key(prompt, system_instruction="", visual_context=None):
+        raw = json.dumps([prompt, system_instruction or "", visual_context or ""])
+        return hashlib.sha1(raw.encode()).hexdigest()
+
+    def load(self):
+        if not os.path.exists(self.path):
+            logger.warning(f"Cassette not found: {self.path}")
+            return
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # torn final line from an interrupted recording
+                self.recordings[entry["key"]].append(entry)
+
+    # --- Replay ---
+    def lookup(self, prompt, system_instruction="", visual_context=None):
+        """Next recording for a request, or None (the caller goes live)."""
+        key = self.key(prompt, system_instruction, visual_context)
+        entries = self.recordings.get(key)
+        if not entries:
+            self.stats["misses"] += 1
+            return None
+        entry = entries[self._cursor[key] % len(entries)]
+        self._cursor[key] += 1
+        self.stats["replayed"] += 1
+        return entry
+
+    async def replay(self, entry):
+        for delay, text in entry["chunks"]:
+            if self.speed:
+                await asyncio.sleep(delay / self.speed)
+            yield text
+
+    # --- Record ---
+    async def record(
+        self, stream, prompt, system_instruction="", visual_context=None, trace=None
+    ):
+        """
+        Passes a stream through, timing each chunk. Only streams that run to
+        completion and pass `reject` are written.
+        """
+        chunks = []
+        last = time.perf_counter()
+        async for text in stream:
+            now = time.perf_counter()
+            chunks.append([round(now - last, 4), text])
+            last = now
+            yield text
+
+        if self.reject and self.reject("".join(text for _, text in chunks)):
+            self.stats["rejected"] += 1
+            return
+        entry = {
+            "key": self.key(prompt, system_instruction, visual_context),
+            "prompt": prompt,
+            "model": (trace or {}).get("model"),
+            "chunks": chunks,
+            "at": time.time(),
+        }
+        self.append(entry)
+
+    def append(self, entry):
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry, ensure_ascii=False, separators=(",", ":")))
+            f.write("\n")
+        self.recordings[entry["key"]].append(entry)
+        self.stats["recorded"] += 1
+
+    def get_stats(self):
+        return {**self.stats, "mode": self.mode, "keys": len(self.recordings)}
@@ -0,0 +1,117 @@
+import datetime
+import random
+import re
+import time
+from collections import defaultdict
+
+from ai_core.core.accelerator import smart_router
+from ai_core.core.synapse import synapse
+
+_BARE_GREETING_RE = re.compile(r"^\W*(hello|hi|hey|greetings)\W*$")
+
+
+class FastResponder:
+    """
+    Instant local answers for fast_response intents (time, date, status...).
+    Handlers are keyed by the accelerator's pattern `type` and receive
+    (query, responder). Returning None declines, so the query falls
+    through to the normal organ chain.
+    """
+
+    def __init__(self, vitals_max_age=2.0):
+        self.handlers = {}
+        self.kernel = None
+        self.vitals_max_age = vitals_max_age
+        self.stats = defaultdict(int)
+        self._latency_us = defaultdict(float)
+
+    def register(self, intent, handler=None, pattern=None):
+        """
+        Registers a handler for an intent, optionally with the regex that
+        detects it. Usable directly or as a decorator.
+        """
+
+        def decorator(func):
+            self.handlers[intent] = func
+            if pattern:
+                smart_router.accelerator.common_patterns[pattern] = {
+                    "type": intent,
+                    "fast_response": True,
+                }
+            return func
+
+        if handler is not None:
+            return decorator(handler)
+        return decorator
+
+    def bind_kernel(self, kernel):
+        """Lets status answers report live kernel state."""
+        self.kernel = kernel
+
+    def sampled_vitals(self):
+        """
+        Reuses the HUD's latest vitals sample when it is fresh enough;
+        only samples psutil itself when nothing recent exists.
+        """
+        vitals = synapse.last_vitals
+        if vitals and time.time() - vitals["timestamp"] <= self.vitals_max_age:
+            return vitals
+        return synapse.get_vitals()
+
+    def respond(self, intent, query):
+        """Returns the local answer for an intent, or None to decline."""
+        handler = self.handlers.get(intent)
+        if handler is None:
+            return None
+
+        start = time.perf_counter()
+        answer = handler(query, self)
+        elapsed_us = (time.perf_counter() - start) * 1e6
+
+        if answer:
+            self.stats[intent] += 1
+            self._latency_us[intent] += elapsed_us
+        else:
+            self.stats["declined"] += 1
+        return answer
+
+    def get_stats(self):
+        """Answer counts and mean handler latency (µs) per intent."""
+        stats = dict(self.stats)
+        for intent, total in self._latency_us.items():
+            stats[f"{intent}_avg_us"] = round(total / self.stats[intent], 1)
+        return stats
+
+
+fast_responder = FastResponder()
+
+
+@fast_responder.register("time_query")
+def _answer_time(query, responder):
+    return datetime.datetime.now().strftime("It's %I:%M %p.")
+
+
+@fast_responder.register("date_query")
+def _answer_date(query, responder):
+    return datetime.datetime.now().strftime("Today is %A, %B %d, %Y.")
+
+
+@fast_responder.register("status")
+def _answer_status(query, responder):
+    vitals = responder.sampled_vitals()
+    state = responder.kernel.state if responder.kernel else "ALIVE"
+    return (
+        f"Kernel {state}. All systems nominal. CPU at {vitals['cpu_percent']}%, "
+        f"memory at {vitals['ram_percent']}%."
+    )
+
+
+@fast_responder.register("greeting")
+def _answer_greeting(query, responder):
+    # Only a bare greeting; "hey, explain X" still needs the brain.
+    if not _BARE_GREETING_RE.match(query.lower()):
+        return None
+    for config in smart_router.accelerator.common_patterns.values():
+        if config["type"] == "greeting" and config.get("responses"):
+            return random.choice(config["responses"])
+    return None
@@ -0,0 +1,70 @@
+import hashlib
+from collections import OrderedDict
+
+
+class LocalSessions:
+    """
+    Ollama KV-context per (session, model).
+    /api/generate returns a `context` token array encoding the conversation
+    so far; sending it back with the next turn lets the server skip
+    re-processing the history. A session is dropped when its system
+    instruction changes, when it nears the context window, or when a turn
+    was answered by another backend (the local context would miss it).
+    """
+
+    def __init__(self, max_sessions=32, max_tokens=4096):
+        self.max_sessions = max_sessions
+        self.max_tokens = max_tokens
+        self._sessions = OrderedDict()  # (session_id, model) -> (system hash, context)
+        self.stats = {"reused": 0, "started": 0, "invalidated": 0}
+
+    @staticmethod
+    def _hash(system_instruction):
+        return hashlib.sha1((system_instruction or "").encode()).hexdigest()
+
+    def is_warm(self, session_id, model, system_instruction=""):
+        """Would context_for() reuse a stored context for this turn?"""
+        entry = self._sessions.get((session_id, model))
+        return entry is not None and entry[0] == self._hash(system_instruction)
+
+    def context_for(self, session_id, model, system_instruction=""):
+        """Returns the stored context tokens, or None to start a fresh session."""
+        key = (session_id, model)
+        entry = self._sessions.get(key)
+        if entry is None:
+            self.stats["started"] += 1
+            return None
+
+        system_hash, context = entry
+        if system_hash != self._hash(system_instruction):
+            del self._sessions[key]
+            self.stats["invalidated"] += 1
+            self.stats["started"] += 1
+            return None
+
+        self._sessions.move_to_end(key)
+        self.stats["reused"] += 1
+        return context
+
+    def update(self, session_id, model, system_instruction, context):
+        key = (session_id, model)
+        if len(context) > self.max_tokens * 0.8:
+            # Nearly full: let the next turn start over instead of having
+            # the server truncate the history silently
+            if self._sessions.pop(key, None) is not None:
+                self.stats["invalidated"] += 1
+            return
+
+        self._sessions[key] = (self._hash(system_instruction), context)
+        self._sessions.move_to_end(key)
+        while len(self._sessions) > self.max_sessions:
+            self._sessions.popitem(last=False)
+
+    def invalidate(self, session_id):
+        """Forgets every model's context for a session."""
+        for key in [k for k in self._sessions if k[0] == session_id]:
+            del self._sessions[key]
+            self.stats["invalidated"] += 1
+
+    def get_stats(self):
+        return {**self.stats, "active": len(self._sessions)}
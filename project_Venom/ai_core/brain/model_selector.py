@@ -0,0 +1,116 @@
+import time
+
+from ai_core.core.circuit_breaker import CircuitBreaker, backend_health
+
+# Rough answer length per complexity class, in tokens. Short answers are
+# dominated by time-to-first-token, long ones by generation throughput.
+EXPECTED_TOKENS = {"SIMPLE": 60, "SPECIALIZED": 150, "MODERATE": 300, "COMPLEX": 800}
+
+# Optimistic priors for backends with no observations yet: (ttft s, tokens/s)
+PRIORS = {"gemini": (1.0, 60.0), "ollama": (0.6, 15.0)}
+
+
+class BackendStats:
+    """EWMA of time-to-first-token, tokens per second and error rate."""
+
+    def __init__(self, kind, alpha):
+        self.alpha = alpha
+        self.ttft, self.tokens_per_sec = PRIORS[kind]
+        self.error_rate = 0.0
+        self.samples = 0
+
+    def _ewma(self, current, value):
+        return (1 - self.alpha) * current + self.alpha * value
+
+    def observe_ttft(self, seconds):
+        self.ttft = self._ewma(self.ttft, seconds)
+
+    def observe_success(self, tokens, seconds):
+        if tokens and seconds > 0:
+            self.tokens_per_sec = self._ewma(self.tokens_per_sec, tokens / seconds)
+        self.error_rate = self._ewma(self.error_rate, 0.0)
+        self.samples += 1
+
+    def observe_error(self):
+        self.error_rate = self._ewma(self.error_rate, 1.0)
+        self.samples += 1
+
+    def snapshot(self):
+        return {
+            "ttft_ms": round(self.ttft * 1000, 1),
+            "tokens_per_sec": round(self.tokens_per_sec, 1),
+            "error_rate": round(self.error_rate, 3),
+            "samples": self.samples,
+        }
+
+
+class ModelSelector:
+    """
+    Orders backend candidates ("gemini:<model>", "ollama:<model>") by
+    expected completion time for the request's complexity class.
+    Heavy requests weigh non-preferred backends (fast tier, local models)
+    by `quality_penalty` so latency only overrides quality when the gap
+    is large. Backends with an open circuit go last.
+    """
+
+    def __init__(self, alpha=0.3, error_penalty=10.0, quality_penalty=2.0):
+        self.alpha = alpha
+        self.error_penalty = error_penalty
+        self.quality_penalty = quality_penalty
+        self.stats = {}
+
+    def _stats(self, backend):
+        if backend not in self.stats:
+            self.stats[backend] = BackendStats(backend.split(":")[0], self.alpha)
+        return self.stats[backend]
+
+    def score(self, backend, complexity="SIMPLE", preferred=()):
+        """Expected seconds to a complete answer (lower is better)."""
+        stats = self._stats(backend)
+        tokens = EXPECTED_TOKENS.get(complexity, 150)
+        expected = stats.ttft + tokens / max(stats.tokens_per_sec, 1e-3)
+        expected += stats.error_rate * self.error_penalty
+        if preferred and backend not in preferred:
+            expected *= self.quality_penalty
+        return expected
+
+    def order(self, candidates, complexity="SIMPLE", preferred=()):
+        def key(backend):
+            breaker = backend_health.breakers.get(backend)
+            is_open = breaker is not None and breaker.state == CircuitBreaker.OPEN
+            return (is_open, self.score(backend, complexity, preferred))
+
+        return sorted(candidates, key=key)
+
+    # --- Observations ---
+    def observe_ttft(self, backend, seconds):
+        self._stats(backend).observe_ttft(seconds)
+
+    def observe_success(self, backend, tokens, seconds):
+        self._stats(backend).observe_success(tokens, seconds)
+
+    def observe_error(self, backend):
+        self._stats(backend).observe_error()
+
+    async def timed(self, backend, agen):
+        """Wraps a backend stream, recording TTFT, throughput and failures."""
+        started = time.perf_counter()
+        first_at = None
+        chars = 0
+        try:
+            async for text in agen:
+                if first_at is None:
+                    first_at = time.perf_counter()
+                    self.observe_ttft(backend, first_at - started)
+                chars += len(text)
+                yield text
+        except Exception:
+            self.observe_error(backend)
+            raise
+
+        if first_at is not None:
+            # ~4 characters per token is close enough for ranking
+            self.observe_success(backend, chars / 4, time.perf_counter() - first_at)
+
+    def snapshot(self):
+        return {name: s.snapshot() for name, s in self.stats.items()}
@@ -1,11 +1,28 @@
+import asyncio
+import time
+from collections import deque
+
 from .system_brain import VenomBrain
+from .streaming import PrefetchedStream
+from .fast_responder import fast_responder
 from ai_core.core.config import config
 from ai_core.core.logger import logger
+from ai_core.core.performance import RouteCache
+from ai_core.core.accelerator import smart_router
+from ai_core.core.consolidation import loop_summarizer
 from .analytical_engine import engine as math_engine
 from modules.actions import VenomActions
 from modules.media import MediaController
 from modules.comms import Communicator
 
+# Routes whose output depends only on the query text, with their cache TTL (s).
+# Anything not listed (actions, media, comms, vision, ...) runs every time.
+PURE_ROUTE_TTLS = {
+    "Analytical Engine": 3600,
+    "Quantum Cortex": 600,
+    "Venom Analytics": 300,
+}
+
 
 class CognitiveRouter:
     """
@@ -30,16 +47,87 @@ class CognitiveRouter:
 
         self.vision = VisionSystem()
 
+        # Episodic memory: recalled into the brain's context, updated per turn
+        from ai_core.core.memory import VenomMemory
+
+        self.memory = VenomMemory()
+
+        # Consolidation summaries are written by the local model through the
+        # brain's micro-batcher (extractive summaries without an event loop)
+        try:
+            self.memory.consolidator.summarizer = loop_summarizer(
+                self.brain.summarize, asyncio.get_running_loop()
+            )
+        except RuntimeError:
+            pass
+
         # Voice Cloner we load on demand as it's very heavy VRAM usage
         self.cloner = None
 
+        # Result cache for pure routes (skips the organ entirely on a hit)
+        self.route_cache = (
+            RouteCache(max_size=config.ROUTE_CACHE_SIZE)
+            if config.ROUTE_CACHE_ENABLED
+            else None
+        )
+
+        # Speculative routing telemetry
+        self.stream_stats = {
+            "speculative_launched": 0,
+            "speculative_cancelled": 0,
+            "speculative_used": 0,
+        }
+        self.ttft_samples = {
+            "speculative": deque(maxlen=100),
+            "sequential": deque(maxlen=100),
+        }
+
     async def process_thought_stream(self, prompt, visual_context=None):
         """
         Process thought but return a generator for streaming if it's a Neural Core task.
         Returns: (result, source, is_stream)
         """
+        # Visual context makes the answer frame-dependent, so only text-only
+        # queries are eligible for the route cache.
+        cacheable = self.route_cache is not None and visual_context is None
+        if cacheable:
+            # Misses are counted below, once the query turns out to be a pure
+            # route, so Neural Core traffic does not dilute the hit rate.
+            cached = self.route_cache.get(prompt, count_miss=False)
+            if cached:
+                result, source = cached
+                return result, source, False
+
+        result, source, is_stream = await self._dispatch(prompt, visual_context)
+
+        if cacheable and not is_stream and result and source in PURE_ROUTE_TTLS:
+            self.route_cache.record_miss()
+            self.route_cache.set(prompt, result, source, PURE_ROUTE_TTLS[source])
+
+        return result, source, is_stream
+
+    def get_cache_stats(self):
+        """Route cache hit/miss metrics."""
+        if self.route_cache is None:
+            return {"enabled": False}
+        return {"enabled": True, **self.route_cache.stats()}
+
+    async def _dispatch(self, prompt, visual_context=None):
+        """Runs the organ chain for a query that missed the route cache."""
+        turn_started = time.perf_counter()
         p_lower = prompt.lower()
 
+        # Pre-routing: complexity estimate picks the model tier, and
+        # fast_response intents are answered locally by the FastResponder.
+        complexity = None
+        if config.ENABLE_SMART_ROUTING:
+            plan = await smart_router.route_query(prompt)
+            complexity = plan.get("complexity")
+            if plan["route"] == "fast_response" and config.ENABLE_PATTERN_MATCHING:
+                answer = fast_responder.respond(plan["type"], prompt)
+                if answer:
+                    return answer, "Fast Response", False
+
         # 0. Hardware/Neural Controls
         if "clone" in p_lower and "voice" in p_lower:
             if not self.cloner:
@@ -110,26 +198,75 @@ class CognitiveRouter:
             result = va.generate_report()
             return result, "Venom Analytics", False
 
+        # Everything below may end up at the Neural Core. In speculative mode
+        # the brain request is launched now and overlaps with the remaining
+        # local checks; it is cancelled if one of them claims the query.
+        speculative = None
+        if config.SPECULATIVE_ROUTING:
+            speculative = PrefetchedStream(
+                self._brain_stream(prompt, visual_context, complexity)
+            )
+            self.stream_stats["speculative_launched"] += 1
+
+        result, source = await self._local_handlers(prompt, offload=bool(speculative))
+        if result:
+            if speculative:
+                await speculative.aclose()
+                self.stream_stats["speculative_cancelled"] += 1
+            return result, source, False
+
+        if speculative:
+            self.stream_stats["speculative_used"] += 1
+            return (
+                self._timed(speculative.stream(), turn_started, "speculative"),
+                "Neural Core",
+                True,
+            )
+
+        stream_gen = self._brain_stream(prompt, visual_context, complexity)
+        return self._timed(stream_gen, turn_started, "sequential"), "Neural Core", True
+
+    async def _local_handlers(self, prompt, offload=False):
+        """
+        Local organs that decide by running rather than by keyword.
+        With `offload`, blocking handlers run in a worker thread so an
+        in-flight brain request keeps making progress on the event loop.
+        Returns: (result, source) or (None, None)
+        """
+        p_lower = prompt.lower()
+
         # 5. Action Check (Fastest)
-        action_result = self.actions.execute(prompt)
+        if offload:
+            action_result = await asyncio.to_thread(self.actions.execute, prompt)
+        else:
+            action_result = self.actions.execute(prompt)
         if action_result:
-            return action_result, "Kinetic System", False
+            return action_result, "Kinetic System"
 
         # 4. Math Check
         math_result = await math_engine.process_math(prompt)
         if math_result:
-            return math_result, "Analytical Engine", False
+            return math_result, "Analytical Engine"
 
         # 4.5. Cloud Chat Fallback (Inspiration Integration)
         if "huggingface" in p_lower or ("chat" in p_lower and "cloud" in p_lower):
             from modules.features import get_huggingface_chat
 
             result = get_huggingface_chat(prompt)
-            return result, "HuggingChat Integration", False
+            return result, "HuggingChat Integration"
+
+        return None, None
+
+    async def _brain_stream(self, prompt, visual_context=None, complexity=None):
+        """
+        Streams the Neural Core answer for a prompt with recalled memory as
+        context, then records the exchange.
+        """
+        p_lower = prompt.lower()
 
         # 5. Urgency Check
         urgency = "STANDARD"
-        if "critical" in prompt.lower() or "fast" in prompt.lower():
+        if "critical" in p_lower or "fast" in p_lower:
             urgency = "CRITICAL"
 
         # 6. Brain Inference (Streaming)
@@ -147,10 +284,57 @@ class CognitiveRouter:
                 "\nFocus: Analyze code structure, complexity, and security."
             )
 
-        stream_gen = self.brain.generate_stream(
+        context = await self.memory.arecall(prompt)
+
+        answer = []
+        stream = self.brain.generate_stream(
             prompt,
             system_instruction=system_instruction,
             visual_context=visual_context,
             urgency=urgency,
+            complexity=complexity,
+            context=context,
         )
-        return stream_gen, "Neural Core", True
+        try:
+            async for chunk in stream:
+                answer.append(chunk)
+                yield chunk
+        finally:
+            # A discarded speculative stream must cancel the brain request now
+            await stream.aclose()
+
+        # Failure texts would come back as "memories" in later contexts
+        answer = "".join(answer)
+        if not self.brain.is_fallback(answer):
+            self.memory.store(prompt, role="user")
+            self.memory.store(answer, role="venom")
+
+    async def _timed(self, stream, started_at, mode):
+        """Passes a stream through, recording time-to-first-token since turn start."""
+        first = True
+        async for chunk in stream:
+            if first:
+                first = False
+                ttft_ms = (time.perf_counter() - started_at) * 1000
+                self.ttft_samples[mode].append(ttft_ms)
+            yield chunk
+
+    def get_metrics(self):
+        """Snapshot of routing, cache and streaming telemetry for the HUD."""
+        return {
+            "routing": smart_router.get_stats(),
+            "fast_response": fast_responder.get_stats(),
+            "route_cache": self.get_cache_stats(),
+            "streaming": self.get_stream_stats(),
+            "brain": self.brain.get_stats(),
+            "memory": self.memory.get_stats(),
+        }
+
+    def get_stream_stats(self):
+        """Speculation counters and mean time-to-first-token per mode."""
+        stats = dict(self.stream_stats)
+        for mode, samples in self.ttft_samples.items():
+            stats[f"ttft_ms_{mode}"] = (
+                round(sum(samples) / len(samples), 1) if samples else None
+            )
+        return stats
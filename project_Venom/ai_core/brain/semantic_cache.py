@@ -0,0 +1,139 @@
+import asyncio
+import re
+import time
+import zlib
+
+import numpy as np
+
+from ai_core.core.lexicon import HashingEmbedder, tokenize
+
+# Answers to these go stale within minutes, so they are never cached
+TIME_SENSITIVE_RE = re.compile(
+    r"\b(now|today|tonight|tomorrow|yesterday|current(ly)?|latest|recent(ly)?|"
+    r"time|date|weather|news|price|score|this (week|month|year))\b",
+    re.IGNORECASE,
+)
+
+_WORD_RE = re.compile(r"\S+\s*")
+
+
+class SemanticCache:
+    """
+    In-memory vector index of prior (prompt -> answer) pairs.
+    Entries are scoped by a hash of the system instruction; a lookup hits
+    when the best cosine similarity within that scope reaches `threshold`
+    and the content terms the two prompts share appear in the same order
+    (the embedding is order-blind: "usd to eur" vs "eur to usd").
+    Fixed-size slots with TTL expiry and least-recently-used eviction.
+    """
+
+    def __init__(
+        self,
+        threshold=0.92,
+        max_size=256,
+        ttl=3600,
+        replay_cps=600,
+        embedder=None,
+    ):
+        self.threshold = threshold
+        self.max_size = max_size
+        self.ttl = ttl
+        self.replay_cps = replay_cps
+        self.embedder = embedder or HashingEmbedder()
+
+        self.vectors = np.zeros((max_size, self.embedder.dim), dtype=np.float32)
+        self.scopes = np.zeros(max_size, dtype=np.int64)
+        self.expires = np.zeros(max_size)  # 0 = empty slot
+        self.last_used = np.zeros(max_size)
+        self.answers = [None] * max_size
+        self.term_orders = [()] * max_size
+        self.stats = {
+            "hits": 0,
+            "misses": 0,
+            "stores": 0,
+            "evictions": 0,
+            "skipped": 0,
+        }
+
+    @staticmethod
+    def cacheable(prompt):
+        return not TIME_SENSITIVE_RE.search(prompt)
+
+    @staticmethod
+    def _scope(system_instruction):
+        return zlib.crc32((system_instruction or "").encode())
+
+    def lookup(self, prompt, system_instruction=""):
+        """Returns the cached answer for a similar prompt, or None."""
+        if not self.cacheable(prompt):
+            self.stats["skipped"] += 1
+            return None
+
+        now = time.monotonic()
+        live = (self.expires > now) & (self.scopes == self._scope(system_instruction))
+        if not live.any():
+            self.stats["misses"] += 1
+            return None
+
+        sims = self.vectors @ self.embedder.embed(prompt)
+        sims[~live] = -1.0
+        terms = self._term_order(prompt)
+        for slot in np.argsort(-sims):
+            if sims[slot] < self.threshold:
+                break
+            if self._same_order(terms, self.term_orders[slot]):
+                self.last_used[slot] = now
+                self.stats["hits"] += 1
+                return self.answers[slot]
+
+        self.stats["misses"] += 1
+        return None
+
+    @staticmethod
+    def _term_order(prompt):
+        return tuple(dict.fromkeys(tokenize(prompt).content_terms()))
+
+    @staticmethod
+    def _same_order(a, b):
+        """True when the terms common to both sequences appear in the same order."""
+        shared = set(a).intersection(b)
+        return [t for t in a if t in shared] == [t for t in b if t in shared]
+
+    def store(self, prompt, system_instruction, answer):
+        if not answer or not self.cacheable(prompt):
+            return
+
+        now = time.monotonic()
+        free = np.flatnonzero(self.expires <= now)
+        if len(free):
+            slot = int(free[0])
+        else:
+            slot = int(np.argmin(self.last_used))
+            self.stats["evictions"] += 1
+
+        self.vectors[slot] = self.embedder.embed(prompt)
+        self.scopes[slot] = self._scope(system_instruction)
+        self.expires[slot] = now + self.ttl
+        self.last_used[slot] = now
+        self.answers[slot] = answer
+        self.term_orders[slot] = self._term_order(prompt)
+        self.stats["stores"] += 1
+
+    async def replay(self, answer, words_per_chunk=4):
+        """Streams a cached answer in word groups at `replay_cps` chars/sec."""
+        if not self.replay_cps:
+            yield answer
+            return
+
+        words = _WORD_RE.findall(answer)
+        for i in range(0, len(words), words_per_chunk):
+            chunk = "".join(words[i : i + words_per_chunk])
+            yield chunk
+            await asyncio.sleep(len(chunk) / self.replay_cps)
+
+    def get_stats(self):
+        stats = dict(self.stats)
+        stats["entries"] = int((self.expires > time.monotonic()).sum())
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = round(stats["hits"] / lookups, 3) if lookups else 0.0
+        return stats
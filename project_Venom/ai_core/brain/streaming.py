@@ -0,0 +1,205 @@
+import asyncio
+import json
+import re
+import time
+
+_EXHAUSTED = object()
+
+
+class PrefetchedStream:
+    """
+    Starts pulling the first chunk of an async generator immediately,
+    so the network round trip overlaps with whatever the caller does next.
+    Consume with `stream()` or discard with `aclose()`.
+    """
+
+    def __init__(self, agen):
+        self._agen = agen
+        self.started_at = time.perf_counter()
+        self.first_chunk_at = None
+        self._first = asyncio.create_task(self._pull_first())
+
+    async def _pull_first(self):
+        try:
+            chunk = await self._agen.__anext__()
+        except StopAsyncIteration:
+            return _EXHAUSTED
+        self.first_chunk_at = time.perf_counter()
+        return chunk
+
+    @property
+    def ready(self):
+        """True once the first chunk (or end of stream) has arrived."""
+        return self._first.done()
+
+    @property
+    def succeeded(self):
+        """True once a real first chunk arrived (not an error or empty stream)."""
+        if not self._first.done() or self._first.cancelled():
+            return False
+        if self._first.exception() is not None:
+            return False
+        return self._first.result() is not _EXHAUSTED
+
+    async def wait_first(self, timeout=None):
+        """Waits up to `timeout` for the first chunk. Returns True if it arrived."""
+        if self._first.done():
+            return True
+        done, _ = await asyncio.wait({self._first}, timeout=timeout)
+        return bool(done)
+
+    async def stream(self):
+        """Yields the prefetched chunk followed by the rest of the stream."""
+        first = await self._first
+        if first is _EXHAUSTED:
+            return
+        yield first
+        async for chunk in self._agen:
+            yield chunk
+
+    async def aclose(self):
+        """Cancels the in-flight request and finalizes the generator."""
+        if not self._first.done():
+            self._first.cancel()
+        try:
+            await self._first
+        except (asyncio.CancelledError, Exception):
+            pass
+        try:
+            await self._agen.aclose()
+        except Exception:
+            pass
+
+
+async def first_ready(streams, timeout=None):
+    """Waits until at least one of the streams has its first chunk (or failed)."""
+    pending = {s._first: s for s in streams}
+    done, _ = await asyncio.wait(
+        pending.keys(), timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+    )
+    return [pending[task] for task in done]
+
+
+def overlap_length(partial, text, window=200, min_overlap=8):
+    """Length of the longest tail of `partial` that `text` starts with."""
+    tail = partial[-window:]
+    for size in range(min(len(tail), len(text)), min_overlap - 1, -1):
+        if tail.endswith(text[:size]):
+            return size
+    return 0
+
+
+async def strip_overlap(stream, partial):
+    """
+    Passes a continuation stream through, dropping any repeat of the
+    already-emitted `partial` text from its first chunk.
+    """
+    pending = bool(partial)
+    async for text in stream:
+        if pending:
+            pending = False
+            text = text[overlap_length(partial, text) :]
+            if not text:
+                continue
+        yield text
+
+
+# Token frames carry only these two fields of interest; everything else in
+# the frame (model, created_at...) is skipped without building a dict.
+_RESPONSE_RE = re.compile(rb'"(?:response|content)":\s*"((?:[^"\\]|\\.)*)"')
+_DONE_RE = re.compile(rb'"done":\s*true')
+
+
+class NDJSONDecoder:
+    """
+    Incremental decoder for Ollama's newline-delimited JSON stream.
+    Bytes may arrive split anywhere; incomplete lines stay buffered until
+    their newline arrives. Token frames are scanned for the text field
+    directly; only the final `done` frame (which carries the KV context and
+    stats) and error frames are fully parsed.
+    """
+
+    def __init__(self):
+        self._buffer = bytearray()
+
+    def feed(self, data):
+        """Returns [(text, final_frame_or_None), ...] for every complete line."""
+        self._buffer += data
+        end = self._buffer.rfind(b"\n")
+        if end < 0:
+            return []
+        lines = bytes(self._buffer[:end]).split(b"\n")
+        del self._buffer[: end + 1]
+        return [frame for frame in map(self._decode, lines) if frame is not None]
+
+    def close(self):
+        """Decodes a trailing line that had no newline."""
+        line, self._buffer = bytes(self._buffer), bytearray()
+        frame = self._decode(line)
+        return [frame] if frame is not None else []
+
+    @staticmethod
+    def _decode(line):
+        line = line.strip()
+        if not line:
+            return None
+
+        if _DONE_RE.search(line) or line.startswith(b'{"error"'):
+            data = json.loads(line)
+            if "error" in data:
+                raise ConnectionError(f"Local Bio-Link error: {data['error']}")
+            message = data.get("message") or {}
+            return data.get("response", message.get("content", "")), data
+
+        match = _RESPONSE_RE.search(line)
+        if match is None:
+            return None
+        raw = match.group(1)
+        if b"\\" in raw:
+            return json.loads(b'"' + raw + b'"'), None
+        return raw.decode("utf-8"), None
+
+
+async def iter_ndjson(content, decoder=None):
+    """Yields (text, final_frame) from an aiohttp response body, ending at `done`."""
+    decoder = decoder or NDJSONDecoder()
+    async for data in content.iter_any():
+        for text, final in decoder.feed(data):
+            yield text, final
+            if final is not None:
+                return
+    for text, final in decoder.close():
+        yield text, final
+
+
+async def coalesce(stream, size=1024, interval=0.05):
+    """
+    Merges tiny text chunks: the first chunk passes straight through (TTFT is
+    untouched), later ones are buffered until `size` characters or
+    `interval` seconds since the last flush. size <= 1 disables merging.
+    """
+    if size <= 1:
+        async for text in stream:
+            yield text
+        return
+
+    buffer, buffered, first = [], 0, True
+    last_flush = time.perf_counter()
+    async for text in stream:
+        if not text:
+            continue
+        if first:
+            first = False
+            last_flush = time.perf_counter()
+            yield text
+            continue
+
+        buffer.append(text)
+        buffered += len(text)
+        now = time.perf_counter()
+        if buffered >= size or now - last_flush >= interval:
+            yield "".join(buffer)
+            buffer, buffered, last_flush = [], 0, now
+
+    if buffer:
+        yield "".join(buffer)
@@ -1,14 +1,49 @@
 import os
 import asyncio
+import hashlib
 import warnings
-import json
 import aiohttp
+from collections import OrderedDict
 
 warnings.filterwarnings("ignore")
 
 import google.generativeai as genai
 from ai_core.core.config import config
 from ai_core.core.logger import logger
+from ai_core.core.performance import http_pool
+from ai_core.core.circuit_breaker import backend_health
+from ai_core.core.rate_limiter import admission
+from ai_core.core.accelerator import smart_router
+from ai_core.core.context_budget import ContextBudgeter
+from ai_core.core.synapse import synapse
+from .streaming import (
+    PrefetchedStream,
+    coalesce,
+    first_ready,
+    iter_ndjson,
+    strip_overlap,
+)
+from .model_selector import ModelSelector
+from .semantic_cache import SemanticCache
+from .local_sessions import LocalSessions
+from .cassette import Cassette
+
+# Appended to the prompt when a backend takes over a half-finished answer
+RESUME_INSTRUCTION = (
+    "Your previous answer was cut off. Continue it exactly where it stops, "
+    "without repeating any of it:\n{partial}"
+)
+
+# Canned texts streamed in place of (or after) a model answer
+EMPTY_PROMPT_TEXT = "I cannot process empty thoughts."
+INTERRUPTED_TEXT = "\n(Neural link interrupted.)"
+UNREACHABLE_TEXT = "My mind is foggy. (Cloud & Local Brains Unreachable)."
+FALLBACK_TEXTS = (EMPTY_PROMPT_TEXT, INTERRUPTED_TEXT, UNREACHABLE_TEXT)
+
+SUMMARY_INSTRUCTION = (
+    "Summarize this conversation excerpt in at most three sentences. Keep "
+    "names, numbers, file names and decisions; reply with the summary only."
+)
 
 
 class VenomBrain:
@@ -32,92 +67,655 @@ class VenomBrain:
 
         # Models
         self.models = {"fast": [config.FAST_MODEL], "smart": [config.SMART_MODEL]}
+        self.local_models = [config.LOCAL_MODEL, *config.LOCAL_ALT_MODELS]
+        self.selector = ModelSelector()
+        self.local_sessions = LocalSessions(max_tokens=config.LOCAL_NUM_CTX)
+
+        # Prebuilt generation configs and a bounded cache of model handles
+        self.generation_configs = {
+            "default": genai.types.GenerationConfig(temperature=0.7)
+        }
+        self._model_cache = OrderedDict()
+        self.model_cache_size = config.MODEL_CACHE_SIZE
+
+        # Memory context is packed per backend under a token budget
+        self.context_budgeter = ContextBudgeter(config.CONTEXT_BUDGETS)
+
+        # Opt-in replay of answers to near-identical prompts
+        self.response_cache = None
+        if config.SEMANTIC_CACHE_ENABLED:
+            self.response_cache = SemanticCache(
+                threshold=config.SEMANTIC_CACHE_THRESHOLD,
+                max_size=config.SEMANTIC_CACHE_SIZE,
+                ttl=config.SEMANTIC_CACHE_TTL,
+                replay_cps=config.SEMANTIC_CACHE_REPLAY_CPS,
+            )
+
+        # Record/replay of brain streams for reproducible benchmarks
+        self.cassette = None
+        if config.BRAIN_CASSETTE_MODE in ("record", "replay"):
+            self.cassette = Cassette(
+                config.BRAIN_CASSETTE_PATH,
+                mode=config.BRAIN_CASSETTE_MODE,
+                speed=config.BRAIN_CASSETTE_SPEED,
+                reject=self.is_fallback,
+            )
+
+        # Hedged request telemetry
+        self.hedge_stats = {
+            "hedged": 0,
+            "primary_wins": 0,
+            "backup_wins": 0,
+            "resumed": 0,
+        }
+
+        # Health probes feed the per-backend circuit breakers
+        if self.client_active:
+            for model_name in {config.FAST_MODEL, config.SMART_MODEL}:
+                backend_health.register_probe(
+                    f"gemini:{model_name}", self._cloud_probe(model_name)
+                )
+        for model_name in self.local_models:
+            backend_health.register_probe(f"ollama:{model_name}", self._local_probe)
+        synapse.register_vitals_provider("backends", backend_health.snapshot)
+
+        # Non-streaming background work goes through the micro-batcher
+        batcher = smart_router.accelerator
+        batcher.register_batch_handler("ollama", self._ollama_batch)
+        if self.client_active:
+            batcher.register_batch_handler("gemini", self._gemini_batch)
+
+    def set_generation_config(self, name="default", **params):
+        """Rebuilds a named generation config and evicts handles built with it."""
+        self.generation_configs[name] = genai.types.GenerationConfig(**params)
+        for key in [k for k in self._model_cache if k[2] == name]:
+            del self._model_cache[key]
+
+    def _get_model(self, model_name, system_instruction="", config_name="default"):
+        """
+        Returns a cached GenerativeModel handle for
+        (model name, system instruction hash, generation config).
+        """
+        instruction_hash = hashlib.sha1(system_instruction.encode()).hexdigest()
+        key = (model_name, instruction_hash, config_name)
+
+        model = self._model_cache.get(key)
+        if model is not None:
+            self._model_cache.move_to_end(key)
+            return model
+
+        model = genai.GenerativeModel(
+            model_name,
+            system_instruction=system_instruction if system_instruction else None,
+            generation_config=self.generation_configs[config_name],
+        )
+        self._model_cache[key] = model
+        if len(self._model_cache) > self.model_cache_size:
+            self._model_cache.popitem(last=False)
+        return model
+
+    def _select_tier(self, urgency, complexity=None):
+        """
+        Model tier for a request. With a complexity estimate, simple work stays
+        on the fast model even when flagged CRITICAL; without one, urgency decides.
+        """
+        if complexity is None:
+            return "smart" if urgency == "CRITICAL" else "fast"
+        if complexity in ("COMPLEX", "MODERATE"):
+            return "smart"
+        if urgency == "CRITICAL" and complexity != "SIMPLE":
+            return "smart"
+        return "fast"
+
+    def _plan_backends(self, urgency, complexity=None):
+        """
+        Candidate models for a request: (cloud models, local models, cloud_first).
+        With AUTO_MODEL_SELECTION and a complexity estimate, candidates are
+        ordered by the selector's observed latency/error stats and the
+        fastest healthy backend kind goes first.
+        """
+        tier = self._select_tier(urgency, complexity)
+        cloud = list(self.models[tier]) if self.client_active else []
+        local = list(self.local_models)
+
+        if not (config.AUTO_MODEL_SELECTION and complexity):
+            return cloud, local, True
+
+        preferred = ()
+        if tier == "smart":
+            # Degrade to the fast tier rather than straight to local
+            cloud += [m for m in self.models["fast"] if m not in cloud]
+            preferred = [f"gemini:{m}" for m in self.models["smart"]]
+
+        ordered = self.selector.order(
+            [f"gemini:{m}" for m in cloud] + [f"ollama:{m}" for m in local],
+            complexity,
+            preferred,
+        )
+        cloud = [b.split(":", 1)[1] for b in ordered if b.startswith("gemini:")]
+        local = [b.split(":", 1)[1] for b in ordered if b.startswith("ollama:")]
+        return cloud, local, ordered[0].startswith("gemini:")
 
     async def generate_stream(
-        self, prompt, system_instruction="", visual_context=None, urgency="STANDARD"
+        self,
+        prompt,
+        system_instruction="",
+        visual_context=None,
+        urgency="STANDARD",
+        complexity=None,
+        context=None,
+        session_id="default",
     ):
         """
         Robust streaming Generator.
+        `context` is a list of memory items (see VenomMemory.recall); each
+        backend kind receives the most relevant ones that fit its budget.
+        Local models keep their KV context per `session_id` across turns.
+        The preferred backend kind (cloud unless the selector finds local
+        faster) goes first; with hedging enabled the other kind is raced in
+        when no first token arrives within HEDGE_DELAY (immediately for
+        CRITICAL requests). The first backend to yield wins.
+        With a cassette (BRAIN_CASSETTE_MODE), streams are recorded to or
+        replayed from disk instead.
         """
-        # 1. Cloud Attempt
-        if self.client_active:
-            candidates = (
-                self.models["smart"] if urgency == "CRITICAL" else self.models["fast"]
+        cassette = self.cassette
+        if cassette and cassette.mode == "replay":
+            recording = cassette.lookup(prompt, system_instruction, visual_context)
+            if recording is not None:
+                async for text in cassette.replay(recording):
+                    yield text
+                return
+
+        trace = {}
+        stream = self._generate_live(
+            prompt,
+            system_instruction,
+            visual_context,
+            urgency,
+            complexity,
+            context,
+            session_id,
+            trace,
+        )
+        if cassette and cassette.mode == "record":
+            stream = cassette.record(
+                stream, prompt, system_instruction, visual_context, trace
+            )
+        async for text in stream:
+            yield text
+
+    async def _generate_live(
+        self,
+        prompt,
+        system_instruction="",
+        visual_context=None,
+        urgency="STANDARD",
+        complexity=None,
+        context=None,
+        session_id="default",
+        trace=None,
+    ):
+        """Live backends path of generate_stream; fills trace["model"]."""
+        # Fix: Ensure non-empty
+        if not prompt or not prompt.strip():
+            yield EMPTY_PROMPT_TEXT
+            return
+
+        # Answers grounded in memory depend on more than the prompt
+        use_cache = (
+            self.response_cache is not None and not visual_context and not context
+        )
+        if use_cache:
+            cached = self.response_cache.lookup(prompt, system_instruction)
+            if cached is not None:
+                async for text in self.response_cache.replay(cached):
+                    yield text
+                return
+
+        backend_health.ensure_started()
+
+        # Construct Prompt Safely
+        full_contents = []
+        if visual_context:
+            full_contents.append(f"CONTEXT: {visual_context}")
+        local_prompt = warm_prompt = prompt
+        if context:
+            # Scored once, packed per backend budget
+            ranked = self.context_budgeter.rank(prompt, context)
+            cloud_memory = self.context_budgeter.render(
+                prompt, ranked, "gemini", ranked=True
+            )
+            if cloud_memory:
+                full_contents.insert(0, f"MEMORY:\n{cloud_memory}")
+            local_prompt = self._local_prompt(prompt, ranked)
+            # For a model whose KV context already holds the earlier turns
+            recalled = [m for m in ranked if m["role"] == "system_recall"]
+            warm_prompt = self._local_prompt(prompt, recalled)
+        full_contents.append(prompt)
+
+        cloud, local, cloud_first = self._plan_backends(urgency, complexity)
+
+        cloud_trace, local_trace = {}, {}
+
+        def cloud_stream(resume=""):
+            return self._cloud_stream(
+                cloud,
+                full_contents,
+                system_instruction,
+                resume,
+                urgency,
+                trace=cloud_trace,
+            )
+
+        def local_stream(resume=""):
+            return self._local_stream(
+                local_prompt,
+                system_instruction,
+                local,
+                resume,
+                urgency,
+                session_id=None if resume else session_id,
+                trace=local_trace,
+                warm_prompt=warm_prompt,
             )
 
-            # Construct Prompt Safely
-            full_contents = []
-            if visual_context:
-                full_contents.append(f"CONTEXT: {visual_context}")
+        if not cloud:
+            order = [local_stream]
+        elif cloud_first:
+            order = [cloud_stream, local_stream]
+        else:
+            order = [local_stream, cloud_stream]
 
-            full_contents.append(prompt)
+        hedge_delay = None
+        if config.ENABLE_HEDGING:
+            hedge_delay = 0 if urgency == "CRITICAL" else config.HEDGE_DELAY
 
-            # Fix: Ensure non-empty
-            if not prompt or not prompt.strip():
-                yield "I cannot process empty thoughts."
+        backup = order[1] if len(order) > 1 else None
+        winner, winner_index = await self._race(order[0](), backup, hedge_delay)
+        if winner is not None:
+            emitted = []
+            winner_trace = (
+                local_trace if order[winner_index] is local_stream else cloud_trace
+            )
+            try:
+                async for text in winner.stream():
+                    emitted.append(text)
+                    yield text
+                if trace is not None:
+                    trace["model"] = winner_trace.get("backend")
+                if order[winner_index] is not local_stream:
+                    self.local_sessions.invalidate(session_id)
+                if use_cache:
+                    self.response_cache.store(
+                        prompt, system_instruction, "".join(emitted)
+                    )
                 return
+            except Exception as e:
+                logger.warning(f"Neural stream interrupted: {e}")
+            finally:
+                # Also runs when the consumer closes or is cancelled mid-stream
+                await winner.aclose()
 
-            for model_name in candidates:
+            # Mid-stream failover: the other backend kind continues the
+            # answer from what the user has already seen.
+            self.local_sessions.invalidate(session_id)
+            for fallback in order[:winner_index] + order[winner_index + 1 :]:
                 try:
-                    model = genai.GenerativeModel(
-                        model_name,
-                        system_instruction=(
-                            system_instruction if system_instruction else None
-                        ),
-                    )
+                    async for text in fallback(resume="".join(emitted)):
+                        emitted.append(text)
+                        yield text
+                    self.hedge_stats["resumed"] += 1
+                    if trace is not None:
+                        fallback_trace = (
+                            local_trace if fallback is local_stream else cloud_trace
+                        )
+                        trace["model"] = (
+                            f"{winner_trace.get('backend')} -> "
+                            f"{fallback_trace.get('backend')}"
+                        )
+                    return
+                except Exception as e:
+                    logger.warning(f"Neural stream resume failed: {e}")
 
-                    # Ensure contents is a list, expected by V1
-                    response_stream = await model.generate_content_async(
-                        contents=full_contents,
-                        generation_config=genai.types.GenerationConfig(temperature=0.7),
-                        stream=True,
-                    )
+            yield INTERRUPTED_TEXT
+            return
 
-                    async for chunk in response_stream:
-                        if chunk.text:
-                            yield chunk.text
-                    return  # Success
+        yield UNREACHABLE_TEXT
+        yield "\nPlease ensure 'GEMINI_API_KEY' is valid or Ollama is running."
 
-                except Exception as e:
-                    logger.warning(f"Cloud Synapse {model_name} failed: {e}")
-                    continue
+    @staticmethod
+    def is_fallback(answer):
+        """True when a streamed answer is (or ends in) a canned failure text."""
+        return not answer.strip() or any(text in answer for text in FALLBACK_TEXTS)
+
+    async def _race(self, primary, backup_factory=None, hedge_delay=None):
+        """
+        Runs `primary`; starts `backup_factory()` if primary fails or has no
+        first chunk within `hedge_delay` seconds (None = only on failure).
+        Returns (winning PrefetchedStream, its index) with losers cancelled,
+        or (None, None) if every contender failed.
+        """
+        contenders = [PrefetchedStream(primary)]
+        try:
+            await contenders[0].wait_first(hedge_delay)
+
+            while True:
+                if backup_factory and not any(s.succeeded for s in contenders):
+                    if not contenders[0].ready:
+                        self.hedge_stats["hedged"] += 1
+                        logger.info("Primary synapse slow. Racing backup link...")
+                    contenders.append(PrefetchedStream(backup_factory()))
+                    backup_factory = None
 
-        # 2. Local Fallback (Ollama)
-        # Yield a small indicator so user knows we switched
-        # yield "[Switched to Local Bio-Link] "
+                winner = next((s for s in contenders if s.succeeded), None)
+                if winner is not None:
+                    for loser in contenders:
+                        if loser is not winner:
+                            await loser.aclose()
+                    self.hedge_stats[
+                        "primary_wins" if winner is contenders[0] else "backup_wins"
+                    ] += 1
+                    return winner, contenders.index(winner)
 
+                pending = [s for s in contenders if not s.ready]
+                if not pending:
+                    return None, None
+                await first_ready(pending)
+        except BaseException:
+            # Cancelled mid-race (speculative discard, client disconnect):
+            # no contender may keep its request running.
+            for contender in contenders:
+                await contender.aclose()
+            raise
+
+    async def _admit(self, backend, urgency):
+        """
+        Circuit breaker check, then rate-limit admission. A half-open trial
+        claimed by the breaker is handed back if admission rejects the call
+        or the wait is cancelled. Returns the breaker, or None to skip.
+        """
+        breaker = backend_health.breaker(backend)
+        if not breaker.allow():
+            return None
         try:
-            local_url = "http://localhost:11434/api/generate"
-            payload = {
-                "model": "phi3",  # Try phi3 first
-                "prompt": f"System: {system_instruction}\nUser: {prompt}",
-                "stream": True,
+            admitted = await admission.acquire(backend, urgency)
+        except BaseException:
+            breaker.release_trial()
+            raise
+        if not admitted:
+            breaker.release_trial()
+            logger.warning(f"Rate limit: {backend} busy, skipping")
+            return None
+        return breaker
+
+    async def _cloud_stream(
+        self,
+        candidates,
+        contents,
+        system_instruction="",
+        resume="",
+        urgency="STANDARD",
+        trace=None,
+    ):
+        """
+        Streams from the first cloud model that answers; raises if none does.
+        A model failing mid-answer hands over to the next one, which continues
+        from the text emitted so far (`resume` seeds that text).
+        """
+        emitted = [resume] if resume else []
+        for model_name in candidates:
+            backend = f"gemini:{model_name}"
+            breaker = await self._admit(backend, urgency)
+            if breaker is None:
+                continue
+
+            if trace is not None:
+                trace["backend"] = backend
+
+            try:
+                partial = "".join(emitted)
+                request = contents
+                if partial:
+                    request = contents + [RESUME_INSTRUCTION.format(partial=partial)]
+
+                stream = self._gemini_stream(model_name, request, system_instruction)
+                stream = strip_overlap(self.selector.timed(backend, stream), partial)
+                async for text in stream:
+                    emitted.append(text)
+                    yield text
+                breaker.record_success()
+                return  # Success
+
+            except Exception as e:
+                breaker.record_failure()
+                logger.warning(f"Cloud Synapse {model_name} failed: {e}")
+                continue
+
+        raise ConnectionError("All cloud candidates failed")
+
+    async def _gemini_stream(self, model_name, contents, system_instruction=""):
+        model = self._get_model(model_name, system_instruction)
+
+        # Ensure contents is a list, expected by V1
+        response_stream = await model.generate_content_async(
+            contents=contents,
+            stream=True,
+        )
+
+        async for chunk in response_stream:
+            if chunk.text:
+                yield chunk.text
+
+    def _local_prompt(self, prompt, ranked):
+        local_memory = self.context_budgeter.render(
+            prompt, ranked, "ollama", ranked=True
+        )
+        return f"Context:\n{local_memory}\n\n{prompt}" if local_memory else prompt
+
+    async def _local_stream(
+        self,
+        prompt,
+        system_instruction="",
+        candidates=None,
+        resume="",
+        urgency="STANDARD",
+        session_id=None,
+        trace=None,
+        warm_prompt=None,
+    ):
+        """
+        Streams from the first local Ollama model that answers; raises if none
+        does. Mid-answer failures resume on the next model like _cloud_stream
+        (continuations run outside the KV session). A model with a warm KV
+        session for `session_id` gets `warm_prompt` (no working memory).
+        """
+        emitted = [resume] if resume else []
+        for model_name in candidates or self.local_models:
+            backend = f"ollama:{model_name}"
+            breaker = await self._admit(backend, urgency)
+            if breaker is None:
+                continue
+
+            if trace is not None:
+                trace["backend"] = backend
+
+            try:
+                partial = "".join(emitted)
+                request = prompt
+                if partial:
+                    request = f"{prompt}\n{RESUME_INSTRUCTION.format(partial=partial)}"
+                elif warm_prompt and session_id:
+                    if self.local_sessions.is_warm(
+                        session_id, model_name, system_instruction
+                    ):
+                        request = warm_prompt
+
+                stream = self._ollama_stream(
+                    model_name,
+                    request,
+                    system_instruction,
+                    session_id=None if partial else session_id,
+                )
+                stream = coalesce(
+                    stream, config.STREAM_CHUNK_SIZE, config.STREAM_FLUSH_INTERVAL
+                )
+                stream = strip_overlap(self.selector.timed(backend, stream), partial)
+                async for text in stream:
+                    emitted.append(text)
+                    yield text
+                breaker.record_success()
+                return
+
+            except Exception as e:
+                breaker.record_failure()
+                logger.warning(f"Local Bio-Link {model_name} failed: {e}")
+                continue
+
+        raise ConnectionError("Local Bio-Link unreachable")
+
+    async def _ollama_stream(
+        self, model_name, prompt, system_instruction="", session_id=None
+    ):
+        local_url = f"{config.OLLAMA_URL}/api/generate"
+        payload = {
+            "model": model_name,
+            "prompt": f"System: {system_instruction}\nUser: {prompt}",
+            "stream": True,
+            "keep_alive": config.OLLAMA_KEEP_ALIVE,
+            "options": {"num_ctx": config.LOCAL_NUM_CTX},
+        }
+
+        # Warm session: send only the new turn plus the server's KV context
+        kv_context = None
+        if session_id:
+            kv_context = self.local_sessions.context_for(
+                session_id, model_name, system_instruction
+            )
+        if kv_context:
+            payload["prompt"] = f"User: {prompt}"
+            payload["context"] = kv_context
+
+        session = await http_pool.acquire()
+        async with session.post(local_url, json=payload) as resp:
+            if resp.status != 200:
+                raise ConnectionError(f"Local Bio-Link returned {resp.status}")
+
+            async for text, final in iter_ndjson(resp.content):
+                if text:
+                    yield text
+                if final is not None and session_id and final.get("context"):
+                    self.local_sessions.update(
+                        session_id, model_name, system_instruction, final["context"]
+                    )
+
+    def _cloud_probe(self, model_name):
+        """Health probe: model metadata lookup (no generation quota)."""
+
+        async def probe():
+            await asyncio.to_thread(
+                genai.get_model,
+                f"models/{model_name}",
+                request_options={"timeout": 5, "retry": None},
+            )
+            return True
+
+        return probe
+
+    async def _local_probe(self):
+        """Health probe: Ollama's model listing endpoint."""
+        session = await http_pool.acquire()
+        async with session.get(
+            f"{config.OLLAMA_URL}/api/tags", timeout=aiohttp.ClientTimeout(total=2)
+        ) as resp:
+            return resp.status == 200
+
+    def get_stats(self):
+        """Hedging counters, circuit states, admission queues and latency stats."""
+        return {
+            **self.hedge_stats,
+            "backends": backend_health.snapshot(),
+            "admission": admission.snapshot(),
+            "batching": smart_router.accelerator.get_batch_stats(),
+            "response_cache": (
+                self.response_cache.get_stats() if self.response_cache else None
+            ),
+            "context": self.context_budgeter.get_stats(),
+            "local_sessions": self.local_sessions.get_stats(),
+            "cassette": self.cassette.get_stats() if self.cassette else None,
+            "selector": self.selector.snapshot(),
+        }
+
+    async def generate_batched(self, prompt, system_instruction="", backend="ollama"):
+        """
+        Non-streaming completion for background jobs (summaries, keyword
+        extraction...). Concurrent calls are micro-batched per backend.
+        """
+        return await smart_router.accelerator.add_to_batch(
+            {
+                "backend": backend,
+                "prompt": prompt,
+                "system_instruction": system_instruction,
             }
+        )
 
-            async with aiohttp.ClientSession() as session:
-                async with session.post(local_url, json=payload) as resp:
-                    if resp.status == 200:
-                        async for line in resp.content:
-                            if line:
-                                try:
-                                    data = json.loads(line)
-                                    if "response" in data:
-                                        yield data["response"]
-                                    if data.get("done"):
-                                        break
-                                except:
-                                    pass
-                        return
-                    else:
-                        # Try llama3 if phi3 fails? Or just fail.
-                        pass
-
-        except Exception as e:
-            # logger.error(f"Local Link Failed: {e}")
-            pass
-
-        yield "My mind is foggy. (Cloud & Local Brains Unreachable)."
-        yield "\nPlease ensure 'GEMINI_API_KEY' is valid or Ollama is running."
+    async def summarize(self, texts, backend="ollama"):
+        """Short summary of conversation snippets (memory consolidation)."""
+        summary = await self.generate_batched(
+            "\n".join(texts), system_instruction=SUMMARY_INSTRUCTION, backend=backend
+        )
+        return summary.strip()
+
+    async def _ollama_batch(self, queries):
+        return await self._run_batch(
+            [f"ollama:{m}" for m in self.local_models], queries
+        )
+
+    async def _gemini_batch(self, queries):
+        return await self._run_batch(
+            [f"gemini:{config.FAST_MODEL}", f"gemini:{config.SMART_MODEL}"], queries
+        )
+
+    async def _run_batch(self, candidates, queries):
+        """
+        Batch handler: sends every queued prompt to the best-ranked backend
+        at once; the requests share the pooled connections. A query its
+        backend cannot serve moves on to the next candidate.
+        """
+        ordered = self.selector.order(candidates)
+        return await asyncio.gather(
+            *(self._complete(ordered, query) for query in queries),
+            return_exceptions=True,
+        )
+
+    async def _complete(self, candidates, query):
+        """
+        One non-streaming completion on the first candidate that answers,
+        with the same breaker and admission checks as the streaming paths.
+        """
+        prompt = query["prompt"]
+        system_instruction = query.get("system_instruction", "")
+        error = ConnectionError("No backend available for batched completion")
+        for backend in candidates:
+            breaker = await self._admit(backend, query.get("urgency", "STANDARD"))
+            if breaker is None:
+                continue
+
+            kind, model_name = backend.split(":", 1)
+            if kind == "gemini":
+                stream = self._gemini_stream(model_name, [prompt], system_instruction)
+            else:
+                stream = self._ollama_stream(model_name, prompt, system_instruction)
+
+            try:
+                text = "".join([t async for t in self.selector.timed(backend, stream)])
+            except Exception as e:
+                breaker.record_failure()
+                logger.warning(f"Batched completion on {backend} failed: {e}")
+                error = e
+                continue
+            breaker.record_success()
+            return text
+        raise error
 
     async def generate_response(self, prompt, **kwargs):
         """Non-streaming wrapper"""
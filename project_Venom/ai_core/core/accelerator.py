@@ -6,12 +6,23 @@ Pre-computation, batch processing, and intelligent query optimization.
 
 import asyncio
 import re
-from typing import List, Dict, Any, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple, Union
 from collections import defaultdict
 import numpy as np
 
+from .config import config
+from .lexicon import STOPWORDS, IDFTable, QueryTokens, idf_table, tokenize
 from .logger import logger
-from .performance import cache_result, measure_performance
+
+_REPEATED_PUNCT_RE = re.compile(r'([?.!])\1+')
+_CODE_RE = re.compile(r'```|`|def |class |import ')
+_MATH_RE = re.compile(r'calculate|solve|integrate|derivative')
+_VISION_RE = re.compile(r'image|picture|see|look|camera|scan')
+
+# Fast-response intents must be the whole utterance, give or take a
+# greeting/politeness prefix and trailing politeness words
+_LEAD = r"^\W*(?:(?:hey|hi|hello|ok|okay|so|venom|please|(?:can|could) you)\W+)*"
+_TAIL = r"(?:\W+(?:please|now|venom|thanks|thank you))*\W*$"
 
 
 class ResponseAccelerator:
@@ -21,9 +32,15 @@ class ResponseAccelerator:
 
     def __init__(self):
         self.common_patterns: Dict[str, Any] = {}
-        self.batch_queue: List[Dict] = []
-        self.batch_size = 5
-        self.batch_timeout = 2.0  # seconds
+
+        # Micro-batching: pending (query, future) pairs per backend
+        self.batch_queue: Dict[str, List[Tuple[Dict[str, Any], asyncio.Future]]] = defaultdict(list)
+        self.batch_handlers: Dict[str, Callable[[List[Dict[str, Any]]], Awaitable[List[Any]]]] = {}
+        self.batch_size = config.BATCH_SIZE
+        self.batch_timeout = config.BATCH_TIMEOUT  # seconds
+        self.batch_stats = defaultdict(int)
+        self._batch_timers: Dict[str, asyncio.TimerHandle] = {}
+        self._flush_tasks: Set[asyncio.Task] = set()
         self._init_common_patterns()
 
         logger.success("Response Accelerator initialized")
@@ -31,22 +48,18 @@ class ResponseAccelerator:
     def _init_common_patterns(self):
         """Initialize common query patterns for quick responses."""
         self.common_patterns = {
-            # Greetings
-            r'\b(hello|hi|hey|greetings)\b': {
-                'type': 'greeting',
-                'responses': [
-                    "Hello! How can I assist you?",
-                    "Hey there! What can I do for you?",
-                    "Greetings! Ready to help."
-                ]
-            },
-
             # Time queries
-            r'\b(what|tell me|show).*(time|clock)\b': {
+            _LEAD + r"(what(?:'s| is)? the (?:current )?time|what time is it|(?:the )?current time|(?:tell|show) (?:me )?the (?:time|clock))" + _TAIL: {
                 'type': 'time_query',
                 'fast_response': True
             },
 
+            # Date queries
+            _LEAD + r"(what(?:'s| is)? (?:the |today'?s )?date(?: today)?|what day is (?:it|today)|today'?s date)" + _TAIL: {
+                'type': 'date_query',
+                'fast_response': True
+            },
+
             # Math operations
             r'\b(calculate|compute|solve|add|subtract|multiply|divide)\b': {
                 'type': 'math',
@@ -54,7 +67,7 @@ class ResponseAccelerator:
             },
 
             # System status
-            r'\b(status|health|how are you|system check)\b': {
+            _LEAD + r"((?:system )?(?:status|health)(?: (?:report|check))?|system check|how are you(?: doing)?(?: today)?)" + _TAIL: {
                 'type': 'status',
                 'fast_response': True
             },
@@ -63,6 +76,18 @@ class ResponseAccelerator:
             r'\b(play|stop|pause|skip|youtube|music|video)\b': {
                 'type': 'media',
                 'route_to': 'media_controller'
+            },
+
+            # Greetings: only a bare greeting, checked last so "hey open
+            # chrome" or "hi, what time is it" reach their real intent
+            r'^\W*(hello|hi|hey|greetings)\W*$': {
+                'type': 'greeting',
+                'fast_response': True,
+                'responses': [
+                    "Hello! How can I assist you?",
+                    "Hey there! What can I do for you?",
+                    "Greetings! Ready to help."
+                ]
             }
         }
 
@@ -74,92 +99,161 @@ class ResponseAccelerator:
 
         for pattern, config in self.common_patterns.items():
             if re.search(pattern, query_lower):
-                logger.print(f"⚡ Pattern matched: {config['type']}", style="success")
                 return config
 
         return None
 
-    @cache_result(ttl=120)
-    async def get_cached_response(self, query: str) -> Optional[str]:
+    def register_batch_handler(
+        self, backend: str, handler: Callable[[List[Dict[str, Any]]], Awaitable[List[Any]]]
+    ):
         """
-        Check if we have a cached response for this query.
+        Registers the coroutine that executes a batch for `backend`.
+        It receives the queued queries and returns one result per query
+        (an Exception instance fails only that caller).
         """
-        # This will automatically use the performance cache
-        return None
+        self.batch_handlers[backend] = handler
 
-    async def add_to_batch(self, query: Dict[str, Any]):
+    async def add_to_batch(self, query: Dict[str, Any]) -> Any:
         """
-        Add query to batch for bulk processing.
+        Add a non-streaming query to its backend's batch and wait for its result.
+        A batch flushes when it reaches `batch_size` or `batch_timeout` after
+        its first query arrived, whichever comes first. Flushes run in their
+        own task, so cancelling one caller never fails the rest of its batch.
         """
-        self.batch_queue.append(query)
-
-        if len(self.batch_queue) >= self.batch_size:
-            await self.process_batch()
-
-    async def process_batch(self):
+        backend = query.get('backend', 'default')
+        if backend not in self.batch_handlers:
+            raise KeyError(f"No batch handler registered for '{backend}'")
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        pending = self.batch_queue[backend]
+        pending.append((query, future))
+
+        if not config.BATCH_PROCESSING or len(pending) >= self.batch_size:
+            self._start_flush(backend)
+        elif backend not in self._batch_timers:
+            self._batch_timers[backend] = loop.call_later(
+                self.batch_timeout, self._start_flush, backend
+            )
+
+        return await asyncio.shield(future)
+
+    def _start_flush(self, backend: str) -> asyncio.Task:
+        """Runs process_batch in a task referenced until it finishes."""
+        task = asyncio.ensure_future(self.process_batch(backend))
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_tasks.discard)
+        return task
+
+    async def process_batch(self, backend: Optional[str] = None):
         """
-        Process multiple queries in batch for efficiency.
+        Flush the pending batch of one backend (or of all backends) through
+        its handler and resolve each caller's future.
         """
-        if not self.batch_queue:
+        if backend is None:
+            await asyncio.gather(*(self.process_batch(name) for name in list(self.batch_queue)))
             return
 
-        logger.print(f"🔄 Processing batch of {len(self.batch_queue)} queries", style="brain")
+        timer = self._batch_timers.pop(backend, None)
+        if timer:
+            timer.cancel()
 
-        # TODO: Implement actual batch processing logic
-        # This could send multiple queries to the LLM at once
+        batch = self.batch_queue.pop(backend, [])
+        batch = [(query, future) for query, future in batch if not future.done()]
+        if not batch:
+            return
 
-        self.batch_queue.clear()
+        logger.print(f"🔄 Processing batch of {len(batch)} {backend} queries", style="brain")
+        self.batch_stats['batches'] += 1
+        self.batch_stats['queries'] += len(batch)
+
+        try:
+            try:
+                results = list(await self.batch_handlers[backend]([query for query, _ in batch]))
+            except Exception as e:
+                results = [e] * len(batch)
+
+            for (_, future), result in zip(batch, results):
+                if future.done():
+                    continue
+                if isinstance(result, BaseException):
+                    self.batch_stats['failed'] += 1
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
+        finally:
+            # Short result lists or a cancelled flush must not leave callers hanging
+            unresolved = [future for _, future in batch if not future.done()]
+            if unresolved:
+                error = RuntimeError(
+                    f"Batch handler for '{backend}' left {len(unresolved)} of {len(batch)} queries unanswered"
+                )
+                self.batch_stats['failed'] += len(unresolved)
+                for future in unresolved:
+                    future.set_exception(error)
+
+    def get_batch_stats(self) -> Dict[str, Any]:
+        """Batches flushed, queries served and mean batch size."""
+        stats = dict(self.batch_stats)
+        if stats.get('batches'):
+            stats['avg_batch_size'] = round(stats['queries'] / stats['batches'], 2)
+        stats['pending'] = sum(len(pending) for pending in self.batch_queue.values())
+        return stats
 
 
 class QueryOptimizer:
     """
     Optimizes queries before sending to brain.
     Reduces token usage and improves response quality.
+    All analysis methods accept either raw text or a shared QueryTokens.
     """
 
-    def __init__(self):
-        self.stopwords = {
-            'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
-            'of', 'with', 'by', 'from', 'up', 'about', 'into', 'through', 'during'
-        }
+    def __init__(self, idf: IDFTable = idf_table):
+        self.stopwords = STOPWORDS
+        self.idf = idf
         logger.success("Query Optimizer initialized")
 
-    def optimize_query(self, query: str, preserve_meaning: bool = True) -> str:
+    @staticmethod
+    def tokens(query: Union[str, QueryTokens]) -> QueryTokens:
+        """Coerce text to the shared token object."""
+        return query if isinstance(query, QueryTokens) else tokenize(query)
+
+    def optimize_query(self, query: Union[str, QueryTokens], preserve_meaning: bool = True) -> str:
         """
         Optimize query for better performance.
         """
+        tokens = self.tokens(query)
+
         # Remove unnecessary whitespace
-        optimized = ' '.join(query.split())
+        optimized = tokens.normalized
 
         if not preserve_meaning:
             # Aggressive optimization - remove stopwords
-            words = optimized.lower().split()
-            optimized = ' '.join([w for w in words if w not in self.stopwords])
+            optimized = ' '.join([w for w in tokens.lower.split() if w not in self.stopwords])
 
         # Remove repeated punctuation
-        optimized = re.sub(r'([?.!])\1+', r'\1', optimized)
+        optimized = _REPEATED_PUNCT_RE.sub(r'\1', optimized)
 
         return optimized
 
-    def extract_keywords(self, query: str, top_k: int = 5) -> List[str]:
+    def extract_keywords(self, query: Union[str, QueryTokens], top_k: int = 5) -> List[str]:
         """
-        Extract key terms from query for better context.
+        Extract key terms from query, ranked by TF-IDF against the memory corpus.
         """
-        # Simple keyword extraction (can be improved with TF-IDF)
-        words = query.lower().split()
-        keywords = [w for w in words if w not in self.stopwords and len(w) > 3]
-        return keywords[:top_k]
+        tokens = self.tokens(query)
+        return self.idf.rank(tokens.content_terms(min_len=4), top_k=top_k)
 
-    def estimate_complexity(self, query: str) -> str:
+    def estimate_complexity(self, query: Union[str, QueryTokens]) -> str:
         """
         Estimate query complexity to route to appropriate model.
         """
-        word_count = len(query.split())
+        tokens = self.tokens(query)
+        word_count = tokens.word_count
 
         # Check for complex patterns
-        has_code = bool(re.search(r'```|`|def |class |import ', query))
-        has_math = bool(re.search(r'calculate|solve|integrate|derivative', query.lower()))
-        has_vision = bool(re.search(r'image|picture|see|look|camera|scan', query.lower()))
+        has_code = bool(_CODE_RE.search(tokens.raw))
+        has_math = bool(_MATH_RE.search(tokens.lower))
+        has_vision = bool(_VISION_RE.search(tokens.lower))
 
         if has_code or word_count > 100:
             return "COMPLEX"
@@ -183,37 +277,31 @@ class SmartRouter:
 
         logger.success("Smart Router initialized")
 
-    @measure_performance
     async def route_query(self, query: str) -> Dict[str, Any]:
         """
         Analyze and route query to optimal handler.
         """
-        # 1. Quick pattern matching
+        tokens = self.optimizer.tokens(query)
+        complexity = self.optimizer.estimate_complexity(tokens)
+
+        # 1. Quick pattern matching (only patterns that name a handler)
         pattern_match = self.accelerator.quick_match(query)
-        if pattern_match:
+        if pattern_match and (
+            pattern_match.get('fast_response') or pattern_match.get('route_to')
+        ):
             self.routing_stats['pattern_matched'] += 1
             return {
                 'route': pattern_match.get('route_to', 'fast_response'),
                 'type': pattern_match['type'],
+                'complexity': complexity,
                 'optimization': 'pattern_match'
             }
 
-        # 2. Check cache
-        cached = await self.accelerator.get_cached_response(query)
-        if cached:
-            self.routing_stats['cache_hit'] += 1
-            return {
-                'route': 'cache',
-                'response': cached,
-                'optimization': 'cached'
-            }
-
-        # 3. Optimize query
-        optimized_query = self.optimizer.optimize_query(query)
-        complexity = self.optimizer.estimate_complexity(query)
-        keywords = self.optimizer.extract_keywords(query)
+        # 2. Optimize query
+        optimized_query = self.optimizer.optimize_query(tokens)
+        keywords = self.optimizer.extract_keywords(tokens)
 
-        # 4. Determine best route
+        # 3. Determine best route
         if complexity == "SIMPLE":
             route = "gemini-flash"
         elif complexity == "SPECIALIZED":
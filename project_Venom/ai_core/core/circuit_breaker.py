@@ -0,0 +1,188 @@
+"""
+VENOM CIRCUIT BREAKERS
+======================
+Per-backend failure tracking so known-bad model backends are skipped
+instantly instead of being retried on every turn.
+"""
+
+import asyncio
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from .config import config
+from .event_bus import bus
+from .logger import logger
+
+
+class CircuitBreaker:
+    """
+    Closed -> Open when the failure rate over a sliding window crosses the
+    threshold. Open -> Half-Open after the cooldown (or a passing health
+    probe), which lets one trial call through. The trial's outcome closes
+    or re-opens the circuit.
+    """
+
+    CLOSED = "CLOSED"
+    OPEN = "OPEN"
+    HALF_OPEN = "HALF_OPEN"
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: float = 0.5,
+        window: float = 60.0,
+        min_calls: int = 3,
+        cooldown: float = 30.0
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.window = window
+        self.min_calls = min_calls
+        self.cooldown = cooldown
+
+        self.state = self.CLOSED
+        self.opened_at = 0.0
+        self._trial_started: Optional[float] = None
+        self._events: deque = deque()  # (timestamp, succeeded)
+
+    def _trim(self, now: float):
+        while self._events and now - self._events[0][0] > self.window:
+            self._events.popleft()
+
+    def failure_rate(self) -> float:
+        self._trim(time.monotonic())
+        if not self._events:
+            return 0.0
+        failures = sum(1 for _, ok in self._events if not ok)
+        return failures / len(self._events)
+
+    def allow(self) -> bool:
+        """Should a call be attempted right now?"""
+        now = time.monotonic()
+
+        if self.state == self.OPEN:
+            if now - self.opened_at < self.cooldown:
+                return False
+            self.state = self.HALF_OPEN
+            self._trial_started = None
+
+        if self.state == self.HALF_OPEN:
+            # One trial at a time; a trial that never reported back (e.g. a
+            # cancelled hedge loser) stops blocking after a cooldown.
+            if self._trial_started is not None and now - self._trial_started < self.cooldown:
+                return False
+            self._trial_started = now
+
+        return True
+
+    def release_trial(self):
+        """Hands back a half-open trial claimed by allow() but never attempted."""
+        if self.state == self.HALF_OPEN:
+            self._trial_started = None
+
+    def record_success(self):
+        if self.state != self.CLOSED:
+            logger.success(f"Circuit CLOSED: {self.name}")
+            self._events.clear()
+        self.state = self.CLOSED
+        self._trial_started = None
+        self._events.append((time.monotonic(), True))
+
+    def record_failure(self):
+        now = time.monotonic()
+        if self.state == self.HALF_OPEN:
+            self._open(now)
+            return
+
+        self._events.append((now, False))
+        self._trim(now)
+        if (
+            self.state == self.CLOSED
+            and len(self._events) >= self.min_calls
+            and self.failure_rate() >= self.failure_threshold
+        ):
+            self._open(now)
+
+    def half_open(self):
+        """A passing health probe lets the next real call through as a trial."""
+        if self.state == self.OPEN:
+            self.state = self.HALF_OPEN
+            self._trial_started = None
+
+    def _open(self, now: float):
+        if self.state != self.OPEN:
+            logger.warning(f"Circuit OPEN: {self.name}")
+        self.state = self.OPEN
+        self.opened_at = now
+        self._trial_started = None
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            'state': self.state,
+            'failure_rate': round(self.failure_rate(), 2),
+            'calls': len(self._events)
+        }
+
+
+class BackendHealth:
+    """
+    Registry of circuit breakers plus background health probes.
+    Probes run for every registered backend; a failing probe counts as a
+    failure, a passing probe moves an open circuit to half-open.
+    """
+
+    def __init__(self, probe_interval: float = 15.0):
+        self.probe_interval = probe_interval
+        self.breakers: Dict[str, CircuitBreaker] = {}
+        self.probes: Dict[str, Callable[[], Awaitable[bool]]] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    def breaker(self, name: str) -> CircuitBreaker:
+        if name not in self.breakers:
+            self.breakers[name] = CircuitBreaker(
+                name,
+                failure_threshold=config.BREAKER_FAILURE_THRESHOLD,
+                window=config.BREAKER_WINDOW,
+                min_calls=config.BREAKER_MIN_CALLS,
+                cooldown=config.BREAKER_COOLDOWN
+            )
+        return self.breakers[name]
+
+    def register_probe(self, name: str, probe: Callable[[], Awaitable[bool]]):
+        self.breaker(name)
+        self.probes[name] = probe
+
+    def ensure_started(self):
+        """Starts the probe loop on the running event loop (idempotent)."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._probe_loop())
+
+    async def _probe_loop(self):
+        while True:
+            await self.run_probes()
+            await asyncio.sleep(self.probe_interval)
+
+    async def run_probes(self):
+        names = list(self.probes)
+        results = await asyncio.gather(
+            *(self.probes[name]() for name in names), return_exceptions=True
+        )
+        for name, healthy in zip(names, results):
+            breaker = self.breakers[name]
+            if healthy is True:
+                breaker.half_open()
+            elif breaker.state != CircuitBreaker.OPEN:
+                breaker.record_failure()
+
+    async def handle_shutdown(self, _=None, **kwargs):
+        if self._task:
+            self._task.cancel()
+            self._task = None
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        return {name: b.snapshot() for name, b in self.breakers.items()}
+
+
+backend_health = BackendHealth(probe_interval=config.HEALTH_PROBE_INTERVAL)
+bus.subscribe("SHUTDOWN", backend_health.handle_shutdown)
@@ -42,6 +42,13 @@ class Settings(BaseSettings):
     CACHE_ENABLED: bool = True
     CACHE_SIZE: int = 3000  # Increased cache capacity
     CACHE_TTL: int = 900  # Extended cache lifetime (15 min)
+    ROUTE_CACHE_ENABLED: bool = True  # Memoize pure router results (math, static replies)
+    ROUTE_CACHE_SIZE: int = 512
+    SEMANTIC_CACHE_ENABLED: bool = False  # Replay answers to near-identical prompts
+    SEMANTIC_CACHE_THRESHOLD: float = 0.92  # Cosine similarity needed for a hit
+    SEMANTIC_CACHE_SIZE: int = 256
+    SEMANTIC_CACHE_TTL: int = 3600
+    SEMANTIC_CACHE_REPLAY_CPS: int = 600  # Replay speed in chars/sec (0 = instant)
 
     # High-Performance Connection Pooling
     MAX_CONNECTIONS: int = 30  # More connections
@@ -54,11 +61,26 @@ class Settings(BaseSettings):
 
     # Memory Optimization
     MEMORY_WORKING_SIZE: int = 30  # Larger working memory
-    MEMORY_LTM_BATCH_SIZE: int = 100  # Bigger batch processing
-    MEMORY_CLEANUP_INTERVAL: int = 600  # Cleanup every 10 min
+    MEMORY_LTM_BATCH_SIZE: int = 100  # Episodic inserts per batched write
+    MEMORY_FLUSH_INTERVAL: float = 2.0  # Max seconds a write waits in the queue
+    MEMORY_EMBED_CACHE_SIZE: int = 256  # Cached query embeddings (LRU)
+    MEMORY_BACKEND: str = "chroma"  # chroma | numpy (memory-mapped, no chromadb import)
+    MEMORY_VECTOR_DTYPE: str = "float16"  # numpy backend matrix precision
+    MEMORY_IVF_LISTS: int = 0  # numpy backend IVF partitions (0 = exact search)
+    MEMORY_IVF_NPROBE: int = 4
+    MEMORY_READONLY: bool = False  # Share another process's index without writing
+    MEMORY_HYBRID_ALPHA: float = 0.6  # Recall score weight of vector vs BM25 similarity
+    MEMORY_RECENCY_HALF_LIFE: float = 604800.0  # Recall score halves (to the floor) per week
+    MEMORY_RECENCY_FLOOR: float = 0.5  # Weight kept by arbitrarily old memories
+    MEMORY_FILTER_EXACT_LIMIT: int = 500  # Filtered recall scores matches exactly up to this many
+    MEMORY_CLEANUP_INTERVAL: int = 600  # Consolidate every 10 min (0 = off)
+    MEMORY_DEDUP_THRESHOLD: float = 0.95  # Cosine similarity that merges two memories
+    MEMORY_SUMMARIZE_AFTER: int = 86400  # Summarize conversation spans older than 1 day
+    MEMORY_EXPIRE_AFTER: int = 2592000  # Drop never-recalled memories after 30 days
 
     # Advanced Response Optimization
     ENABLE_SMART_ROUTING: bool = True
+    SPECULATIVE_ROUTING: bool = True  # Start the brain stream while local handlers decide
     ENABLE_PATTERN_MATCHING: bool = True
     BATCH_PROCESSING: bool = True
     BATCH_SIZE: int = 10  # Larger batch size
@@ -67,14 +89,45 @@ class Settings(BaseSettings):
     # Model Selection (Optimized)
     FAST_MODEL: str = "gemini-3-flash-preview"
     SMART_MODEL: str = "gemini-3-pro-preview"
-    AUTO_MODEL_SELECTION: bool = True  # Intelligent model routing
+    AUTO_MODEL_SELECTION: bool = True  # Order backends by observed latency/error rate
+    MODEL_CACHE_SIZE: int = 16  # Reused GenerativeModel handles
+
+    # Local Bio-Link (Ollama)
+    OLLAMA_URL: str = "http://localhost:11434"
+    LOCAL_MODEL: str = "phi3"
+    LOCAL_ALT_MODELS: list = []  # Extra Ollama models the selector may use
+    LOCAL_NUM_CTX: int = 4096  # Context window requested from Ollama
+    OLLAMA_KEEP_ALIVE: str = "30m"  # Keep models (and their KV cache) loaded
+
+    # Context Budgets (memory tokens per backend kind)
+    CONTEXT_BUDGETS: dict = {"gemini": 6000, "ollama": 1500}
+
+    # Hedged Requests (race local model when the cloud is slow)
+    ENABLE_HEDGING: bool = True
+    HEDGE_DELAY: float = 1.5  # Seconds to wait for the first cloud token
+
+    # Circuit Breakers (per model backend)
+    BREAKER_FAILURE_THRESHOLD: float = 0.5  # Failure rate that opens the circuit
+    BREAKER_WINDOW: int = 60  # Sliding window (seconds)
+    BREAKER_MIN_CALLS: int = 3  # Calls in window before the rate is trusted
+    BREAKER_COOLDOWN: int = 30  # Seconds open before a trial call
+    HEALTH_PROBE_INTERVAL: int = 15
+
+    # Brain Cassette (record/replay streams for offline benchmarks)
+    BRAIN_CASSETTE_MODE: str = "off"  # off | record | replay
+    BRAIN_CASSETTE_PATH: str = os.path.join(DATA_DIR, "brain_cassette.jsonl")
+    BRAIN_CASSETTE_SPEED: float = 1.0  # Replay speed multiplier (0 = no delays)
 
     # Streaming & Chunking (Optimized)
     ENABLE_STREAMING: bool = True
-    STREAM_CHUNK_SIZE: int = 1024  # Larger chunks for faster streaming
+    STREAM_CHUNK_SIZE: int = 1024  # Max chars merged into one local stream chunk
+    STREAM_FLUSH_INTERVAL: float = 0.05  # Flush merged chunks at least this often (s)
 
     # Rate Limiting (Increased)
-    MAX_REQUESTS_PER_MINUTE: int = 100  # Higher rate limit
+    MAX_REQUESTS_PER_MINUTE: int = 100  # Per cloud model backend
+    LOCAL_MAX_REQUESTS_PER_MINUTE: int = 0  # Per Ollama model (0 = unlimited)
+    RATE_LIMIT_BURST: int = 10  # Calls admitted back-to-back before pacing
+    ADMISSION_MAX_WAIT: float = 5.0  # Seconds a call may queue before skipping the backend
 
     class Config:
         """Pydantic configuration."""
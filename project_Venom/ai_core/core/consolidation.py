@@ -0,0 +1,302 @@
+import asyncio
+import concurrent.futures
+import re
+import time
+import uuid
+from collections import Counter
+
+import numpy as np
+
+from .lexicon import idf_table, terms_of
+from .logger import logger
+
+_SENTENCE_RE = re.compile(r"(?<=[.!?])\s+")
+
+
+def extractive_summary(texts, max_sentences=3):
+    """
+    Picks the most informative sentences (highest mean IDF of their terms)
+    and returns them in their original order.
+    """
+    sentences = [s.strip() for text in texts for s in _SENTENCE_RE.split(text)]
+    sentences = [s for s in sentences if s]
+
+    def weight(sentence):
+        terms = terms_of(sentence)
+        return sum(idf_table.idf(t) for t in terms) / len(terms) if terms else 0.0
+
+    best = sorted(range(len(sentences)), key=lambda i: weight(sentences[i]))
+    keep = sorted(best[-max_sentences:])
+    return " ".join(sentences[i] for i in keep)
+
+
+def extractive_summaries(spans):
+    """Default consolidation summarizer: one extractive summary per span."""
+    return [extractive_summary(texts) for texts in spans]
+
+
+def loop_summarizer(summarize, loop, timeout=120.0):
+    """
+    Adapts an async per-span `summarize(texts)` that runs on `loop` (e.g.
+    VenomBrain.summarize) to the consolidation thread. All spans of a pass
+    are submitted together, so the brain's micro-batcher serves them as
+    batches. Spans without a model summary (failure, timeout, event loop
+    stopped) fall back to extractive_summary.
+    """
+
+    def summarizer(spans):
+        if loop.is_closed() or not loop.is_running():
+            return extractive_summaries(spans)
+
+        async def run():
+            return await asyncio.gather(
+                *(summarize(texts) for texts in spans), return_exceptions=True
+            )
+
+        future = asyncio.run_coroutine_threadsafe(run(), loop)
+        deadline = time.monotonic() + timeout
+        results = [None] * len(spans)
+        while True:
+            try:
+                results = future.result(timeout=1.0)
+                break
+            except concurrent.futures.TimeoutError:
+                if not loop.is_running() or time.monotonic() > deadline:
+                    future.cancel()
+                    break
+
+        return [
+            (
+                summary.strip()
+                if isinstance(summary, str) and summary.strip()
+                else extractive_summary(texts)
+            )
+            for summary, texts in zip(results, spans)
+        ]
+
+    return summarizer
+
+
+class MemoryConsolidator:
+    """
+    Periodic maintenance pass over the episodic store.
+
+    1. Access counts gathered by recall() are folded into each entry's
+       `hits` metadata.
+    2. Near-duplicates (same role, cosine similarity >= dedup_threshold)
+       are merged into the newest copy, which keeps a `count` of merges.
+    3. Entries older than summarize_after are grouped into spans (gaps under
+       span_gap seconds); spans of min_span items are replaced by one
+       "summary" entry. `summarizer` receives every span of the pass at
+       once (list of lists of texts) and returns one summary per span.
+    4. Entries older than expire_after with fewer than min_hits recalls
+       are deleted.
+    Backends that support it are compacted after passes that removed entries.
+    """
+
+    def __init__(
+        self,
+        memory,
+        dedup_threshold=0.95,
+        summarize_after=86400.0,
+        span_gap=1800.0,
+        min_span=4,
+        expire_after=30 * 86400.0,
+        min_hits=1,
+        summarizer=None,
+    ):
+        self.memory = memory
+        self.dedup_threshold = dedup_threshold
+        self.summarize_after = summarize_after
+        self.span_gap = span_gap
+        self.min_span = min_span
+        self.expire_after = expire_after
+        self.min_hits = min_hits
+        self.summarizer = summarizer or extractive_summaries
+        self.stats = {"runs": 0, "merged": 0, "summarized": 0, "expired": 0}
+        self.last_run = {}
+
+    def _snapshot(self):
+        collection = self.memory.collection
+        data = collection.get(include=["documents", "metadatas", "embeddings"])
+        embeddings = data.get("embeddings")
+        if embeddings is None or not len(data["ids"]):
+            return None
+        vectors = np.asarray(embeddings, dtype=np.float32)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return {
+            "ids": list(data["ids"]),
+            "documents": list(data["documents"]),
+            "metadatas": [dict(m or {}) for m in data["metadatas"]],
+            "vectors": vectors / norms,
+        }
+
+    def run(self, now=None):
+        """One consolidation pass. Returns the run's report."""
+        collection = self.memory.collection
+        if not collection:
+            return {}
+        started = time.perf_counter()
+        now = now or time.time()
+        self.memory.flush()
+
+        report = {"merged": 0, "summarized": 0, "summaries": 0, "expired": 0}
+        report["before"] = collection.count()
+        snapshot = self._snapshot()
+        if snapshot:
+            self._fold_hits(snapshot)
+            removed = self._merge_duplicates(snapshot, report)
+            removed |= self._summarize_spans(snapshot, removed, now, report)
+            removed |= self._expire(snapshot, removed, now, report)
+            if removed:
+                idf_table.remove_documents(
+                    document
+                    for id_, document in zip(snapshot["ids"], snapshot["documents"])
+                    if id_ in removed
+                )
+                if hasattr(collection, "compact"):
+                    collection.compact()
+        report["after"] = collection.count()
+        report["duration_ms"] = round((time.perf_counter() - started) * 1000, 1)
+        report["at"] = now
+
+        self.stats["runs"] += 1
+        for key in ("merged", "summarized", "expired"):
+            self.stats[key] += report[key]
+        self.last_run = report
+        logger.system(
+            f"Memory consolidated: {report['before']} -> {report['after']} entries "
+            f"(merged {report['merged']}, summarized {report['summarized']} "
+            f"into {report['summaries']}, expired {report['expired']})"
+        )
+        return report
+
+    def _fold_hits(self, snapshot):
+        accesses = self.memory.take_access_counts()
+        ids, metadatas = [], []
+        for i, id_ in enumerate(snapshot["ids"]):
+            if accesses.get(id_):
+                metadata = snapshot["metadatas"][i]
+                metadata["hits"] = metadata.get("hits", 0) + accesses[id_]
+                ids.append(id_)
+                metadatas.append(metadata)
+        if ids:
+            self.memory.collection.update(ids=ids, metadatas=metadatas)
+
+    def _merge_duplicates(self, snapshot, report, block=1024):
+        metadatas = snapshot["metadatas"]
+        timestamps = np.array([m.get("timestamp", 0.0) for m in metadatas])
+        roles = np.array([m.get("role", "") for m in metadatas])
+        order = np.argsort(-timestamps)  # newest first survives
+        vectors = snapshot["vectors"][order]
+        roles = roles[order]
+
+        n = len(order)
+        merged_into = np.full(n, -1)
+        for start in range(0, n, block):
+            sims = vectors[start : start + block] @ vectors.T
+            for offset, row in enumerate(sims):
+                i = start + offset
+                if merged_into[i] != -1:
+                    continue
+                dupes = np.flatnonzero(
+                    (row >= self.dedup_threshold)
+                    & (merged_into == -1)
+                    & (roles == roles[i])
+                )
+                merged_into[dupes[dupes > i]] = i
+
+        removed, survivors = set(), Counter()
+        for i in np.flatnonzero(merged_into != -1):
+            keeper, dupe = order[merged_into[i]], order[i]
+            removed.add(snapshot["ids"][dupe])
+            survivors[keeper] += metadatas[dupe].get("count", 1)
+            metadatas[keeper]["hits"] = metadatas[keeper].get("hits", 0) + metadatas[
+                dupe
+            ].get("hits", 0)
+
+        if removed:
+            for keeper, extra in survivors.items():
+                metadatas[keeper]["count"] = metadatas[keeper].get("count", 1) + extra
+            self.memory.collection.update(
+                ids=[snapshot["ids"][k] for k in survivors],
+                metadatas=[metadatas[k] for k in survivors],
+            )
+            self.memory.collection.delete(ids=list(removed))
+        report["merged"] = len(removed)
+        return removed
+
+    def _summarize_spans(self, snapshot, removed, now, report):
+        old = [
+            i
+            for i, id_ in enumerate(snapshot["ids"])
+            if id_ not in removed
+            and snapshot["metadatas"][i].get("role") != "summary"
+            and now - snapshot["metadatas"][i].get("timestamp", now)
+            > self.summarize_after
+        ]
+        old.sort(key=lambda i: snapshot["metadatas"][i]["timestamp"])
+
+        spans, span = [], []
+        for i in old:
+            timestamp = snapshot["metadatas"][i]["timestamp"]
+            if span and timestamp - snapshot["metadatas"][span[-1]]["timestamp"] > (
+                self.span_gap
+            ):
+                spans.append(span)
+                span = []
+            span.append(i)
+        spans.append(span)
+
+        spans = [span for span in spans if len(span) >= self.min_span]
+        if not spans:
+            report["summarized"] = 0
+            return set()
+        texts = [[snapshot["documents"][i] for i in span] for span in spans]
+        try:
+            summaries = self.summarizer(texts)
+        except Exception as e:
+            logger.error(f"Memory Summary Failed: {e}")
+            summaries = extractive_summaries(texts)
+
+        summarized = set()
+        for span, summary in zip(spans, summaries):
+            if not summary:
+                continue
+            first, last = (snapshot["metadatas"][i] for i in (span[0], span[-1]))
+            metadata = {
+                "role": "summary",
+                "timestamp": last["timestamp"],
+                "span_start": first["timestamp"],
+                "mood": "neutral",
+                "items": len(span),
+                "hits": sum(snapshot["metadatas"][i].get("hits", 0) for i in span),
+            }
+            span_ids = [snapshot["ids"][i] for i in span]
+            self.memory.collection.add(
+                ids=[str(uuid.uuid4())], documents=[summary], metadatas=[metadata]
+            )
+            idf_table.add_document(summary)
+            self.memory.collection.delete(ids=span_ids)
+            summarized.update(span_ids)
+            report["summaries"] += 1
+
+        report["summarized"] = len(summarized)
+        return summarized
+
+    def _expire(self, snapshot, removed, now, report):
+        expired = [
+            id_
+            for id_, metadata in zip(snapshot["ids"], snapshot["metadatas"])
+            if id_ not in removed
+            and now - metadata.get("timestamp", now) > self.expire_after
+            and metadata.get("hits", 0) < self.min_hits
+        ]
+        if expired:
+            self.memory.collection.delete(ids=expired)
+        report["expired"] = len(expired)
+        return set(expired)
+
+    def get_stats(self):
+        return {**self.stats, "last_run": self.last_run}
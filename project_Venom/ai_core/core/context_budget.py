@@ -0,0 +1,150 @@
+import math
+import re
+import time
+from collections import OrderedDict
+
+from .lexicon import HashingEmbedder
+
+# Words (split into ~4-character subword pieces) and single punctuation marks
+_PIECE_RE = re.compile(r"\w+|[^\w\s]")
+
+
+def estimate_tokens(text):
+    """
+    Fast BPE-style token estimate: a word costs one token per ~4 characters,
+    punctuation one token each. Within ~10-15% of real tokenizers on prose.
+    """
+    if not text:
+        return 0
+    return sum((len(piece) + 3) // 4 for piece in _PIECE_RE.findall(text))
+
+
+def truncate_to_budget(text, budget, keep="tail"):
+    """Cuts text on a line boundary to fit `budget` tokens, keeping the tail or head."""
+    if estimate_tokens(text) <= budget:
+        return text
+
+    lines = text.splitlines()
+    if keep == "tail":
+        lines.reverse()
+    kept, used = [], 0
+    for line in lines:
+        cost = estimate_tokens(line) + 1
+        if used + cost > budget:
+            break
+        kept.append(line)
+        used += cost
+    if keep == "tail":
+        kept.reverse()
+    return "\n".join(kept)
+
+
+class ContextBudgeter:
+    """
+    Assembles memory context for one backend.
+    Candidate items (working memory turns and episodic recalls) are scored
+    by relevance to the query and recency, then packed greedily under the
+    backend's token budget. The packed items keep chronological order.
+    Scoring embeds each item (its first `embed_chars` characters) and keeps
+    the last `cache_size` item vectors, since working memory repeats across
+    turns; rank() once per turn and pass the result with ranked=True to
+    share it across backends.
+    """
+
+    def __init__(
+        self,
+        budgets,
+        relevance_weight=0.7,
+        recency_half_life=600.0,
+        embedder=None,
+        embed_chars=1000,
+        cache_size=256,
+    ):
+        self.budgets = budgets
+        self.relevance_weight = relevance_weight
+        self.recency_half_life = recency_half_life
+        self.embedder = embedder or HashingEmbedder()
+        self.embed_chars = embed_chars
+        self.cache_size = cache_size
+        self._vectors = OrderedDict()  # embedded text -> vector
+        self.stats = {"packed": 0, "dropped": 0, "tokens": 0}
+
+    def budget_for(self, backend):
+        """Budget by backend name ("gemini:<model>") or kind ("gemini")."""
+        return self.budgets.get(backend, self.budgets.get(backend.split(":")[0], 0))
+
+    def score(self, query_vec, item, now):
+        if "distance" in item:
+            # Vector-store hit: cosine distance -> similarity
+            relevance = 1.0 - item["distance"]
+        else:
+            relevance = float(self._embed(item["content"]) @ query_vec)
+
+        timestamp = self._timestamp(item)
+        recency = 0.0
+        if timestamp:
+            recency = math.exp(-max(0.0, now - timestamp) / self.recency_half_life)
+
+        w = self.relevance_weight
+        return w * relevance + (1 - w) * recency
+
+    def _embed(self, text):
+        text = text[: self.embed_chars]
+        vector = self._vectors.get(text)
+        if vector is None:
+            vector = self.embedder.embed(text)
+            self._vectors[text] = vector
+            if len(self._vectors) > self.cache_size:
+                self._vectors.popitem(last=False)
+        else:
+            self._vectors.move_to_end(text)
+        return vector
+
+    def rank(self, query, items):
+        """Items best first."""
+        if not items:
+            return []
+        now = time.time()
+        query_vec = self.embedder.embed(query[: self.embed_chars])
+        return sorted(
+            items, key=lambda item: self.score(query_vec, item, now), reverse=True
+        )
+
+    def pack(self, query, items, backend, ranked=False):
+        """
+        Returns the best items that fit the backend's budget, oldest first.
+        With ranked=True, `items` is already in rank() order.
+        """
+        budget = self.budget_for(backend)
+        if not items or budget <= 0:
+            return []
+        if not ranked:
+            items = self.rank(query, items)
+
+        chosen, used = [], 0
+        for item in items:
+            cost = estimate_tokens(item["content"]) + 2  # role label + newline
+            if used + cost > budget:
+                self.stats["dropped"] += 1
+                continue
+            chosen.append(item)
+            used += cost
+
+        self.stats["packed"] += len(chosen)
+        self.stats["tokens"] += used
+        chosen.sort(key=lambda item: self._timestamp(item))
+        return chosen
+
+    @staticmethod
+    def _timestamp(item):
+        return (
+            item.get("timestamp") or (item.get("metadata") or {}).get("timestamp") or 0
+        )
+
+    def render(self, query, items, backend, ranked=False):
+        """Packed context formatted for a prompt ("ROLE: content" lines)."""
+        packed = self.pack(query, items, backend, ranked)
+        return "\n".join(f"{m['role'].upper()}: {m['content']}" for m in packed)
+
+    def get_stats(self):
+        return dict(self.stats)
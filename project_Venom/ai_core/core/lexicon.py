@@ -0,0 +1,142 @@
+"""
+VENOM LEXICON
+=============
+Single-pass query tokenization and corpus IDF statistics shared by the
+query optimizer and the memory system.
+"""
+
+import math
+import re
+import zlib
+from collections import Counter
+from functools import lru_cache
+from typing import Iterable, List, Tuple
+
+import numpy as np
+
+STOPWORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
+    'of', 'with', 'by', 'from', 'up', 'about', 'into', 'through', 'during'
+})
+
+# Words, numbers and dotted/slashed names such as venom_log.txt or ai_core/core
+_TERM_RE = re.compile(r"[a-z0-9_]+(?:[./\-][a-z0-9_]+)*")
+
+
+class QueryTokens:
+    """
+    Result of one tokenization pass over a query.
+    Consumers read the view they need instead of re-splitting the text.
+    """
+
+    __slots__ = ('raw', 'normalized', 'lower', 'words', 'terms')
+
+    def __init__(self, raw: str):
+        self.raw = raw
+        self.words: Tuple[str, ...] = tuple(raw.split())
+        self.normalized = ' '.join(self.words)
+        self.lower = self.normalized.lower()
+        self.terms: Tuple[str, ...] = tuple(_TERM_RE.findall(self.lower))
+
+    @property
+    def word_count(self) -> int:
+        return len(self.words)
+
+    def content_terms(self, min_len: int = 1) -> List[str]:
+        """Terms without stopwords, in order of appearance."""
+        return [t for t in self.terms if t not in STOPWORDS and len(t) >= min_len]
+
+
+@lru_cache(maxsize=256)
+def tokenize(text: str) -> QueryTokens:
+    """Tokenize once; repeated queries reuse the same token object."""
+    return QueryTokens(text)
+
+
+def terms_of(text: str) -> List[str]:
+    """Lowercased terms of a document (no QueryTokens caching)."""
+    return _TERM_RE.findall(text.lower())
+
+
+class IDFTable:
+    """
+    Incremental document-frequency table.
+    Seeded from the episodic memory corpus, updated on every store and
+    decremented when consolidation deletes entries.
+    """
+
+    def __init__(self):
+        self.doc_count = 0
+        self.doc_freq: Counter = Counter()
+
+    def add_document(self, text: str):
+        """Count each distinct term of a document once."""
+        self.doc_freq.update(set(terms_of(text)))
+        self.doc_count += 1
+
+    def add_documents(self, texts: Iterable[str]):
+        for text in texts:
+            if text:
+                self.add_document(text)
+
+    def remove_document(self, text: str):
+        """Undo add_document for a deleted document."""
+        for term in set(terms_of(text)):
+            if self.doc_freq[term] > 1:
+                self.doc_freq[term] -= 1
+            else:
+                self.doc_freq.pop(term, None)
+        self.doc_count = max(0, self.doc_count - 1)
+
+    def remove_documents(self, texts: Iterable[str]):
+        for text in texts:
+            if text:
+                self.remove_document(text)
+
+    def idf(self, term: str) -> float:
+        """Smoothed inverse document frequency (always positive)."""
+        return math.log((1 + self.doc_count) / (1 + self.doc_freq.get(term, 0))) + 1.0
+
+    def rank(self, terms: List[str], top_k: int = 5) -> List[str]:
+        """
+        Order distinct terms by TF-IDF. Ties keep their original order,
+        so an empty table degrades to first-seen order.
+        """
+        tf = Counter(terms)
+        unique = list(dict.fromkeys(terms))
+        unique.sort(key=lambda t: tf[t] * self.idf(t), reverse=True)
+        return unique[:top_k]
+
+    def stats(self):
+        return {'documents': self.doc_count, 'vocabulary': len(self.doc_freq)}
+
+
+class HashingEmbedder:
+    """
+    Feature-hashed bag of content terms plus character trigrams, L2-normalized.
+    A dependency-free sentence vector: good at near-duplicate and rephrased
+    questions, not at deep paraphrase. Hashes are stable across processes.
+    """
+
+    def __init__(self, dim: int = 512, trigram_weight: float = 0.5):
+        self.dim = dim
+        self.trigram_weight = trigram_weight
+
+    def _add(self, vec: np.ndarray, feature: str, weight: float):
+        h = zlib.crc32(feature.encode())
+        vec[h % self.dim] += weight if h & 0x80000000 else -weight
+
+    def embed(self, text: str) -> np.ndarray:
+        tokens = tokenize(text)
+        vec = np.zeros(self.dim, dtype=np.float32)
+        for term in tokens.content_terms():
+            self._add(vec, term, 1.0)
+        padded = f' {" ".join(tokens.terms)} '
+        for i in range(len(padded) - 2):
+            self._add(vec, padded[i:i + 3], self.trigram_weight)
+
+        norm = np.linalg.norm(vec)
+        return vec / norm if norm else vec
+
+
+idf_table = IDFTable()
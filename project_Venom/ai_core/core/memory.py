@@ -1,9 +1,20 @@
-import chromadb
+import asyncio
+import atexit
+import threading
 import uuid
 import time
-from collections import deque
+from collections import Counter, OrderedDict, deque
+
+import numpy as np
+
 from .config import config
+from .consolidation import MemoryConsolidator
+from .event_bus import bus
+from .lexicon import idf_table, terms_of
 from .logger import logger
+from .performance import task_executor
+from .recall_index import RecallIndex
+from .vector_store import open_store
 
 
 class VenomMemory:
@@ -14,23 +25,144 @@ class VenomMemory:
     1. Working Memory (Short-Term): Deque buffer for immediate context (last N interactions).
     2. Episodic Memory (Long-Term): Vector Database for recalling past events.
     3. Semantic Memory (Knowledge): (Future) Clean facts storage.
+
+    Episodic writes are write-behind: store() only queues them, and a
+    background worker flushes the queue as one batched add when it reaches
+    MEMORY_LTM_BATCH_SIZE or MEMORY_FLUSH_INTERVAL elapses. Queued items are
+    visible to recall() until they land, and the queue is flushed on SHUTDOWN.
+
+    Recall embeds the query once per distinct text (LRU cache) and is
+    available off the event loop as arecall(). Episodic hits are ranked by
+    vector similarity fused with BM25 (RecallIndex), decayed by age, and can
+    be filtered by role, mood or time range.
+
+    The episodic store is pluggable (MEMORY_BACKEND, see vector_store) and
+    is consolidated every MEMORY_CLEANUP_INTERVAL seconds (see consolidation).
     """
 
     def __init__(self):
         # working memory size = 10 turns
         self.working_memory = deque(maxlen=10)
 
+        # Query embedding cache (same model the collection embeds documents with)
+        self.embed_fn = None
+        self._embed_cache = OrderedDict()
+        self._embed_lock = threading.Lock()  # embed cache and recall counters
+        self.embed_cache_size = config.MEMORY_EMBED_CACHE_SIZE
+        self.recall_ms = deque(maxlen=200)
+        self.recall_stats = {
+            "recalls": 0,
+            "embed_hits": 0,
+            "embed_misses": 0,
+            "embed_evictions": 0,
+        }
+        self._access_counts = Counter()  # recalled entry id -> hits since last run
+        self.hybrid_alpha = config.MEMORY_HYBRID_ALPHA
+        self.recency_half_life = config.MEMORY_RECENCY_HALF_LIFE
+        self.recency_floor = config.MEMORY_RECENCY_FLOOR
+        self.filter_exact_limit = config.MEMORY_FILTER_EXACT_LIMIT
+
         # Long Term Memory
+        self.readonly = config.MEMORY_READONLY
         try:
-            self.client = chromadb.PersistentClient(path=config.MEMORY_DIR)
-            self.collection = self.client.get_or_create_collection(
-                name="venom_episodic", metadata={"hnsw:space": "cosine"}
+            options = {}
+            if config.MEMORY_BACKEND == "numpy":
+                options = {
+                    "dtype": config.MEMORY_VECTOR_DTYPE,
+                    "ivf_lists": config.MEMORY_IVF_LISTS,
+                    "nprobe": config.MEMORY_IVF_NPROBE,
+                    "readonly": self.readonly,
+                }
+            self.collection, self.embed_fn = open_store(
+                config.MEMORY_BACKEND, config.MEMORY_DIR, **options
             )
             # logger.success("Memory Core Loaded (Episode Store)")
         except Exception as e:
             logger.error(f"Memory Init Failed: {e}")
             self.collection = None
 
+        # Lexical + metadata index over the episodic store
+        self.index = RecallIndex()
+        self._index_lock = threading.Lock()
+        self._seed_indexes()
+
+        # Write-behind queue for episodic inserts
+        self.batch_size = config.MEMORY_LTM_BATCH_SIZE
+        self.flush_interval = config.MEMORY_FLUSH_INTERVAL
+        self._pending = []  # (id, document, metadata)
+        self._inflight = []
+        self._cond = threading.Condition()
+        self._closed = False
+        self.write_stats = {"queued": 0, "flushed": 0, "batches": 0, "failed": 0}
+        self._writer = None
+        if self.collection and not self.readonly:
+            self._writer = threading.Thread(
+                target=self._write_loop, name="venom-memory-writer", daemon=True
+            )
+            self._writer.start()
+            bus.subscribe("SHUTDOWN", self.handle_shutdown)
+            atexit.register(self.close)
+
+        # Periodic consolidation (dedupe, summarize, expire)
+        self.consolidator = MemoryConsolidator(
+            self,
+            dedup_threshold=config.MEMORY_DEDUP_THRESHOLD,
+            summarize_after=config.MEMORY_SUMMARIZE_AFTER,
+            expire_after=config.MEMORY_EXPIRE_AFTER,
+        )
+        self._stop = threading.Event()
+        self._consolidation = None
+        if self._writer and config.MEMORY_CLEANUP_INTERVAL > 0:
+            self._consolidation = threading.Thread(
+                target=self._consolidation_loop,
+                name="venom-memory-consolidator",
+                daemon=True,
+            )
+            self._consolidation.start()
+
+    def _pages(self, page_size=1000):
+        """The episodic corpus in pages (ids, documents, metadatas)."""
+        offset = 0
+        while True:
+            page = self.collection.get(
+                include=["documents", "metadatas"], limit=page_size, offset=offset
+            )
+            yield page
+            if len(page.get("documents") or []) < page_size:
+                return
+            offset += page_size
+
+    def _seed_indexes(self):
+        """Precomputes keyword IDF statistics and the recall index from the corpus."""
+        if not self.collection:
+            return
+        try:
+            for page in self._pages():
+                documents = page.get("documents") or []
+                idf_table.add_documents(documents)
+                self.index.add_many(
+                    zip(page["ids"], documents, page.get("metadatas") or [])
+                )
+        except Exception as e:
+            logger.error(f"IDF Seed Failed: {e}")
+
+    def _rebuild_index(self):
+        """Re-reads the recall index after the store was rewritten."""
+        index = RecallIndex()
+        try:
+            with self._index_lock:
+                for page in self._pages():
+                    index.add_many(
+                        zip(
+                            page["ids"],
+                            page.get("documents") or [],
+                            page.get("metadatas") or [],
+                        )
+                    )
+                self.index = index
+        except Exception as e:
+            logger.error(f"Recall Index Rebuild Failed: {e}")
+
     def store(self, text, role="user", mood="neutral"):
         """Stores a thought in both STM and LTM."""
         if not text:
@@ -44,25 +176,159 @@ class VenomMemory:
             "mood": mood,
         }
         self.working_memory.append(memory_obj)
+        idf_table.add_document(text)
 
-        # 2. Add to Long Term Memory (Episodic)
+        # 2. Queue for Long Term Memory (Episodic); the writer batches inserts
         # We only persist "significant" thoughts or periodically merge STM to LTM (consolidation)
         # For now, we persist everything for simplicity but separate by role
-        if self.collection:
+        if self.collection and self._writer and not self._closed:
+            metadata = {"role": role, "timestamp": time.time(), "mood": mood}
+            with self._cond:
+                self._pending.append((str(uuid.uuid4()), text, metadata))
+                self.write_stats["queued"] += 1
+                if len(self._pending) >= self.batch_size:
+                    self._cond.notify()
+
+    # --- Write-behind worker ---
+    def _write_loop(self):
+        while True:
+            with self._cond:
+                if not self._closed and len(self._pending) < self.batch_size:
+                    self._cond.wait(timeout=self.flush_interval)
+                if self._closed and not self._pending:
+                    return
+            self.flush()
+
+    def flush(self):
+        """Writes every queued item to the collection in batched adds."""
+        while True:
+            with self._cond:
+                if not self._pending:
+                    return
+                batch = self._pending[: self.batch_size]
+                del self._pending[: self.batch_size]
+                self._inflight.extend(batch)
+
             try:
                 self.collection.add(
-                    documents=[text],
-                    metadatas=[{"role": role, "timestamp": time.time(), "mood": mood}],
-                    ids=[str(uuid.uuid4())],
+                    ids=[item[0] for item in batch],
+                    documents=[item[1] for item in batch],
+                    metadatas=[item[2] for item in batch],
                 )
+                self.write_stats["flushed"] += len(batch)
+                self.write_stats["batches"] += 1
+                with self._index_lock:
+                    self.index.add_many(batch)
             except Exception as e:
+                self.write_stats["failed"] += len(batch)
                 logger.error(f"LTM Storage Error: {e}")
+            finally:
+                with self._cond:
+                    done = {item[0] for item in batch}
+                    self._inflight = [i for i in self._inflight if i[0] not in done]
+
+    def close(self):
+        """Stops the writer after draining the queue (idempotent)."""
+        self._stop.set()
+        if self._consolidation:
+            self._consolidation.join()
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify()
+        if self._writer:
+            self._writer.join()
+
+    # --- Consolidation ---
+    def _consolidation_loop(self):
+        while not self._stop.wait(config.MEMORY_CLEANUP_INTERVAL):
+            self.consolidate()
+
+    def consolidate(self):
+        """Runs one consolidation pass now. Returns its report."""
+        try:
+            report = self.consolidator.run()
+        except Exception as e:
+            logger.error(f"Memory Consolidation Failed: {e}")
+            return {}
+        self._rebuild_index()
+        return report
+
+    def take_access_counts(self):
+        """Recall hits per entry id since the last call (resets them)."""
+        with self._embed_lock:
+            counts, self._access_counts = self._access_counts, Counter()
+        return counts
+
+    async def handle_shutdown(self, _=None, **kwargs):
+        await asyncio.to_thread(self.close)
+
+    @staticmethod
+    def _matches_where(metadata, where):
+        if not where:
+            return True
+        timestamp = metadata.get("timestamp", 0.0)
+        return (
+            where.get("role") in (None, metadata.get("role"))
+            and where.get("mood") in (None, metadata.get("mood"))
+            and timestamp >= (where.get("since") or 0.0)
+            and (where.get("until") is None or timestamp <= where["until"])
+        )
+
+    def _unflushed_matches(self, query, n_results, where=None):
+        """Read-your-writes: queued items sharing terms with the query."""
+        with self._cond:
+            unflushed = self._inflight + self._pending
+        if not unflushed:
+            return []
+
+        query_terms = set(terms_of(query))
+        scored = []
+        for _, doc, metadata in unflushed:
+            if not self._matches_where(metadata, where):
+                continue
+            overlap = len(query_terms.intersection(terms_of(doc)))
+            if overlap:
+                scored.append((overlap, metadata["timestamp"], doc, metadata))
+        scored.sort(key=lambda item: (item[0], item[1]), reverse=True)
+        return [
+            {"role": "system_recall", "content": doc, "metadata": metadata}
+            for _, _, doc, metadata in scored[:n_results]
+        ]
+
+    def embed_query(self, query):
+        """Query embedding through an LRU cache keyed by the query text."""
+        key = query.strip()
+        with self._embed_lock:
+            vector = self._embed_cache.get(key)
+            if vector is not None:
+                self._embed_cache.move_to_end(key)
+                self.recall_stats["embed_hits"] += 1
+                return vector
 
-    def recall(self, query, n_results=3, include_recent=True):
+        vector = list(self.embed_fn([key])[0])
+        with self._embed_lock:
+            self.recall_stats["embed_misses"] += 1
+            self._embed_cache[key] = vector
+            while len(self._embed_cache) > self.embed_cache_size:
+                self._embed_cache.popitem(last=False)
+                self.recall_stats["embed_evictions"] += 1
+        return vector
+
+    async def arecall(self, query, n_results=3, include_recent=True, where=None):
+        """recall() on the worker pool, keeping the event loop free."""
+        return await task_executor.run_in_thread(
+            self.recall, query, n_results, include_recent, where
+        )
+
+    def recall(self, query, n_results=3, include_recent=True, where=None):
         """
         Retrieves context.
         Combines Working Memory (recent context) + Relevant Episodic Memory (past context).
+        `where` filters episodic hits: {"role", "mood", "since", "until"}.
         """
+        started = time.perf_counter()
         context = []
 
         # Get immediate context from STM
@@ -72,23 +338,128 @@ class VenomMemory:
         # Retrieve similar past memories
         if self.collection and query:
             try:
-                results = self.collection.query(
-                    query_texts=[query], n_results=n_results
-                )
-                if results and results.get("documents"):
-                    for i, doc in enumerate(results["documents"][0]):
-                        context.append(
-                            {
-                                "role": "system_recall",
-                                "content": doc,
-                                "metadata": results["metadatas"][0][i],
-                            }
-                        )
+                context.extend(self._search(query, n_results, where))
             except Exception as e:
                 logger.error(f"LTM Recall Failed: {e}")
 
+            seen = {m["content"] for m in context}
+            context.extend(
+                m
+                for m in self._unflushed_matches(query, n_results, where)
+                if m["content"] not in seen
+            )
+
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        with self._embed_lock:
+            self.recall_ms.append(elapsed_ms)
+            self.recall_stats["recalls"] += 1
         return context
 
+    def _search(self, query, n_results, where=None):
+        """
+        Hybrid episodic search. Candidates come from the vector store and the
+        BM25 index (or, for a selective filter, straight from the metadata
+        index); each is scored by
+            (alpha * cosine + (1 - alpha) * bm25 / max_bm25) * recency
+        where recency decays from 1 to MEMORY_RECENCY_FLOOR with the half-life.
+        """
+        pool = n_results * 4
+        query_embedding = self.embed_query(query)
+        query_vec = np.asarray(query_embedding, dtype=np.float32)
+        candidates = self.index.filter(**where) if where else None
+        if candidates is not None and not candidates:
+            return []
+
+        hits = {}  # id -> (document, metadata, cosine similarity)
+        if candidates is not None and len(candidates) <= self.filter_exact_limit:
+            hits = self._score_ids(list(candidates), query_vec)
+        else:
+            results = self.collection.query(
+                query_embeddings=[query_embedding], n_results=pool
+            )
+            for id_, doc, metadata, distance in zip(
+                results["ids"][0],
+                results["documents"][0],
+                results["metadatas"][0],
+                results["distances"][0],
+            ):
+                if candidates is None or id_ in candidates:
+                    hits[id_] = (doc, metadata, 1.0 - distance)
+
+        lexical = dict(self.index.search(query, k=pool, candidates=candidates))
+        missing = [id_ for id_ in lexical if id_ not in hits]
+        if missing:
+            hits.update(self._score_ids(missing, query_vec))
+
+        top_lexical = max(lexical.values(), default=0.0)
+        now = time.time()
+        scored = []
+        for id_, (doc, metadata, similarity) in hits.items():
+            keyword = lexical.get(id_, 0.0) / top_lexical if top_lexical else 0.0
+            relevance = (
+                self.hybrid_alpha * similarity + (1 - self.hybrid_alpha) * keyword
+            )
+            age = max(0.0, now - metadata.get("timestamp", now))
+            recency = self.recency_floor + (1 - self.recency_floor) * 0.5 ** (
+                age / self.recency_half_life
+            )
+            scored.append((relevance * recency, id_, doc, metadata, similarity))
+        scored.sort(key=lambda item: item[0], reverse=True)
+        scored = scored[:n_results]
+
+        with self._embed_lock:
+            self._access_counts.update(item[1] for item in scored)
+        return [
+            {
+                "role": "system_recall",
+                "content": doc,
+                "metadata": metadata,
+                "distance": 1.0 - similarity,
+                "score": round(score, 4),
+            }
+            for score, _, doc, metadata, similarity in scored
+        ]
+
+    def _score_ids(self, ids, query_vec):
+        """Exact cosine similarity between the query and specific entries."""
+        data = self.collection.get(
+            ids=ids, include=["documents", "metadatas", "embeddings"]
+        )
+        if not data["ids"]:
+            return {}
+        vectors = np.asarray(data["embeddings"], dtype=np.float32)
+        norms = np.linalg.norm(vectors, axis=1) * np.linalg.norm(query_vec)
+        norms[norms == 0] = 1.0
+        similarities = vectors @ query_vec / norms
+        return {
+            id_: (doc, metadata, float(similarity))
+            for id_, doc, metadata, similarity in zip(
+                data["ids"], data["documents"], data["metadatas"], similarities
+            )
+        }
+
+    def get_stats(self):
+        """Write-behind counters, recall latency and embedding cache usage."""
+        with self._cond:
+            pending = len(self._pending) + len(self._inflight)
+        with self._embed_lock:
+            samples = sorted(self.recall_ms)
+            recall_stats = dict(self.recall_stats)
+        latency = {}
+        if samples:
+            latency = {
+                "recall_p50_ms": round(samples[len(samples) // 2], 2),
+                "recall_p95_ms": round(samples[int(len(samples) * 0.95)], 2),
+            }
+        return {
+            **self.write_stats,
+            "pending": pending,
+            **recall_stats,
+            **latency,
+            "index": self.index.get_stats(),
+            "consolidation": self.consolidator.get_stats(),
+        }
+
     def get_working_context_str(self):
         """Returns STM formatted for LLM Prompt."""
         return "\n".join(
@@ -14,6 +14,10 @@ from typing import Any, Callable, Dict, Optional
 from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 import multiprocessing as mp
 
+import aiohttp
+
+from .config import config
+from .event_bus import bus
 from .logger import logger
 
 
@@ -88,6 +92,82 @@ class PerformanceCache:
         }
 
 
+class RouteCache:
+    """
+    Synchronous LRU cache for deterministic router results.
+    Entries carry their own TTL so each route can expire at its own pace.
+    No locking: lookups happen on the event loop thread and must stay in
+    the microsecond range.
+    """
+
+    def __init__(self, max_size: int = 512):
+        self.max_size = max_size
+        self._cache: OrderedDict = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.route_hits: Dict[str, int] = {}
+
+    @staticmethod
+    def normalize(query: str) -> str:
+        """Case/whitespace-insensitive key; trailing punctuation is ignored."""
+        return " ".join(query.lower().split()).rstrip("?.! ")
+
+    def get(self, query: str, count_miss: bool = True) -> Optional[tuple]:
+        """
+        Return (result, source) for a fresh entry, else None.
+        With count_miss=False the caller decides later whether the lookup
+        was an eligible miss (see record_miss).
+        """
+        key = self.normalize(query)
+        entry = self._cache.get(key)
+        if entry is None:
+            if count_miss:
+                self.misses += 1
+            return None
+
+        result, source, expires_at = entry
+        if time.monotonic() > expires_at:
+            del self._cache[key]
+            if count_miss:
+                self.misses += 1
+            return None
+
+        self._cache.move_to_end(key)
+        self.hits += 1
+        self.route_hits[source] = self.route_hits.get(source, 0) + 1
+        return result, source
+
+    def record_miss(self):
+        """Count a deferred miss from get(..., count_miss=False)."""
+        self.misses += 1
+
+    def set(self, query: str, result: Any, source: str, ttl: float):
+        """Store a route result for `ttl` seconds."""
+        key = self.normalize(query)
+        if key in self._cache:
+            self._cache.move_to_end(key)
+        elif len(self._cache) >= self.max_size:
+            self._cache.popitem(last=False)
+
+        self._cache[key] = (result, source, time.monotonic() + ttl)
+
+    def clear(self):
+        """Drop every cached route result."""
+        self._cache.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Get hit/miss statistics."""
+        lookups = self.hits + self.misses
+        return {
+            'size': len(self._cache),
+            'max_size': self.max_size,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / lookups, 3) if lookups else 0.0,
+            'route_hits': dict(self.route_hits)
+        }
+
+
 class ConnectionPool:
     """
     Connection pooling for API clients and external services.
@@ -144,6 +224,76 @@ class ConnectionPool:
         self._active_connections = 0
 
 
+class HTTPSessionPool(ConnectionPool):
+    """
+    Process-wide aiohttp session for local/remote HTTP backends.
+    aiohttp's connector already pools keep-alive sockets per host, so the
+    pool hands out one shared session per event loop instead of a session
+    per request. Closed on kernel SHUTDOWN.
+    """
+
+    def __init__(self, max_connections: int = 10, timeout: int = 45, keepalive_timeout: int = 75):
+        super().__init__(max_connections=max_connections)
+        self.timeout = timeout
+        self.keepalive_timeout = keepalive_timeout
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def acquire(self) -> aiohttp.ClientSession:
+        """Shared session for the running loop (created on first use)."""
+        loop = asyncio.get_running_loop()
+        if self._session is not None and self._loop is not loop:
+            await self._close_stale(self._session, self._loop)
+            self._session = None
+        if self._session is None or self._session.closed:
+            self._session = self._create_connection()
+            self._loop = loop
+            self._active_connections = 1
+        return self._session
+
+    @staticmethod
+    async def _close_stale(session: aiohttp.ClientSession, loop: asyncio.AbstractEventLoop):
+        """Closes a session left behind by another event loop."""
+        if loop.is_running():
+            # Its transports belong to that loop's thread
+            asyncio.run_coroutine_threadsafe(session.close(), loop)
+        else:
+            # A finished loop's sockets are gone; this only marks it closed
+            await session.close()
+
+    async def release(self, connection: Any):
+        """The shared session stays open for the next caller."""
+        pass
+
+    def _create_connection(self) -> aiohttp.ClientSession:
+        connector = aiohttp.TCPConnector(
+            limit_per_host=self.max_connections,
+            keepalive_timeout=self.keepalive_timeout,
+            ttl_dns_cache=300
+        )
+        # No total deadline: streamed generations can legitimately run long.
+        timeout = aiohttp.ClientTimeout(
+            total=None, sock_connect=self.timeout, sock_read=self.timeout
+        )
+        return aiohttp.ClientSession(connector=connector, timeout=timeout)
+
+    async def _close_connection(self, connection: Any):
+        if connection is not None and not connection.closed:
+            await connection.close()
+
+    async def close_all(self):
+        """Close the shared session."""
+        await self._close_connection(self._session)
+        self._session = None
+        self._loop = None
+        self._active_connections = 0
+
+    async def handle_shutdown(self, _=None, **kwargs):
+        """Kernel SHUTDOWN hook."""
+        await self.close_all()
+        logger.system("HTTP session pool closed")
+
+
 class TaskExecutor:
     """
     Managed thread and process pools for CPU/IO-bound tasks.
@@ -296,6 +446,11 @@ def measure_performance(func: Callable):
 
 performance_cache = PerformanceCache(max_size=2000, ttl=600)
 task_executor = TaskExecutor()
+http_pool = HTTPSessionPool(
+    max_connections=config.MAX_CONNECTIONS,
+    timeout=config.CONNECTION_TIMEOUT
+)
+bus.subscribe("SHUTDOWN", http_pool.handle_shutdown)
 
 logger.system("🚀 Performance Optimizer v2.0 loaded")
 
@@ -0,0 +1,161 @@
+"""
+VENOM ADMISSION CONTROL
+=======================
+Per-backend token buckets in front of the model calls. Bursts wait briefly
+in an urgency-ordered queue instead of tripping provider quota errors.
+"""
+
+import asyncio
+import heapq
+import itertools
+import time
+from typing import Any, Dict, List, Optional
+
+from .config import config
+
+# Lower number = admitted first
+URGENCY_PRIORITY = {'CRITICAL': 0, 'HIGH': 1, 'STANDARD': 2, 'LOW': 3}
+
+
+class TokenBucket:
+    """Classic token bucket: `rate_per_minute` refill, `capacity` burst."""
+
+    def __init__(self, rate_per_minute: float, capacity: Optional[float] = None):
+        self.rate = rate_per_minute / 60.0
+        self.capacity = capacity if capacity is not None else max(1.0, rate_per_minute / 10)
+        self.tokens = self.capacity
+        self._updated = time.monotonic()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def try_take(self) -> bool:
+        self._refill()
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return True
+        return False
+
+    def wait_time(self) -> float:
+        """Seconds until the next token is available."""
+        self._refill()
+        return max(0.0, (1 - self.tokens) / self.rate)
+
+
+class AdmissionQueue:
+    """
+    One backend's bucket plus its waiters, kept in a heap ordered by
+    (urgency priority, arrival). A single pump task hands out tokens as
+    they refill; waiters that time out or are cancelled are skipped.
+    """
+
+    def __init__(self, name: str, bucket: TokenBucket):
+        self.name = name
+        self.bucket = bucket
+        self._waiters: List[list] = []  # [priority, seq, future]
+        self._seq = itertools.count()
+        self._pump: Optional[asyncio.Task] = None
+
+        self.admitted = 0
+        self.rejected = 0
+        self.queued = 0
+        self.waited = 0  # admitted after queueing (total_wait covers these)
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    @property
+    def depth(self) -> int:
+        return sum(1 for _, _, fut in self._waiters if not fut.done())
+
+    async def acquire(self, urgency: str = 'STANDARD', timeout: Optional[float] = None) -> bool:
+        """Waits for a token. Returns False if none arrived within `timeout`."""
+        if not self._waiters and self.bucket.try_take():
+            self.admitted += 1
+            return True
+
+        started = time.monotonic()
+        fut = asyncio.get_running_loop().create_future()
+        priority = URGENCY_PRIORITY.get(urgency, URGENCY_PRIORITY['STANDARD'])
+        heapq.heappush(self._waiters, [priority, next(self._seq), fut])
+        self.queued += 1
+        if self._pump is None or self._pump.done():
+            self._pump = asyncio.create_task(self._run_pump())
+
+        try:
+            await asyncio.wait_for(fut, timeout)
+        except asyncio.TimeoutError:
+            self.rejected += 1
+            return False
+
+        waited = time.monotonic() - started
+        self.admitted += 1
+        self.waited += 1
+        self.total_wait += waited
+        self.max_wait = max(self.max_wait, waited)
+        return True
+
+    async def _run_pump(self):
+        while self._waiters:
+            if self._waiters[0][2].done():
+                heapq.heappop(self._waiters)  # timed out or cancelled
+                continue
+            if self.bucket.try_take():
+                heapq.heappop(self._waiters)[2].set_result(True)
+                continue
+            await asyncio.sleep(self.bucket.wait_time())
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            'queue_depth': self.depth,
+            'admitted': self.admitted,
+            'rejected': self.rejected,
+            'queued': self.queued,
+            'avg_wait_ms': round(self.total_wait / self.waited * 1000, 1) if self.waited else 0.0,
+            'max_wait_ms': round(self.max_wait * 1000, 1)
+        }
+
+
+class AdmissionController:
+    """
+    Token bucket per backend ("gemini:<model>", "ollama:<model>").
+    Limits are requests per minute per backend kind; 0 disables limiting.
+    """
+
+    def __init__(self, limits: Dict[str, int], burst: Optional[int] = None, max_wait: float = 5.0):
+        self.limits = limits
+        self.burst = burst
+        self.max_wait = max_wait
+        self.queues: Dict[str, AdmissionQueue] = {}
+
+    def _queue(self, backend: str) -> Optional[AdmissionQueue]:
+        rate = self.limits.get(backend.split(':')[0], 0)
+        if not rate:
+            return None
+        if backend not in self.queues:
+            self.queues[backend] = AdmissionQueue(backend, TokenBucket(rate, self.burst))
+        return self.queues[backend]
+
+    async def acquire(self, backend: str, urgency: str = 'STANDARD') -> bool:
+        """
+        Admits a call to `backend`, waiting at most `max_wait` seconds
+        (CRITICAL requests are served ahead of STANDARD ones).
+        """
+        queue = self._queue(backend)
+        if queue is None:
+            return True
+        return await queue.acquire(urgency, self.max_wait)
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        return {name: q.snapshot() for name, q in self.queues.items()}
+
+
+admission = AdmissionController(
+    limits={
+        'gemini': config.MAX_REQUESTS_PER_MINUTE,
+        'ollama': config.LOCAL_MAX_REQUESTS_PER_MINUTE
+    },
+    burst=config.RATE_LIMIT_BURST,
+    max_wait=config.ADMISSION_MAX_WAIT
+)
@@ -0,0 +1,145 @@
+import bisect
+import math
+import re
+import threading
+from collections import Counter, defaultdict
+
+from .lexicon import STOPWORDS, terms_of
+
+_PART_RE = re.compile(r"[./\-]")
+
+# Metadata fields with a precomputed id set per value
+FACETS = ("role", "mood")
+
+
+def index_terms(text):
+    """
+    Lexical terms of a document or query. Compound names are indexed whole
+    and by their parts, so "venom_log" matches "venom_log.txt".
+    """
+    terms = []
+    for term in terms_of(text):
+        if term in STOPWORDS:
+            continue
+        terms.append(term)
+        parts = _PART_RE.split(term)
+        if len(parts) > 1:
+            terms.extend(p for p in parts if p)
+    return terms
+
+
+class RecallIndex:
+    """
+    In-memory companion to the episodic vector store.
+
+    - BM25 over an inverted index (term -> {id: tf}), updated per document.
+    - Metadata fast path: id sets per role/mood value and a timestamp-sorted
+      list, so filtered recall starts from the matching ids instead of
+      scanning the store.
+    Adding an id that is already indexed replaces it.
+    """
+
+    def __init__(self, k1=1.5, b=0.75):
+        self.k1 = k1
+        self.b = b
+        self._lock = threading.RLock()
+        self.postings = defaultdict(dict)
+        self.doc_terms = {}  # id -> Counter of terms
+        self.doc_length = {}
+        self.total_length = 0
+        self.facets = {field: defaultdict(set) for field in FACETS}
+        self.metadata = {}
+        self._by_time = []  # sorted (timestamp, id)
+
+    def __len__(self):
+        return len(self.doc_terms)
+
+    def add(self, id_, text, metadata):
+        with self._lock:
+            if id_ in self.doc_terms:
+                self.remove([id_])
+            tf = Counter(index_terms(text or ""))
+            self.doc_terms[id_] = tf
+            self.doc_length[id_] = sum(tf.values())
+            self.total_length += self.doc_length[id_]
+            for term, count in tf.items():
+                self.postings[term][id_] = count
+
+            metadata = metadata or {}
+            self.metadata[id_] = metadata
+            for field in FACETS:
+                if field in metadata:
+                    self.facets[field][metadata[field]].add(id_)
+            bisect.insort(self._by_time, (metadata.get("timestamp", 0.0), id_))
+
+    def add_many(self, entries):
+        """entries: iterable of (id, text, metadata)."""
+        for id_, text, metadata in entries:
+            self.add(id_, text, metadata)
+
+    def remove(self, ids):
+        with self._lock:
+            for id_ in ids:
+                tf = self.doc_terms.pop(id_, None)
+                if tf is None:
+                    continue
+                self.total_length -= self.doc_length.pop(id_)
+                for term in tf:
+                    docs = self.postings[term]
+                    docs.pop(id_, None)
+                    if not docs:
+                        del self.postings[term]
+
+                metadata = self.metadata.pop(id_)
+                for field in FACETS:
+                    if field in metadata:
+                        self.facets[field][metadata[field]].discard(id_)
+                key = (metadata.get("timestamp", 0.0), id_)
+                i = bisect.bisect_left(self._by_time, key)
+                if i < len(self._by_time) and self._by_time[i] == key:
+                    del self._by_time[i]
+
+    def filter(self, role=None, mood=None, since=None, until=None):
+        """Ids matching every given constraint, or None when nothing is given."""
+        with self._lock:
+            sets = []
+            for field, value in (("role", role), ("mood", mood)):
+                if value is not None:
+                    sets.append(self.facets[field].get(value, set()))
+            if since is not None or until is not None:
+                lo = bisect.bisect_left(self._by_time, (since or 0.0,))
+                hi = (
+                    bisect.bisect_right(self._by_time, (until, chr(0x10FFFF)))
+                    if until is not None
+                    else len(self._by_time)
+                )
+                sets.append({id_ for _, id_ in self._by_time[lo:hi]})
+            if not sets:
+                return None
+            sets.sort(key=len)
+            return set(sets[0]).intersection(*sets[1:])
+
+    def search(self, query, k=10, candidates=None):
+        """Top-k BM25 matches as [(id, score)], optionally within `candidates`."""
+        terms = set(index_terms(query))
+        with self._lock:
+            n = len(self.doc_terms)
+            if not n or not terms:
+                return []
+            avg_length = self.total_length / n
+            scores = Counter()
+            for term in terms:
+                docs = self.postings.get(term)
+                if not docs:
+                    continue
+                idf = math.log(1 + (n - len(docs) + 0.5) / (len(docs) + 0.5))
+                for id_, tf in docs.items():
+                    if candidates is not None and id_ not in candidates:
+                        continue
+                    length = self.doc_length[id_]
+                    norm = self.k1 * (1 - self.b + self.b * length / avg_length)
+                    scores[id_] += idf * tf * (self.k1 + 1) / (tf + norm)
+            return scores.most_common(k)
+
+    def get_stats(self):
+        return {"documents": len(self.doc_terms), "terms": len(self.postings)}
@@ -14,6 +14,9 @@ class Synapse:
         self.state_file = "storage/venom_state.json"
         self.input_file = "storage/venom_input.json"
         self.output_file = "storage/venom_response.json"
+        self.metrics_file = "storage/venom_metrics.json"
+        self.last_vitals = None
+        self.vitals_providers = {}
         os.makedirs("storage", exist_ok=True)
 
     # --- OUTPUT (Brain -> Web) ---
@@ -57,6 +60,21 @@ class Synapse:
             return data["command"]
         return None
 
+    # --- METRICS (Brain -> Web) ---
+    def publish_metrics(self, metrics: dict):
+        """Atomic write of routing/cache telemetry for the metrics endpoint."""
+        self._atomic_write(
+            self.metrics_file, {"metrics": metrics, "timestamp": time.time()}
+        )
+
+    def get_metrics(self):
+        """Last published telemetry snapshot, if any."""
+        return self._read_json(self.metrics_file)
+
+    def register_vitals_provider(self, name: str, provider):
+        """Adds `provider()` output to every vitals snapshot under `name`."""
+        self.vitals_providers[name] = provider
+
     # --- UTILS ---
     def _atomic_write(self, filepath, data):
         try:
@@ -81,7 +99,7 @@ class Synapse:
         import psutil
         import random
 
-        return {
+        self.last_vitals = {
             "cpu_percent": round(psutil.cpu_percent(interval=None), 1),
             "ram_percent": round(psutil.virtual_memory().percent, 1),
             "neural_activity": round(random.uniform(0.1, 0.99), 2),
@@ -89,6 +107,12 @@ class Synapse:
             "confidence": round(random.uniform(0.75, 0.99), 2),
             "timestamp": time.time(),
         }
+        for name, provider in self.vitals_providers.items():
+            try:
+                self.last_vitals[name] = provider()
+            except Exception:
+                pass
+        return self.last_vitals
 
     def _append_to_log(self, status: str, detail: str):
         """Maintain a rolling log for the HUD terminal."""
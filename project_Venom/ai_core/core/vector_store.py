@@ -0,0 +1,487 @@
+"""
+VENOM VECTOR STORES
+===================
+Pluggable episodic memory backends. Every backend exposes the subset of the
+Chroma collection API that VenomMemory uses (add / get / query / update /
+delete / count), returning Chroma-shaped results.
+
+- "chroma": chromadb.PersistentClient collection (default).
+- "numpy":  memory-mapped embedding matrix plus columnar JSON sidecars (a
+            checkpoint and an append-only change log), searched with
+            vectorized cosine similarity and optional IVF partitioning. No
+            heavy imports; read-only openers share the matrix through the
+            page cache.
+"""
+
+import abc
+import json
+import os
+import threading
+
+import numpy as np
+
+from .lexicon import HashingEmbedder
+
+
+class VectorStore(abc.ABC):
+    """Interface implemented by memory backends (Chroma collections match it)."""
+
+    @abc.abstractmethod
+    def add(self, ids, documents, metadatas, embeddings=None):
+        """Inserts rows, embedding the documents unless embeddings are given."""
+
+    @abc.abstractmethod
+    def get(self, ids=None, include=None, limit=None, offset=0, where=None):
+        """Rows by id, or a page of the rows matching `where`."""
+
+    @abc.abstractmethod
+    def query(self, query_embeddings=None, query_texts=None, n_results=3, where=None):
+        """Nearest rows per query, with cosine distances."""
+
+    @abc.abstractmethod
+    def update(self, ids, metadatas):
+        """Replaces the metadata of existing rows."""
+
+    @abc.abstractmethod
+    def delete(self, ids):
+        """Removes rows."""
+
+    @abc.abstractmethod
+    def count(self):
+        """Number of live rows."""
+
+
+def hashing_embedding_function(dim=384):
+    """Dependency-free embedding function (list of texts -> list of vectors)."""
+    embedder = HashingEmbedder(dim=dim)
+    return lambda texts: [embedder.embed(text) for text in texts]
+
+
+def open_store(kind, path, **options):
+    """
+    Opens a memory backend. Returns (store, embedding function used for
+    queries, which matches the one the store embeds documents with).
+    """
+    if kind == "numpy":
+        embed_fn = hashing_embedding_function()
+        store = NumpyVectorStore(os.path.join(path, "numpy_index"), embed_fn, **options)
+        return store, embed_fn
+
+    import chromadb
+    from chromadb.utils import embedding_functions
+
+    embed_fn = embedding_functions.DefaultEmbeddingFunction()
+    client = chromadb.PersistentClient(path=path)
+    collection = client.get_or_create_collection(
+        name="venom_episodic",
+        embedding_function=embed_fn,
+        metadata={"hnsw:space": "cosine"},
+    )
+    return collection, embed_fn
+
+
+class NumpyVectorStore(VectorStore):
+    """
+    Append-only embedding matrix in `vectors.bin` (memory-mapped, grown by
+    doubling) with ids, documents and metadata columns in `columns.json`.
+    Deletes are tombstones until compact() rewrites the files.
+
+    Writes append one JSON line per add/update/delete to `columns.log`
+    instead of rewriting the columns; the log is folded into a new
+    `columns.json` checkpoint once it outgrows it (or CHECKPOINT_BYTES), so
+    a write costs O(rows written), amortized. Both files carry a generation
+    number and a log from an older generation is ignored.
+
+    IVF: with `ivf_lists` > 0, once the store holds `ivf_lists * 32` rows the
+    vectors are clustered with k-means and a query only scans the rows of the
+    `nprobe` nearest centroids. New rows join their nearest list.
+    """
+
+    CHECKPOINT_BYTES = 1 << 20  # Smallest log worth folding into a checkpoint
+
+    def __init__(
+        self,
+        path,
+        embed_fn,
+        dtype="float16",
+        ivf_lists=0,
+        nprobe=4,
+        readonly=False,
+    ):
+        self.path = path
+        self.embed_fn = embed_fn
+        self.dtype = np.dtype(dtype)
+        self.ivf_lists = ivf_lists
+        self.nprobe = nprobe
+        self.readonly = readonly
+        self._lock = threading.RLock()
+
+        self.vectors_file = os.path.join(path, "vectors.bin")
+        self.columns_file = os.path.join(path, "columns.json")
+        self.log_file = os.path.join(path, "columns.log")
+        self._columns_mtime = None
+        self.generation = 0
+        self._checkpoint_bytes = 0
+        self._log_offset = 0  # bytes of the log applied (or written)
+        self._log_ready = False  # the log belongs to the current checkpoint
+        self.dim = None
+        self.capacity = 0
+        self._matrix = None
+        self._reset_columns()
+
+        if not readonly:
+            os.makedirs(path, exist_ok=True)
+        self._load()
+
+    # --- Persistence ---
+    def _reset_columns(self):
+        self.ids = []
+        self.documents = []
+        self.metadatas = []
+        self.deleted = np.zeros(0, dtype=bool)
+        self.assignments = np.zeros(0, dtype=np.int32)
+        self.centroids = None
+        self._row_of = {}
+
+    def _load(self):
+        if not os.path.exists(self.columns_file):
+            return
+        with open(self.columns_file, "r", encoding="utf-8") as f:
+            columns = json.load(f)
+        stat = os.stat(self.columns_file)
+        self._columns_mtime = stat.st_mtime_ns
+        self._checkpoint_bytes = stat.st_size
+
+        self.generation = columns.get("generation", 0)
+        self.dim = columns["dim"]
+        self.dtype = np.dtype(columns["dtype"])
+        self.capacity = columns["capacity"]
+        self.ids = columns["ids"]
+        self.documents = columns["documents"]
+        self.metadatas = columns["metadatas"]
+        self.deleted = np.array(columns["deleted"], dtype=bool)
+        self.assignments = np.array(columns.get("assignments") or [], dtype=np.int32)
+        centroids = columns.get("centroids")
+        self.centroids = np.array(centroids, dtype=np.float32) if centroids else None
+        self._row_of = {id_: row for row, id_ in enumerate(self.ids)}
+        self._open_matrix()
+
+        self._log_offset = 0
+        self._log_ready = False
+        self._replay_log()
+
+    def _replay_log(self):
+        """Applies the complete log records past the last applied offset."""
+        try:
+            with open(self.log_file, "rb") as f:
+                f.seek(self._log_offset)
+                tail = f.read()
+        except OSError:
+            return
+        for line in tail[: tail.rfind(b"\n") + 1].split(b"\n")[:-1]:
+            record = json.loads(line)
+            if "op" not in record:
+                if record.get("generation") != self.generation:
+                    return  # left over from before the last checkpoint
+                self._log_ready = True
+            else:
+                self._apply(record)
+            self._log_offset += len(line) + 1
+
+    def _apply(self, record):
+        op = record["op"]
+        if op == "add":
+            self.dim = record["dim"]
+            if record["capacity"] != self.capacity:
+                self.capacity = record["capacity"]
+                self._open_matrix()
+            start = len(self.ids)
+            for offset, id_ in enumerate(record["ids"]):
+                self._row_of[id_] = start + offset
+            self.ids.extend(record["ids"])
+            self.documents.extend(record["documents"])
+            self.metadatas.extend(dict(m) for m in record["metadatas"])
+            added = np.zeros(len(record["ids"]), bool)
+            self.deleted = np.concatenate([self.deleted, added])
+            if "assignments" in record:
+                new = np.array(record["assignments"], dtype=np.int32)
+                self.assignments = np.concatenate([self.assignments, new])
+        elif op == "update":
+            for id_, metadata in zip(record["ids"], record["metadatas"]):
+                row = self._row_of.get(id_)
+                if row is not None:
+                    self.metadatas[row] = dict(metadata)
+        elif op == "delete":
+            for id_ in record["ids"]:
+                row = self._row_of.get(id_)
+                if row is not None:
+                    self.deleted[row] = True
+
+    def _open_matrix(self):
+        if not self.capacity:
+            self._matrix = None
+            return
+        self._matrix = np.memmap(
+            self.vectors_file,
+            dtype=self.dtype,
+            mode="r" if self.readonly else "r+",
+            shape=(self.capacity, self.dim),
+        )
+
+    def _save_columns(self):
+        """Checkpoint: rewrites columns.json and starts an empty log."""
+        self.generation += 1
+        columns = {
+            "generation": self.generation,
+            "dim": self.dim,
+            "dtype": self.dtype.name,
+            "capacity": self.capacity,
+            "ids": self.ids,
+            "documents": self.documents,
+            "metadatas": self.metadatas,
+            "deleted": self.deleted.tolist(),
+            "assignments": self.assignments.tolist(),
+            "centroids": None if self.centroids is None else self.centroids.tolist(),
+        }
+        tmp = f"{self.columns_file}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(columns, f, ensure_ascii=False)
+        os.replace(tmp, self.columns_file)
+        stat = os.stat(self.columns_file)
+        self._columns_mtime = stat.st_mtime_ns
+        self._checkpoint_bytes = stat.st_size
+
+        header = (json.dumps({"generation": self.generation}) + "\n").encode()
+        tmp = f"{self.log_file}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(header)
+        os.replace(tmp, self.log_file)
+        self._log_offset = len(header)
+        self._log_ready = True
+
+    def _persist(self, record):
+        """Appends an applied change to the log, checkpointing when it is due."""
+        if not self._log_ready or self._log_offset > max(
+            self._checkpoint_bytes, self.CHECKPOINT_BYTES
+        ):
+            self._save_columns()
+            return
+        line = (json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8")
+        with open(self.log_file, "ab") as f:
+            f.write(line)
+        self._log_offset += len(line)
+
+    def refresh(self):
+        """
+        Read-only openers pick up the writer's changes: a new checkpoint is
+        reloaded, records appended to the log since are replayed.
+        """
+        try:
+            mtime = os.stat(self.columns_file).st_mtime_ns
+        except OSError:
+            return
+        with self._lock:
+            if mtime != self._columns_mtime:
+                self._load()
+            else:
+                self._replay_log()
+
+    def _grow(self, needed):
+        capacity = max(needed, self.capacity * 2, 64)
+        if self._matrix is not None:
+            self._matrix.flush()
+            del self._matrix
+        with open(self.vectors_file, "ab") as f:
+            f.truncate(capacity * self.dim * self.dtype.itemsize)
+        self.capacity = capacity
+        self._open_matrix()
+
+    # --- Writes ---
+    def _check_writable(self):
+        if self.readonly:
+            raise PermissionError("Vector store opened read-only")
+
+    def add(self, ids, documents, metadatas, embeddings=None):
+        self._check_writable()
+        if embeddings is None:
+            embeddings = self.embed_fn(list(documents))
+        vectors = self._normalize(np.asarray(embeddings, dtype=np.float32))
+
+        with self._lock:
+            self._persist(self._insert(ids, documents, metadatas, vectors))
+
+    def _insert(self, ids, documents, metadatas, vectors):
+        """Writes normalized vectors to the matrix; returns the applied record."""
+        if self.dim is None:
+            self.dim = vectors.shape[1]
+        start = len(self.ids)
+        if start + len(ids) > self.capacity:
+            self._grow(start + len(ids))
+
+        self._matrix[start : start + len(ids)] = vectors.astype(self.dtype)
+        self._matrix.flush()
+        record = {
+            "op": "add",
+            "dim": self.dim,
+            "capacity": self.capacity,
+            "ids": list(ids),
+            "documents": list(documents),
+            "metadatas": [dict(m) for m in metadatas],
+        }
+        if self.centroids is not None:
+            new = np.argmax(vectors @ self.centroids.T, axis=1)
+            record["assignments"] = new.tolist()
+        self._apply(record)
+        return record
+
+    def update(self, ids, metadatas):
+        """Replaces the metadata of existing rows (documents and vectors stay)."""
+        self._check_writable()
+        record = {
+            "op": "update",
+            "ids": list(ids),
+            "metadatas": [dict(m) for m in metadatas],
+        }
+        with self._lock:
+            self._apply(record)
+            self._persist(record)
+
+    def delete(self, ids):
+        self._check_writable()
+        record = {"op": "delete", "ids": list(ids)}
+        with self._lock:
+            self._apply(record)
+            self._persist(record)
+
+    def compact(self):
+        """Rewrites the files without tombstoned rows.
+
+        The IVF centroids are kept; surviving rows are reassigned to them.
+        """
+        self._check_writable()
+        with self._lock:
+            keep = np.flatnonzero(~self.deleted)
+            vectors = np.array(self._matrix[keep]) if len(keep) else None
+            ids = [self.ids[i] for i in keep]
+            documents = [self.documents[i] for i in keep]
+            metadatas = [self.metadatas[i] for i in keep]
+
+            self._matrix = None
+            if os.path.exists(self.vectors_file):
+                os.remove(self.vectors_file)
+            dim, centroids = self.dim, self.centroids
+            self._reset_columns()
+            self.capacity = 0
+            self.dim = dim
+            self.centroids = centroids if vectors is not None else None
+            if vectors is not None:
+                self._insert(ids, documents, metadatas, vectors)
+            self._save_columns()
+
+    # --- Reads ---
+    @staticmethod
+    def _normalize(vectors):
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return vectors / norms
+
+    @staticmethod
+    def _matches(metadata, where):
+        return all(metadata.get(key) == value for key, value in where.items())
+
+    def _live_rows(self, where=None):
+        rows = np.flatnonzero(~self.deleted)
+        if where:
+            rows = np.array(
+                [r for r in rows if self._matches(self.metadatas[r], where)],
+                dtype=np.int64,
+            )
+        return rows
+
+    def count(self):
+        if self.readonly:
+            self.refresh()
+        return int((~self.deleted).sum())
+
+    def get(self, ids=None, include=None, limit=None, offset=0, where=None):
+        if self.readonly:
+            self.refresh()
+        with self._lock:
+            if ids is not None:
+                rows = [self._row_of[i] for i in ids if i in self._row_of]
+                rows = [r for r in rows if not self.deleted[r]]
+            else:
+                rows = list(self._live_rows(where))
+            rows = rows[offset : None if limit is None else offset + limit]
+            result = {
+                "ids": [self.ids[r] for r in rows],
+                "documents": [self.documents[r] for r in rows],
+                "metadatas": [self.metadatas[r] for r in rows],
+            }
+            if include and "embeddings" in include and rows:
+                result["embeddings"] = np.asarray(self._matrix[rows], dtype=np.float32)
+            return result
+
+    def query(self, query_embeddings=None, query_texts=None, n_results=3, where=None):
+        if self.readonly:
+            self.refresh()
+        if query_embeddings is None:
+            query_embeddings = self.embed_fn(list(query_texts))
+        queries = self._normalize(np.asarray(query_embeddings, dtype=np.float32))
+
+        result = {"ids": [], "documents": [], "metadatas": [], "distances": []}
+        with self._lock:
+            self._maybe_build_ivf()
+            rows = self._live_rows(where)
+            for q in queries:
+                candidates = self._probe(q, rows)
+                if len(candidates):
+                    sims = np.asarray(self._matrix[candidates], dtype=np.float32) @ q
+                    k = min(n_results, len(candidates))
+                    top = np.argpartition(-sims, k - 1)[:k]
+                    top = top[np.argsort(-sims[top])]
+                    picked, scores = candidates[top], sims[top]
+                else:
+                    picked, scores = [], []
+                result["ids"].append([self.ids[r] for r in picked])
+                result["documents"].append([self.documents[r] for r in picked])
+                result["metadatas"].append([self.metadatas[r] for r in picked])
+                result["distances"].append([float(1.0 - s) for s in scores])
+        return result
+
+    # --- IVF ---
+    def _maybe_build_ivf(self):
+        if (
+            self.ivf_lists
+            and self.centroids is None
+            and not self.readonly
+            and self.count() >= self.ivf_lists * 32
+        ):
+            self.build_ivf()
+
+    def build_ivf(self, iterations=10, seed=0):
+        """Clusters live rows with spherical k-means into `ivf_lists` lists."""
+        with self._lock:
+            n = len(self.ids)
+            data = np.asarray(self._matrix[:n], dtype=np.float32)
+            live = np.flatnonzero(~self.deleted)
+            rng = np.random.default_rng(seed)
+            centroids = data[rng.choice(live, self.ivf_lists, replace=False)]
+            for _ in range(iterations):
+                assignments = np.argmax(data[live] @ centroids.T, axis=1)
+                for c in range(self.ivf_lists):
+                    members = data[live[assignments == c]]
+                    if len(members):
+                        centroids[c] = members.mean(axis=0)
+                centroids = self._normalize(centroids)
+
+            self.centroids = centroids
+            self.assignments = np.argmax(data @ centroids.T, axis=1).astype(np.int32)
+            if not self.readonly:
+                self._save_columns()
+
+    def _probe(self, q, rows):
+        if self.centroids is None or not len(rows):
+            return rows
+        nearest = np.argsort(-(self.centroids @ q))[: self.nprobe]
+        return rows[np.isin(self.assignments[rows], nearest)]
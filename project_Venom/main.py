@@ -16,6 +16,7 @@ from ai_core.core.logger import logger
 from ai_core.core.event_bus import bus
 from ai_core.core.kernel import VenomKernel
 from ai_core.brain.router import CognitiveRouter
+from ai_core.brain.fast_responder import fast_responder
 from modules.voice import VenomVoice
 from ai_core.core.synapse import synapse
 from ai_core.core.neural_viz import visualizer
@@ -59,6 +60,7 @@ async def interactive_loop():
         pass
 
     router = CognitiveRouter()
+    fast_responder.bind_kernel(kernel)
     voice = VenomVoice()
 
     # Start Kernel Background Tasks
@@ -190,6 +192,7 @@ async def interactive_loop():
             vitals["active_node"] = "MEMORY"
             vitals["intensity"] = 0.6
             synapse.broadcast("RESPONSE", f"Output generated by {source}", vitals)
+            synapse.publish_metrics(router.get_metrics())
             visualizer.generate_frame(
                 "MEMORY", 0.6, float(vitals.get("cpu_percent", 0))
             )
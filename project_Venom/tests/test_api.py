@@ -15,3 +15,10 @@ def test_api_state_endpoint():
     assert response.status_code == 200
     data = response.json()
     assert "status" in data
+
+
+def test_api_metrics_endpoint():
+    response = client.get("/api/metrics")
+    assert response.status_code == 200
+    data = response.json()
+    assert "metrics" in data
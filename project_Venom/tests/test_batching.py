@@ -0,0 +1,120 @@
+import asyncio
+
+from ai_core.brain.system_brain import VenomBrain
+from ai_core.core.accelerator import ResponseAccelerator
+from ai_core.core.circuit_breaker import backend_health
+
+
+def test_batch_flushes_on_size_and_resolves_each_caller():
+    accelerator = ResponseAccelerator()
+    accelerator.batch_size = 3
+    accelerator.batch_timeout = 60
+    calls = []
+
+    async def handler(queries):
+        calls.append(len(queries))
+        return [
+            q["prompt"] * 2 if q["prompt"] != "x" else ValueError("x") for q in queries
+        ]
+
+    accelerator.register_batch_handler("echo", handler)
+
+    async def scenario():
+        return await asyncio.gather(
+            *(
+                accelerator.add_to_batch({"backend": "echo", "prompt": p})
+                for p in "abx"
+            ),
+            return_exceptions=True,
+        )
+
+    results = asyncio.run(scenario())
+    assert calls == [3]
+    assert results[:2] == ["aa", "bb"] and isinstance(results[2], ValueError)
+
+
+def test_batch_flushes_on_deadline():
+    accelerator = ResponseAccelerator()
+    accelerator.batch_timeout = 0.05
+
+    async def handler(queries):
+        return [len(queries)] * len(queries)
+
+    accelerator.register_batch_handler("count", handler)
+    result = asyncio.run(accelerator.add_to_batch({"backend": "count"}))
+    assert result == 1
+    assert accelerator.get_batch_stats()["pending"] == 0
+
+
+def test_short_handler_result_fails_the_leftover_callers():
+    accelerator = ResponseAccelerator()
+    accelerator.batch_size = 3
+    accelerator.batch_timeout = 60
+
+    async def handler(queries):
+        return ["only one"]
+
+    accelerator.register_batch_handler("short", handler)
+
+    async def scenario():
+        return await asyncio.wait_for(
+            asyncio.gather(
+                *(accelerator.add_to_batch({"backend": "short"}) for _ in range(3)),
+                return_exceptions=True,
+            ),
+            timeout=1,
+        )
+
+    results = asyncio.run(scenario())
+    assert results[0] == "only one"
+    assert all(isinstance(r, RuntimeError) for r in results[1:])
+    assert accelerator.get_batch_stats()["failed"] == 2
+
+
+def test_cancelled_caller_does_not_fail_the_rest_of_its_batch():
+    accelerator = ResponseAccelerator()
+    accelerator.batch_size = 3
+    accelerator.batch_timeout = 60
+
+    async def handler(queries):
+        await asyncio.sleep(0.05)
+        return [q["prompt"].upper() for q in queries]
+
+    accelerator.register_batch_handler("b", handler)
+
+    async def scenario():
+        callers = [
+            asyncio.create_task(accelerator.add_to_batch({"backend": "b", "prompt": p}))
+            for p in "abc"
+        ]
+        await asyncio.sleep(0.01)
+        callers[2].cancel()  # the caller whose query filled the batch
+        return await asyncio.gather(*callers, return_exceptions=True)
+
+    results = asyncio.run(scenario())
+    assert results[:2] == ["A", "B"]
+    assert isinstance(results[2], asyncio.CancelledError)
+    assert "failed" not in accelerator.get_batch_stats()
+    assert not accelerator._flush_tasks
+
+
+def test_batched_completions_skip_open_circuits_and_fail_over():
+    brain = VenomBrain()
+    for _ in range(10):
+        backend_health.breaker("ollama:batch-open").record_failure()
+    calls = []
+
+    async def fake_ollama(model_name, prompt, system_instruction, session_id=None):
+        calls.append(model_name)
+        if model_name == "batch-dead":
+            raise ConnectionError("model crashed")
+        yield f"{model_name}: {prompt}"
+
+    brain._ollama_stream = fake_ollama
+    candidates = ["ollama:batch-open", "ollama:batch-dead", "ollama:batch-alive"]
+    queries = [{"prompt": "one"}, {"prompt": "two"}]
+
+    results = asyncio.run(brain._run_batch(candidates, queries))
+    assert results == ["batch-alive: one", "batch-alive: two"]
+    assert "batch-open" not in calls
+    assert calls.count("batch-dead") == 2
@@ -0,0 +1,19 @@
+import asyncio
+
+from ai_core.bench.harness import benchmark, percentiles
+
+
+def test_percentiles_in_milliseconds():
+    report = percentiles([0.001 * i for i in range(1, 101)])
+    assert report["p50"] == 50.5 and report["p99"] > report["p95"]
+    assert percentiles([]) == {"p50": None, "p95": None, "p99": None}
+
+
+def test_brain_benchmark_runs_offline_against_stub():
+    report = asyncio.run(
+        benchmark(sessions=2, turns=2, ttft=0.01, tokens_per_sec=1000, tokens=5)
+    )
+    assert report["requests"] == 4 and report["errors"] == 0
+    assert report["stub_requests"] == 4
+    assert report["ttft_ms"]["p50"] is not None
+    assert report["inter_token_ms"]["p95"] is not None
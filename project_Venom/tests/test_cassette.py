@@ -0,0 +1,58 @@
+import asyncio
+
+from ai_core.brain import system_brain
+from ai_core.brain.cassette import Cassette
+from ai_core.core.config import config
+
+
+async def _chunks():
+    yield "Hello "
+    await asyncio.sleep(0.02)
+    yield "world"
+
+
+def test_record_then_replay_round_trip(tmp_path):
+    path = str(tmp_path / "brain.jsonl")
+    recorder = Cassette(path, mode="record")
+
+    async def record():
+        stream = recorder.record(
+            _chunks(), "hi", "core", trace={"model": "ollama:phi3"}
+        )
+        return [text async for text in stream]
+
+    assert asyncio.run(record()) == ["Hello ", "world"]
+
+    player = Cassette(path, mode="replay", speed=0)
+    entry = player.lookup("hi", "core")
+    assert entry["model"] == "ollama:phi3"
+    assert entry["chunks"][1][0] >= 0.02
+
+    async def replay():
+        return [text async for text in player.replay(entry)]
+
+    assert asyncio.run(replay()) == ["Hello ", "world"]
+    assert player.lookup("hi", "other") is None
+    assert player.get_stats()["misses"] == 1
+
+
+def test_fallback_streams_are_not_recorded(tmp_path, monkeypatch):
+    path = tmp_path / "brain.jsonl"
+    monkeypatch.setattr(config, "BRAIN_CASSETTE_MODE", "record")
+    monkeypatch.setattr(config, "BRAIN_CASSETTE_PATH", str(path))
+    cassette = system_brain.VenomBrain().cassette
+
+    async def foggy():
+        yield "Half an answer"
+        yield system_brain.INTERRUPTED_TEXT
+
+    async def record(stream, prompt):
+        return [text async for text in cassette.record(stream, prompt)]
+
+    asyncio.run(record(foggy(), "hi"))
+    assert not path.exists()
+    assert cassette.get_stats()["rejected"] == 1
+
+    asyncio.run(record(_chunks(), "hi"))
+    assert cassette.get_stats()["recorded"] == 1
+    assert len(path.read_text().splitlines()) == 1
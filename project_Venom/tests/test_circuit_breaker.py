@@ -0,0 +1,53 @@
+import asyncio
+
+from ai_core.brain import system_brain
+from ai_core.core.circuit_breaker import CircuitBreaker, backend_health
+
+
+def test_breaker_opens_on_failure_rate_and_recovers():
+    breaker = CircuitBreaker("test", failure_threshold=0.5, min_calls=2, cooldown=0)
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.CLOSED
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+
+    # Cooldown elapsed: one trial call is let through
+    assert breaker.allow()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_open_breaker_rejects_calls_during_cooldown():
+    breaker = CircuitBreaker("test", min_calls=1, cooldown=60)
+    breaker.record_failure()
+    assert not breaker.allow()
+
+
+def test_released_trial_lets_the_next_call_through():
+    breaker = CircuitBreaker("test", min_calls=1, cooldown=0)
+    breaker.record_failure()
+    breaker.cooldown = 60
+    breaker.half_open()
+
+    assert breaker.allow()
+    assert not breaker.allow()  # trial in flight
+    breaker.release_trial()
+    assert breaker.allow()
+
+
+def test_admission_rejection_hands_back_the_trial(monkeypatch):
+    brain = system_brain.VenomBrain()
+    breaker = backend_health.breaker("ollama:trial-test")
+    breaker.record_failure()
+    breaker.record_failure()
+    breaker.record_failure()
+    breaker.half_open()
+
+    async def reject(backend, urgency):
+        return False
+
+    monkeypatch.setattr(system_brain.admission, "acquire", reject)
+    assert asyncio.run(brain._admit("ollama:trial-test", "STANDARD")) is None
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert breaker.allow()
@@ -0,0 +1,100 @@
+import asyncio
+
+import pytest
+
+from ai_core.brain.brain_cloud import CloudBrain
+
+
+class FakeChunk:
+    def __init__(self, text):
+        self.text = text
+
+
+class FakeResponse:
+    def __init__(self, history, chunks, delays):
+        self.history = history
+        self.chunks = chunks
+        self.delays = delays
+
+    async def __aiter__(self):
+        for text, delay in zip(self.chunks, self.delays):
+            await asyncio.sleep(delay)
+            yield FakeChunk(text)
+        self.history.append({"role": "model", "parts": "".join(self.chunks)})
+
+
+class FakeChat:
+    """Mimics the SDK: the turn lands in the history as it is sent."""
+
+    def __init__(self, model, history):
+        self.model = model
+        self.history = history
+
+    async def send_message_async(self, message, stream=False):
+        self.history.append({"role": "user", "parts": message})
+        return FakeResponse(self.history, self.model.chunks, self.model.delays)
+
+
+class FakeModel:
+    def __init__(self, chunks, delays):
+        self.chunks = chunks
+        self.delays = delays
+
+    def start_chat(self, history):
+        return FakeChat(self, list(history))
+
+
+def _brain(chunks, delays):
+    brain = CloudBrain.__new__(CloudBrain)
+    brain.model = FakeModel(chunks, delays)
+    brain.chat = brain.model.start_chat(history=[{"role": "user", "parts": "old"}])
+    brain._chat_lock = asyncio.Lock()
+    return brain
+
+
+def test_completed_chat_turn_is_kept():
+    brain = _brain(["Hello", " there"], [0, 0])
+
+    async def scenario():
+        return [text async for text in brain.think_stream("hi", use_chat=True)]
+
+    assert asyncio.run(scenario()) == ["Hello", " there"]
+    assert len(brain.chat.history) == 3
+
+
+def test_cancel_mid_stream_rolls_back_the_chat_history():
+    brain = _brain(["Hello", " there"], [0, 10])
+    received = []
+
+    async def consume():
+        async for text in brain.think_stream("hi", use_chat=True):
+            received.append(text)
+
+    async def scenario():
+        task = asyncio.create_task(consume())
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        # The lock is free again for the next turn
+        assert not brain._chat_lock.locked()
+
+    asyncio.run(scenario())
+    assert received == ["Hello"]
+    assert brain.chat.history == [{"role": "user", "parts": "old"}]
+
+
+def test_chunk_timeout_raises_and_rolls_back():
+    brain = _brain(["Hello", " there"], [0, 10])
+
+    async def scenario():
+        received = []
+        with pytest.raises(asyncio.TimeoutError):
+            async for text in brain.think_stream("hi", use_chat=True, timeout=0.05):
+                received.append(text)
+        return received
+
+    assert asyncio.run(scenario()) == ["Hello"]
+    assert brain.chat.history == [{"role": "user", "parts": "old"}]
+    # think_complex reports the timeout as a failed thought
+    assert asyncio.run(brain.think_complex("hi", use_chat=True, timeout=0.05)) is None
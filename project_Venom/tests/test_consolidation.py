@@ -0,0 +1,159 @@
+import asyncio
+import threading
+from collections import Counter
+
+from ai_core.core import consolidation
+from ai_core.core.accelerator import ResponseAccelerator
+from ai_core.core.consolidation import (
+    MemoryConsolidator,
+    extractive_summary,
+    loop_summarizer,
+)
+from ai_core.core.lexicon import IDFTable
+from ai_core.core.vector_store import NumpyVectorStore, hashing_embedding_function
+
+DAY = 86400.0
+
+
+class _Memory:
+    def __init__(self, path):
+        self.collection = NumpyVectorStore(str(path), hashing_embedding_function())
+        self.accesses = Counter()
+
+    def flush(self):
+        pass
+
+    def take_access_counts(self):
+        counts, self.accesses = self.accesses, Counter()
+        return counts
+
+    def add(self, id_, text, timestamp, role="user"):
+        self.collection.add(
+            [id_], [text], [{"role": role, "timestamp": timestamp, "mood": "neutral"}]
+        )
+
+
+def test_duplicates_merge_into_newest(tmp_path):
+    memory = _Memory(tmp_path)
+    now = 10 * DAY
+    memory.add("a", "open chrome", now - 30)
+    memory.add("b", "open chrome", now - 20)
+    memory.add("c", "open chrome", now - 10, role="venom")
+    memory.add("d", "explain the circuit breaker", now - 5)
+
+    report = MemoryConsolidator(memory).run(now=now)
+
+    assert report["merged"] == 1
+    assert sorted(memory.collection.get()["ids"]) == ["b", "c", "d"]
+    assert memory.collection.get(ids=["b"])["metadatas"][0]["count"] == 2
+
+
+def test_old_spans_summarized_and_stale_entries_expired(tmp_path):
+    memory = _Memory(tmp_path)
+    now = 100 * DAY
+    topics = ["python decorators", "circuit breakers", "rate limits", "vector search"]
+    for i, topic in enumerate(topics):
+        memory.add(f"s{i}", f"We discussed {topic} at length.", now - 2 * DAY + i * 60)
+    memory.add("stale", "remind me about the dentist", now - 40 * DAY)
+    memory.add("kept", "my cat is called Nyx", now - 40 * DAY - 3 * 3600)
+    memory.accesses["kept"] = 2
+
+    consolidator = MemoryConsolidator(memory, min_span=4)
+    report = consolidator.run(now=now)
+
+    assert report["summarized"] == 4 and report["summaries"] == 1
+    assert report["expired"] == 1
+    remaining = memory.collection.get()
+    roles = [m["role"] for m in remaining["metadatas"]]
+    assert roles.count("summary") == 1
+    assert "stale" not in remaining["ids"] and "kept" in remaining["ids"]
+    assert consolidator.get_stats()["runs"] == 1
+
+
+def test_deleted_entries_leave_the_idf_table(tmp_path, monkeypatch):
+    idf = IDFTable()
+    monkeypatch.setattr(consolidation, "idf_table", idf)
+    memory = _Memory(tmp_path)
+    now = 100 * DAY
+    texts = {
+        "a": "open chrome",
+        "b": "open chrome",
+        "stale": "remind me about the dentist",
+        "kept": "my cat is called Nyx",
+    }
+    memory.add("a", texts["a"], now - 30)
+    memory.add("b", texts["b"], now - 20)
+    memory.add("stale", texts["stale"], now - 40 * DAY)
+    memory.add("kept", texts["kept"], now - 40 * DAY - 3 * 3600)
+    memory.accesses["kept"] = 2
+    idf.add_documents(texts.values())
+
+    report = MemoryConsolidator(memory).run(now=now)
+
+    assert report["merged"] == 1 and report["expired"] == 1
+    assert idf.doc_count == 2
+    assert "dentist" not in idf.doc_freq
+    assert idf.doc_freq["chrome"] == 1
+
+
+def test_pass_without_removals_does_not_compact(tmp_path):
+    memory = _Memory(tmp_path)
+    now = 10 * DAY
+    memory.add("a", "open chrome", now - 30)
+    memory.add("b", "explain the circuit breaker", now - 20)
+    compactions = []
+    memory.collection.compact = lambda: compactions.append(1)
+
+    consolidator = MemoryConsolidator(memory)
+    consolidator.run(now=now)
+    assert compactions == []
+
+    memory.add("c", "open chrome", now - 10)
+    assert consolidator.run(now=now)["merged"] == 1
+    assert compactions == [1]
+
+
+def test_extractive_summary_keeps_original_order():
+    sentences = ["Alpha ran tests.", "Beta fixed bugs.", "Gamma shipped code."]
+    summary = extractive_summary([" ".join(sentences[:2]), sentences[2]], 2)
+    picked = [s for s in sentences if s in summary]
+    assert len(picked) == 2
+    assert summary == " ".join(picked)
+
+
+def test_loop_summarizer_batches_spans_on_the_event_loop():
+    accelerator = ResponseAccelerator()
+    accelerator.batch_size = 3
+    accelerator.batch_timeout = 60
+    batches = []
+
+    async def handler(queries):
+        batches.append(len(queries))
+        return [
+            ValueError("model down") if q["prompt"] == "c." else f"sum({q['prompt']})"
+            for q in queries
+        ]
+
+    accelerator.register_batch_handler("summaries", handler)
+
+    async def summarize(texts):
+        return await accelerator.add_to_batch(
+            {"backend": "summaries", "prompt": " ".join(texts)}
+        )
+
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    summarizer = loop_summarizer(summarize, loop, timeout=5)
+    try:
+        summaries = summarizer([["a.", "b."], ["c."], ["d."]])
+    finally:
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+    assert batches == [3]
+    # The failed span falls back to an extractive summary
+    assert summaries == ["sum(a. b.)", "c.", "sum(d.)"]
+    # Without a running loop every span is summarized extractively
+    assert summarizer([["One thing."]]) == ["One thing."]
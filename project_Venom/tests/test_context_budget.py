@@ -0,0 +1,74 @@
+import time
+
+from ai_core.core.context_budget import (
+    ContextBudgeter,
+    estimate_tokens,
+    truncate_to_budget,
+)
+from ai_core.core.lexicon import HashingEmbedder
+
+
+def test_estimate_tokens_counts_subwords_and_punctuation():
+    assert estimate_tokens("") == 0
+    assert estimate_tokens("hi there!") == 4
+    assert estimate_tokens("internationalization") == 5
+
+
+def test_pack_prefers_relevant_items_and_keeps_chronology():
+    now = time.time()
+    items = [
+        {
+            "role": "user",
+            "content": "python decorators wrap functions",
+            "timestamp": now - 50,
+        },
+        {
+            "role": "user",
+            "content": "the weather was sunny " * 20,
+            "timestamp": now - 10,
+        },
+        {
+            "role": "venom",
+            "content": "decorators in python use the @ syntax",
+            "timestamp": now - 5,
+        },
+    ]
+    budgeter = ContextBudgeter({"ollama": 30})
+    packed = budgeter.pack("how do python decorators work", items, "ollama:phi3")
+
+    assert [m["content"] for m in packed] == [items[0]["content"], items[2]["content"]]
+    assert budgeter.get_stats()["dropped"] == 1
+
+
+def test_truncate_keeps_newest_lines():
+    text = "\n".join(f"line number {i}" for i in range(100))
+    cut = truncate_to_budget(text, 20)
+    assert cut.endswith("line number 99") and estimate_tokens(cut) <= 20
+
+
+def test_ranking_is_shared_across_backends_and_caps_embedded_text():
+    embedded = []
+
+    class CountingEmbedder(HashingEmbedder):
+        def embed(self, text):
+            embedded.append(text)
+            return super().embed(text)
+
+    now = time.time()
+    items = [
+        {"role": "user", "content": "tea " * 1000, "timestamp": now - 5},
+        {"role": "system_recall", "content": "green tea", "metadata": None},
+    ]
+    budgeter = ContextBudgeter(
+        {"gemini": 4000, "ollama": 10}, embedder=CountingEmbedder(), embed_chars=100
+    )
+    ranked = budgeter.rank("tea", items)
+    budgeter.render("tea", ranked, "gemini", ranked=True)
+    local = budgeter.render("tea", ranked, "ollama", ranked=True)
+
+    assert len(embedded) == 3  # the query and each item, once
+    assert max(len(text) for text in embedded) == 100
+    assert local == "SYSTEM_RECALL: green tea"
+
+    budgeter.rank("coffee", items)  # next turn: the items are cached
+    assert embedded[3:] == ["coffee"]
@@ -0,0 +1,88 @@
+import asyncio
+
+import pytest
+
+from ai_core.brain.fast_responder import fast_responder
+from ai_core.core.accelerator import smart_router
+
+
+def _route(query):
+    return asyncio.run(smart_router.route_query(query))
+
+
+@pytest.mark.parametrize("query", ["hello", "Hey!", "  hi  ", "greetings."])
+def test_bare_greeting_is_answered_locally(query):
+    plan = _route(query)
+    assert (plan["route"], plan["type"]) == ("fast_response", "greeting")
+    assert fast_responder.respond("greeting", query)
+
+
+@pytest.mark.parametrize(
+    "query, route, intent",
+    [
+        ("hi play despacito", "media_controller", "media"),
+        ("hello, calculate 2+2", "analytical_engine", "math"),
+        ("hey what time is it", "fast_response", "time_query"),
+    ],
+)
+def test_greeting_prefix_keeps_the_real_intent(query, route, intent):
+    plan = _route(query)
+    assert (plan["route"], plan["type"]) == (route, intent)
+
+
+def test_greeting_with_a_command_goes_to_the_organ_chain():
+    plan = _route("hey open chrome")
+    assert plan["route"] != "fast_response"
+    assert fast_responder.respond("greeting", "hey open chrome") is None
+    assert fast_responder.respond("time_query", "hey what time is it").startswith(
+        "It's"
+    )
+
+
+@pytest.mark.parametrize(
+    "query, intent",
+    [
+        ("what time is it?", "time_query"),
+        ("tell me the time please", "time_query"),
+        ("status", "status"),
+        ("system status report", "status"),
+        ("how are you doing today?", "status"),
+    ],
+)
+def test_whole_utterance_intents_are_answered_locally(query, intent):
+    plan = _route(query)
+    assert (plan["route"], plan["type"]) == ("fast_response", intent)
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "how are you handling errors in this code",
+        "health check of my website",
+        "show me the time series plot",
+        "what time is it in tokyo",
+        "time complexity of quicksort",
+    ],
+)
+def test_intent_words_inside_a_longer_question_reach_the_brain(query):
+    assert _route(query)["route"] != "fast_response"
+
+
+@pytest.mark.parametrize(
+    "query", ["what's the date?", "what is today's date", "hey, what day is it"]
+)
+def test_date_question_is_answered_locally(query):
+    plan = _route(query)
+    assert (plan["route"], plan["type"]) == ("fast_response", "date_query")
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "what is the date of the french revolution",
+        "what's the date python 3 was released",
+        "what day is christmas this year",
+    ],
+)
+def test_historical_date_questions_reach_the_brain(query):
+    assert _route(query)["route"] != "fast_response"
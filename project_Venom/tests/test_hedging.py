@@ -0,0 +1,92 @@
+import asyncio
+
+import pytest
+
+from ai_core.brain.system_brain import RESUME_INSTRUCTION, VenomBrain
+from ai_core.core.config import config
+
+
+def _backend(name, closed, delay):
+    async def stream():
+        try:
+            await asyncio.sleep(delay)
+            yield f"{name} answer"
+        finally:
+            closed.append(name)
+
+    return stream()
+
+
+def test_cancelled_hedged_race_closes_every_contender():
+    brain = VenomBrain()
+    closed = []
+
+    async def scenario():
+        race = asyncio.create_task(
+            brain._race(
+                _backend("cloud", closed, 10),
+                lambda: _backend("local", closed, 10),
+                hedge_delay=0.01,
+            )
+        )
+        await asyncio.sleep(0.05)
+        race.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await race
+        # Closed by the race itself, not by event loop shutdown
+        assert sorted(closed) == ["cloud", "local"]
+
+    asyncio.run(scenario())
+    assert brain.hedge_stats["hedged"] == 1
+
+
+def test_hedge_winner_closes_the_loser():
+    brain = VenomBrain()
+    closed = []
+
+    async def scenario():
+        winner, index = await brain._race(
+            _backend("cloud", closed, 10),
+            lambda: _backend("local", closed, 0.01),
+            hedge_delay=0.01,
+        )
+        assert index == 1
+        assert closed == ["cloud"]
+        return [text async for text in winner.stream()]
+
+    assert asyncio.run(scenario()) == ["local answer"]
+    assert brain.hedge_stats["backup_wins"] == 1
+
+
+def test_mid_stream_failure_resumes_on_the_backup_backend(monkeypatch):
+    monkeypatch.setattr(config, "ENABLE_HEDGING", False)
+    brain = VenomBrain()
+    brain.response_cache = None
+    brain._plan_backends = lambda urgency, complexity=None: (
+        ["resume-cloud"],
+        ["resume-local"],
+        True,
+    )
+    requests = []
+
+    async def fake_gemini(model_name, contents, system_instruction=""):
+        yield "Paris is the capital"
+        raise ConnectionError("stream reset")
+
+    async def fake_ollama(model_name, prompt, system_instruction, session_id=None):
+        requests.append(prompt)
+        yield "the capital of France."
+
+    brain._gemini_stream = fake_gemini
+    brain._ollama_stream = fake_ollama
+
+    async def answer():
+        stream = brain.generate_stream("capital of France?")
+        return "".join([text async for text in stream])
+
+    assert asyncio.run(answer()) == "Paris is the capital of France."
+    assert requests == [
+        "capital of France?\n"
+        + RESUME_INSTRUCTION.format(partial="Paris is the capital")
+    ]
+    assert brain.hedge_stats["resumed"] == 1
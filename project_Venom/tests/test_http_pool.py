@@ -0,0 +1,54 @@
+import asyncio
+import threading
+
+from ai_core.core.performance import HTTPSessionPool
+
+
+def test_session_is_shared_within_a_loop():
+    pool = HTTPSessionPool()
+
+    async def scenario():
+        first, second = await pool.acquire(), await pool.acquire()
+        await pool.close_all()
+        return first, second
+
+    first, second = asyncio.run(scenario())
+    assert first is second and first.closed
+
+
+def test_new_loop_closes_the_previous_session():
+    pool = HTTPSessionPool()
+    old = asyncio.run(pool.acquire())
+    assert not old.closed
+
+    async def scenario():
+        session = await pool.acquire()
+        await pool.close_all()
+        return session
+
+    new = asyncio.run(scenario())
+    assert new is not old
+    assert old.closed
+
+
+def test_session_of_a_running_loop_is_closed_on_that_loop():
+    pool = HTTPSessionPool()
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    try:
+        old = asyncio.run_coroutine_threadsafe(pool.acquire(), loop).result(5)
+
+        async def scenario():
+            session = await pool.acquire()
+            await pool.close_all()
+            return session
+
+        assert asyncio.run(scenario()) is not old
+        # The close was scheduled on the owning loop
+        asyncio.run_coroutine_threadsafe(asyncio.sleep(0.05), loop).result(5)
+        assert old.closed
+    finally:
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(5)
+        loop.close()
@@ -0,0 +1,26 @@
+from ai_core.core.lexicon import IDFTable, tokenize
+
+
+def test_tokenize_keeps_file_names():
+    tokens = tokenize("Open  the venom_log.txt file!!")
+    assert tokens.normalized == "Open the venom_log.txt file!!"
+    assert tokens.word_count == 4
+    assert "venom_log.txt" in tokens.terms
+
+
+def test_idf_ranks_rare_terms_first():
+    idf = IDFTable()
+    idf.add_documents(["open chrome", "open chrome now", "open the report"])
+    assert idf.rank(["open", "chrome", "report"], top_k=2) == ["report", "chrome"]
+
+
+def test_removed_documents_no_longer_count():
+    idf = IDFTable()
+    idf.add_documents(["open chrome", "open chrome now", "open the report"])
+    idf.remove_documents(["open chrome now", "open the report"])
+
+    assert idf.stats() == {"documents": 1, "vocabulary": 2}
+    assert idf.doc_freq == {"open": 1, "chrome": 1}
+    fresh = IDFTable()
+    fresh.add_document("open chrome")
+    assert idf.idf("report") == fresh.idf("report")
@@ -0,0 +1,59 @@
+import asyncio
+
+from ai_core.brain.brain_local import LocalBrain
+from ai_core.brain.local_sessions import LocalSessions
+from ai_core.brain.system_brain import VenomBrain
+
+
+def test_warmth_is_per_model_and_system_instruction():
+    sessions = LocalSessions()
+    sessions.update("s1", "phi3", "core", [1, 2, 3])
+
+    assert sessions.is_warm("s1", "phi3", "core")
+    assert not sessions.is_warm("s1", "llama3", "core")
+    assert not sessions.is_warm("s1", "phi3", "other")
+    assert not sessions.is_warm("s2", "phi3", "core")
+
+
+def test_local_brain_reuses_the_session_when_context_changes():
+    brain = LocalBrain(model_name="phi3")
+    first = brain._payload("hi", "user likes tea", "s1", False)
+    assert "context" not in first
+    assert first["prompt"].startswith(f"System: {brain.system_prompt}")
+    brain.sessions.update("s1", "phi3", brain.system_prompt, [1, 2, 3])
+
+    follow_up = brain._payload("and coffee?", "user asked about tea", "s1", False)
+    assert follow_up["context"] == [1, 2, 3]
+    assert (
+        follow_up["prompt"]
+        == "Context: user asked about tea\nUser: and coffee?\nVenom:"
+    )
+
+    brain.system_prompt = "You are someone else."
+    assert "context" not in brain._payload("and coffee?", "", "s1", False)
+
+
+def test_only_the_warm_model_gets_the_short_prompt():
+    brain = VenomBrain()
+    brain.local_sessions.update("s1", "warm", "core", [1, 2, 3])
+    requests = {}
+
+    async def fake_ollama(model_name, prompt, system_instruction, session_id=None):
+        requests[model_name] = prompt
+        yield "ok"
+
+    brain._ollama_stream = fake_ollama
+
+    async def answer(model_name):
+        stream = brain._local_stream(
+            "full prompt",
+            "core",
+            [model_name],
+            session_id="s1",
+            warm_prompt="warm prompt",
+        )
+        return "".join([text async for text in stream])
+
+    assert asyncio.run(answer("warm")) == "ok"
+    assert asyncio.run(answer("cold")) == "ok"
+    assert requests == {"warm": "warm prompt", "cold": "full prompt"}
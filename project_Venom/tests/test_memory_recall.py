@@ -0,0 +1,99 @@
+import asyncio
+import time
+
+import numpy as np
+
+from ai_core.core import memory as memory_module
+from ai_core.core.config import config
+from ai_core.core.vector_store import hashing_embedding_function
+
+DOCUMENTS = {
+    "a": "the user drinks green tea every morning",
+    "b": "venom_log.txt holds the crash report",
+    "c": "the user prefers dark mode in every editor",
+}
+
+
+class StubCollection:
+    """Brute-force stand-in for the episodic store."""
+
+    def __init__(self, embed_fn):
+        now = time.time()
+        self.ids = list(DOCUMENTS)
+        self.documents = list(DOCUMENTS.values())
+        self.metadatas = [
+            {"role": "user", "mood": "neutral", "timestamp": now - 60} for _ in self.ids
+        ]
+        vectors = np.asarray(embed_fn(self.documents), dtype=np.float32)
+        self.vectors = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+    def get(self, ids=None, include=(), limit=None, offset=0):
+        rows = [i for i, id_ in enumerate(self.ids) if ids is None or id_ in ids]
+        rows = rows[offset : offset + limit if limit else None]
+        return {
+            "ids": [self.ids[i] for i in rows],
+            "documents": [self.documents[i] for i in rows],
+            "metadatas": [self.metadatas[i] for i in rows],
+            "embeddings": [self.vectors[i] for i in rows],
+        }
+
+    def query(self, query_embeddings, n_results):
+        query = np.asarray(query_embeddings[0], dtype=np.float32)
+        similarities = self.vectors @ (query / np.linalg.norm(query))
+        rows = np.argsort(-similarities)[:n_results]
+        return {
+            "ids": [[self.ids[i] for i in rows]],
+            "documents": [[self.documents[i] for i in rows]],
+            "metadatas": [[self.metadatas[i] for i in rows]],
+            "distances": [[1.0 - float(similarities[i]) for i in rows]],
+        }
+
+
+def _memory(monkeypatch):
+    embed_fn = hashing_embedding_function()
+    calls = []
+
+    def counting_embed(texts):
+        calls.extend(texts)
+        return embed_fn(texts)
+
+    monkeypatch.setattr(config, "MEMORY_READONLY", True)
+    monkeypatch.setattr(config, "MEMORY_EMBED_CACHE_SIZE", 2)
+    monkeypatch.setattr(
+        memory_module,
+        "open_store",
+        lambda *args, **kwargs: (StubCollection(embed_fn), counting_embed),
+    )
+    return memory_module.VenomMemory(), calls
+
+
+def test_query_embeddings_are_cached_and_evicted(monkeypatch):
+    memory, calls = _memory(monkeypatch)
+
+    assert memory.recall("green tea", include_recent=False)[0]["content"] == (
+        DOCUMENTS["a"]
+    )
+    memory.recall(" green tea ", include_recent=False)
+    assert calls == ["green tea"]
+
+    memory.recall("crash report", include_recent=False)
+    memory.recall("dark mode", include_recent=False)  # evicts "green tea"
+    memory.recall("green tea", include_recent=False)
+
+    stats = memory.get_stats()
+    assert calls == ["green tea", "crash report", "dark mode", "green tea"]
+    assert stats["recalls"] == 5
+    assert stats["embed_hits"] == 1
+    assert stats["embed_misses"] == 4
+    assert stats["embed_evictions"] == 2
+    assert "recall_p50_ms" in stats
+
+
+def test_arecall_matches_recall(monkeypatch):
+    memory, _ = _memory(monkeypatch)
+    memory.working_memory.append({"role": "user", "content": "hello"})
+
+    for query in ("green tea", "venom_log", "editor settings"):
+        expected = memory.recall(query, n_results=2)
+        assert asyncio.run(memory.arecall(query, n_results=2)) == expected
+    assert memory.get_stats()["recalls"] == 6
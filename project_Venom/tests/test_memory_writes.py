@@ -0,0 +1,80 @@
+import asyncio
+import time
+
+import pytest
+
+from ai_core.core import memory as memory_module
+from ai_core.core.config import config
+from ai_core.core.event_bus import EventBus
+
+
+def _wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+@pytest.fixture
+def make_memory(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, "MEMORY_BACKEND", "numpy")
+    monkeypatch.setattr(config, "MEMORY_DIR", str(tmp_path))
+    monkeypatch.setattr(config, "MEMORY_READONLY", False)
+    monkeypatch.setattr(config, "MEMORY_CLEANUP_INTERVAL", 0)
+    monkeypatch.setattr(memory_module, "bus", EventBus())
+    memories = []
+
+    def make(batch_size=100, flush_interval=60.0):
+        monkeypatch.setattr(config, "MEMORY_LTM_BATCH_SIZE", batch_size)
+        monkeypatch.setattr(config, "MEMORY_FLUSH_INTERVAL", flush_interval)
+        memory = memory_module.VenomMemory()
+        memories.append(memory)
+        return memory
+
+    yield make
+    for memory in memories:
+        memory.close()
+
+
+def test_full_batch_is_written_in_one_add(make_memory):
+    memory = make_memory(batch_size=3)
+    for i in range(3):
+        memory.store(f"batched memory {i}")
+
+    # Stats are updated right after the add lands
+    assert _wait_for(lambda: memory.get_stats()["pending"] == 0)
+    assert _wait_for(lambda: memory.get_stats()["flushed"] == 3)
+    assert memory.get_stats()["batches"] == 1
+    assert memory.collection.count() == 3
+
+
+def test_partial_batch_is_written_after_the_flush_interval(make_memory):
+    memory = make_memory(flush_interval=0.05)
+    memory.store("a lone memory")
+
+    assert _wait_for(lambda: memory.get_stats()["batches"] == 1)
+    assert memory.collection.count() == 1
+
+
+def test_queued_memories_are_recalled_before_they_are_flushed(make_memory):
+    memory = make_memory()
+    memory.store("the user owns a red bicycle")
+
+    recalled = memory.recall("red bicycle", include_recent=False)
+    assert memory.collection.count() == 0
+    assert [m["content"] for m in recalled] == ["the user owns a red bicycle"]
+
+
+def test_shutdown_flushes_the_queue_and_stops_the_writer(make_memory):
+    memory = make_memory()
+    memory.store("first unsaved memory")
+    memory.store("second unsaved memory")
+
+    asyncio.run(memory_module.bus.emit("SHUTDOWN"))
+    assert memory.collection.count() == 2
+    assert not memory._writer.is_alive()
+
+    memory.store("after shutdown")
+    assert memory.get_stats()["queued"] == 2
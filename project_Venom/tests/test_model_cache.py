@@ -0,0 +1,44 @@
+from ai_core.brain import system_brain
+from ai_core.brain.system_brain import VenomBrain
+
+
+class FakeModel:
+    def __init__(self, model_name, system_instruction=None, generation_config=None):
+        self.model_name = model_name
+        self.system_instruction = system_instruction
+        self.generation_config = generation_config
+
+
+def _brain(monkeypatch, size=8):
+    monkeypatch.setattr(system_brain.genai, "GenerativeModel", FakeModel)
+    brain = VenomBrain()
+    brain.model_cache_size = size
+    return brain
+
+
+def test_handles_are_reused_per_model_and_instruction(monkeypatch):
+    brain = _brain(monkeypatch)
+    core = brain._get_model("flash", "You are Venom.")
+
+    assert brain._get_model("flash", "You are Venom.") is core
+    other = brain._get_model("flash", "You are Venom.\nFocus: Analyze code.")
+    assert other is not core
+    assert other.system_instruction.endswith("Analyze code.")
+    assert brain._get_model("pro", "You are Venom.") is not core
+    assert brain._get_model("flash").system_instruction is None
+
+
+def test_cache_is_lru_bounded_and_config_changes_evict(monkeypatch):
+    brain = _brain(monkeypatch, size=2)
+    first = brain._get_model("flash", "a")
+    brain._get_model("flash", "b")
+    assert brain._get_model("flash", "a") is first  # refreshed
+    brain._get_model("flash", "c")  # evicts "b"
+
+    assert len(brain._model_cache) == 2
+    assert brain._get_model("flash", "a") is first
+
+    brain.set_generation_config(temperature=0.1)
+    rebuilt = brain._get_model("flash", "a")
+    assert rebuilt is not first
+    assert rebuilt.generation_config.temperature == 0.1
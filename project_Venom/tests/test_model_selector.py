@@ -0,0 +1,91 @@
+import asyncio
+
+import pytest
+
+from ai_core.brain import model_selector
+from ai_core.brain.model_selector import ModelSelector
+from ai_core.core.circuit_breaker import CircuitBreaker, backend_health
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(model_selector.time, "perf_counter", clock)
+    return clock
+
+
+def _drive(selector, backend, clock, ttft, duration, chars, fail=False):
+    async def stream():
+        clock.now += ttft
+        yield "x" * (chars // 2)
+        clock.now += duration
+        if fail:
+            raise ConnectionError("dropped")
+        yield "x" * (chars - chars // 2)
+
+    async def consume():
+        return "".join([text async for text in selector.timed(backend, stream())])
+
+    return asyncio.run(consume())
+
+
+def test_priors_rank_unobserved_backends():
+    selector = ModelSelector()
+    # SIMPLE: gemini 1.0 + 60/60 = 2.0s, ollama 0.6 + 60/15 = 4.6s
+    assert selector.order(["ollama:a", "gemini:b"]) == ["gemini:b", "ollama:a"]
+    assert selector.snapshot()["ollama:a"] == {
+        "ttft_ms": 600.0,
+        "tokens_per_sec": 15.0,
+        "error_rate": 0.0,
+        "samples": 0,
+    }
+
+
+def test_timed_streams_update_the_ewma_and_the_order(clock):
+    selector = ModelSelector(alpha=0.5)
+    _drive(selector, "ollama:fast", clock, ttft=0.1, duration=1.0, chars=400)
+
+    stats = selector.snapshot()["ollama:fast"]
+    assert stats["ttft_ms"] == 350.0  # 0.5 * 600 + 0.5 * 100
+    assert stats["tokens_per_sec"] == 57.5  # 0.5 * 15 + 0.5 * 100
+    assert stats["samples"] == 1
+    # Now 0.35 + 60/57.5 = 1.39s beats the 2.0s gemini prior
+    assert selector.order(["gemini:g", "ollama:fast"]) == ["ollama:fast", "gemini:g"]
+
+
+def test_failed_streams_raise_the_error_rate(clock):
+    selector = ModelSelector(alpha=0.5)
+    with pytest.raises(ConnectionError):
+        _drive(selector, "ollama:flaky", clock, 0.1, 0.1, 40, fail=True)
+
+    assert selector.snapshot()["ollama:flaky"]["error_rate"] == 0.5
+    assert selector.order(["ollama:flaky", "ollama:steady"])[0] == "ollama:steady"
+
+
+def test_open_circuits_go_last_and_quality_penalty_applies():
+    selector = ModelSelector()
+    breaker = backend_health.breaker("ollama:selector-open")
+    for _ in range(10):
+        breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+
+    candidates = ["gemini:slow", "ollama:selector-open"]
+    selector._stats("gemini:slow").ttft = 30.0
+    assert selector.order(candidates) == ["gemini:slow", "ollama:selector-open"]
+
+    # COMPLEX: gemini 1 + 800/60 = 14.3s; local 0.6 + 800/100 = 8.6s, x2 = 17.2s
+    selector._stats("ollama:local").tokens_per_sec = 100.0
+    assert selector.order(["ollama:local", "gemini:smart"], "COMPLEX")[0] == (
+        "ollama:local"
+    )
+    assert selector.order(
+        ["ollama:local", "gemini:smart"], "COMPLEX", preferred=("gemini:smart",)
+    ) == ["gemini:smart", "ollama:local"]
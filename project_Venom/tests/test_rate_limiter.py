@@ -0,0 +1,56 @@
+import asyncio
+
+from ai_core.core.rate_limiter import AdmissionController
+
+
+def test_critical_requests_jump_the_queue():
+    async def scenario():
+        # One token up front, then one every 50ms
+        controller = AdmissionController({"gemini": 1200}, burst=1, max_wait=2)
+        order = []
+
+        async def call(name, urgency):
+            assert await controller.acquire("gemini:test", urgency)
+            order.append(name)
+
+        await call("first", "STANDARD")
+        waiters = [
+            asyncio.create_task(call("standard", "STANDARD")),
+            asyncio.create_task(call("critical", "CRITICAL")),
+        ]
+        await asyncio.gather(*waiters)
+        return order, controller.snapshot()["gemini:test"]
+
+    order, stats = asyncio.run(scenario())
+    assert order == ["first", "critical", "standard"]
+    assert stats["queued"] == 2 and stats["queue_depth"] == 0
+
+
+def test_waiters_give_up_after_max_wait():
+    async def scenario():
+        controller = AdmissionController({"gemini": 1}, burst=1, max_wait=0.05)
+        assert await controller.acquire("gemini:test")
+        return await controller.acquire("gemini:test")
+
+    assert asyncio.run(scenario()) is False
+
+
+def test_unlimited_backends_are_not_queued():
+    controller = AdmissionController({"gemini": 60, "ollama": 0})
+    assert asyncio.run(controller.acquire("ollama:phi3"))
+    assert controller.snapshot() == {}
+
+
+def test_average_wait_ignores_rejected_waiters():
+    async def scenario():
+        # One token up front, the next after 100ms
+        controller = AdmissionController({"gemini": 600}, burst=1, max_wait=0.01)
+        assert await controller.acquire("gemini:test")
+        assert not await controller.acquire("gemini:test")  # rejected
+        controller.max_wait = 1.0
+        assert await controller.acquire("gemini:test")
+        return controller.snapshot()["gemini:test"]
+
+    stats = asyncio.run(scenario())
+    assert stats["queued"] == 2 and stats["rejected"] == 1
+    assert stats["avg_wait_ms"] == stats["max_wait_ms"]
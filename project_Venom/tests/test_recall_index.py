@@ -0,0 +1,75 @@
+import time
+
+from ai_core.core.config import config
+from ai_core.core.recall_index import RecallIndex, index_terms
+
+
+def _index():
+    index = RecallIndex()
+    index.add_many(
+        [
+            (
+                "a",
+                "I created a file called venom_log.txt",
+                {"role": "user", "timestamp": 10},
+            ),
+            ("b", "the log rotation runs nightly", {"role": "venom", "timestamp": 20}),
+            (
+                "c",
+                "play some music",
+                {"role": "user", "mood": "happy", "timestamp": 30},
+            ),
+        ]
+    )
+    return index
+
+
+def test_compound_names_are_indexed_by_parts():
+    assert index_terms("venom_log.txt") == ["venom_log.txt", "venom_log", "txt"]
+    assert _index().search("the venom_log file")[0][0] == "a"
+
+
+def test_metadata_filters_and_removal():
+    index = _index()
+    assert index.filter() is None
+    assert index.filter(role="user") == {"a", "c"}
+    assert index.filter(role="user", since=15) == {"c"}
+    assert index.filter(until=20) == {"a", "b"}
+    assert index.search("log", candidates=index.filter(role="venom"))[0][0] == "b"
+
+    index.remove(["a"])
+    assert index.filter(role="user") == {"c"}
+    assert index.search("venom_log") == []
+    assert index.get_stats()["documents"] == 2
+
+
+def test_hybrid_recall_prefers_exact_and_recent(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, "MEMORY_DIR", str(tmp_path))
+    monkeypatch.setattr(config, "MEMORY_BACKEND", "numpy")
+    monkeypatch.setattr(config, "MEMORY_CLEANUP_INTERVAL", 0)
+    from ai_core.core.memory import VenomMemory
+
+    memory = VenomMemory()
+    try:
+        now = time.time()
+        memory.collection.add(
+            ["old", "new", "file"],
+            ["I like green tea", "I like green tea a lot", "saved report_2024.csv"],
+            [
+                {"role": "user", "timestamp": now - 60 * 86400},
+                {"role": "user", "timestamp": now - 60},
+                {"role": "venom", "timestamp": now - 60},
+            ],
+        )
+        memory._rebuild_index()
+
+        hits = memory.recall("green tea", n_results=2, include_recent=False)
+        assert [h["content"] for h in hits][0] == "I like green tea a lot"
+
+        hits = memory.recall("report_2024.csv", n_results=1, include_recent=False)
+        assert hits[0]["content"] == "saved report_2024.csv"
+
+        hits = memory.recall("tea", include_recent=False, where={"role": "venom"})
+        assert [h["metadata"]["role"] for h in hits] == ["venom"]
+    finally:
+        memory.close()
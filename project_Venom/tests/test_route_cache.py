@@ -0,0 +1,82 @@
+import asyncio
+
+import pytest
+
+from ai_core.core.performance import RouteCache
+
+
+def test_route_cache_normalizes_and_expires(monkeypatch):
+    cache = RouteCache(max_size=2)
+    cache.set("What is 2+2?", "4", "Analytical Engine", ttl=60)
+
+    assert cache.get("  what is 2+2 ") == ("4", "Analytical Engine")
+    assert cache.stats()["hits"] == 1
+
+    now = __import__("time").monotonic()
+    monkeypatch.setattr("ai_core.core.performance.time.monotonic", lambda: now + 61)
+    assert cache.get("what is 2+2") is None
+    assert cache.stats()["misses"] == 1
+
+
+def test_route_cache_evicts_lru_and_defers_misses():
+    cache = RouteCache(max_size=2)
+    cache.set("a", 1, "Quantum Cortex", ttl=60)
+    cache.set("b", 2, "Quantum Cortex", ttl=60)
+    cache.get("a")
+    cache.set("c", 3, "Quantum Cortex", ttl=60)
+
+    assert cache.get("b", count_miss=False) is None
+    assert cache.stats()["misses"] == 0
+    cache.record_miss()
+    assert cache.stats()["misses"] == 1
+    assert cache.get("a") == (1, "Quantum Cortex")
+
+
+def _router(module, dispatch):
+    router = module.CognitiveRouter.__new__(module.CognitiveRouter)
+    router.route_cache = RouteCache()
+    router._dispatch = dispatch
+    return router
+
+
+def test_router_caches_only_pure_routes():
+    module = pytest.importorskip("ai_core.brain.router")
+    calls = []
+
+    async def dispatch(prompt, visual_context=None):
+        calls.append(prompt)
+        if prompt == "open chrome":
+            return "Opening chrome", "Kinetic System", False
+        if prompt == "tell me a story":
+            return object(), "Neural Core", True
+        return "4", "Analytical Engine", False
+
+    router = _router(module, dispatch)
+
+    async def run():
+        for prompt in ["2+2", "2+2", "open chrome", "open chrome", "tell me a story"]:
+            await router.process_thought_stream(prompt)
+
+    asyncio.run(run())
+    assert calls == ["2+2", "open chrome", "open chrome", "tell me a story"]
+    stats = router.get_cache_stats()
+    # Only the pure route counts: one miss, one hit.
+    assert (stats["hits"], stats["misses"]) == (1, 1)
+
+
+def test_router_skips_cache_with_visual_context():
+    module = pytest.importorskip("ai_core.brain.router")
+    calls = []
+
+    async def dispatch(prompt, visual_context=None):
+        calls.append(prompt)
+        return "4", "Analytical Engine", False
+
+    router = _router(module, dispatch)
+
+    async def run():
+        await router.process_thought_stream("2+2", visual_context="frame")
+        await router.process_thought_stream("2+2", visual_context="frame")
+
+    asyncio.run(run())
+    assert len(calls) == 2
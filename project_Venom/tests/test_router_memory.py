@@ -0,0 +1,57 @@
+import asyncio
+
+import pytest
+
+from ai_core.brain.system_brain import UNREACHABLE_TEXT, VenomBrain
+
+
+class _Memory:
+    def __init__(self):
+        self.stored = []
+
+    async def arecall(self, prompt):
+        return []
+
+    def store(self, text, role="user"):
+        self.stored.append((role, text))
+
+
+class _Brain:
+    is_fallback = staticmethod(VenomBrain.is_fallback)
+
+    def __init__(self, chunks):
+        self.chunks = chunks
+
+    async def generate_stream(self, prompt, **kwargs):
+        for chunk in self.chunks:
+            yield chunk
+
+
+def test_fallback_detection():
+    assert VenomBrain.is_fallback(UNREACHABLE_TEXT)
+    assert VenomBrain.is_fallback("The answer is\n(Neural link interrupted.)")
+    assert VenomBrain.is_fallback("  ")
+    assert not VenomBrain.is_fallback("Paris is the capital of France.")
+
+
+@pytest.mark.parametrize(
+    "chunks, stored",
+    [
+        (["Paris is ", "the capital."], True),
+        ([UNREACHABLE_TEXT, "\nPlease ensure ..."], False),
+        (["Paris is", "\n(Neural link interrupted.)"], False),
+    ],
+)
+def test_only_real_answers_are_stored(chunks, stored):
+    module = pytest.importorskip("ai_core.brain.router")
+    router = module.CognitiveRouter.__new__(module.CognitiveRouter)
+    router.memory = _Memory()
+    router.brain = _Brain(chunks)
+
+    async def run():
+        return [c async for c in router._brain_stream("capital of France?")]
+
+    assert asyncio.run(run()) == chunks
+    assert bool(router.memory.stored) is stored
+    if stored:
+        assert router.memory.stored[1] == ("venom", "Paris is the capital.")
@@ -0,0 +1,65 @@
+import asyncio
+
+from ai_core.brain.semantic_cache import SemanticCache
+from ai_core.brain.system_brain import VenomBrain
+
+
+def test_near_identical_prompt_hits_within_scope():
+    cache = SemanticCache(threshold=0.9, replay_cps=0)
+    cache.store("Who are you?", "core", "I am Venom.")
+
+    assert cache.lookup("who are you", "core") == "I am Venom."
+    assert cache.lookup("who are you", "other instruction") is None
+    assert cache.lookup("explain python decorators", "core") is None
+
+
+def test_swapped_word_order_misses():
+    cache = SemanticCache(threshold=0.9, replay_cps=0)
+    cache.store("convert 100 usd to eur", "", "92 EUR")
+    cache.store("is python faster than rust", "", "No.")
+
+    assert cache.lookup("convert 100 eur to usd", "") is None
+    assert cache.lookup("is rust faster than python", "") is None
+    assert cache.lookup("Convert 100 USD to EUR?", "") == "92 EUR"
+    assert cache.lookup("is python faster than rust?", "") == "No."
+
+
+def test_time_sensitive_prompts_are_never_cached():
+    cache = SemanticCache()
+    cache.store("what is the weather today", "", "Sunny.")
+    assert cache.lookup("what is the weather today", "") is None
+    assert cache.get_stats()["entries"] == 0
+
+
+def test_eviction_and_replay():
+    cache = SemanticCache(max_size=1, replay_cps=0)
+    cache.store("first question", "", "one")
+    cache.store("second question", "", "two")
+    assert cache.lookup("first question", "") is None
+    assert cache.get_stats()["evictions"] == 1
+
+    async def collect():
+        return [chunk async for chunk in cache.replay("two")]
+
+    assert asyncio.run(collect()) == ["two"]
+
+
+def test_brain_bypasses_the_cache_for_memory_grounded_prompts():
+    brain = VenomBrain()
+    brain.response_cache = SemanticCache(replay_cps=0)
+    brain.response_cache.store("summarize that", "", "cached summary")
+    brain._plan_backends = lambda urgency, complexity=None: ([], ["ctx-model"], False)
+
+    async def fake_ollama(model_name, prompt, system_instruction, session_id=None):
+        yield "live summary"
+
+    brain._ollama_stream = fake_ollama
+
+    async def answer(context):
+        stream = brain.generate_stream("summarize that", context=context)
+        return "".join([text async for text in stream])
+
+    context = [{"role": "user", "content": "we talked about tea"}]
+    assert asyncio.run(answer(None)) == "cached summary"
+    assert asyncio.run(answer(context)) == "live summary"
+    assert brain.response_cache.lookup("summarize that", "") == "cached summary"
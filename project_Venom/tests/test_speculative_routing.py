@@ -0,0 +1,90 @@
+import asyncio
+from collections import deque
+
+import pytest
+
+from ai_core.brain.system_brain import VenomBrain
+from ai_core.core.config import config
+
+PROMPT = "explain how monads work"
+
+
+class _Memory:
+    def __init__(self):
+        self.stored = []
+
+    async def arecall(self, prompt):
+        return []
+
+    def store(self, text, role="user"):
+        self.stored.append((role, text))
+
+
+class _Brain:
+    is_fallback = staticmethod(VenomBrain.is_fallback)
+
+    def __init__(self):
+        self.calls = 0
+        self.closed = False
+
+    async def generate_stream(self, prompt, **kwargs):
+        self.calls += 1
+        try:
+            yield "Monads "
+            await asyncio.sleep(0.05)
+            yield "chain effects."
+        finally:
+            self.closed = True
+
+
+def _router(monkeypatch, local_result):
+    module = pytest.importorskip("ai_core.brain.router")
+    monkeypatch.setattr(config, "SPECULATIVE_ROUTING", True)
+    router = module.CognitiveRouter.__new__(module.CognitiveRouter)
+    router.memory = _Memory()
+    router.brain = _Brain()
+    router.stream_stats = {
+        "speculative_launched": 0,
+        "speculative_cancelled": 0,
+        "speculative_used": 0,
+    }
+    router.ttft_samples = {"speculative": deque(), "sequential": deque()}
+
+    async def local_handlers(prompt, offload=False):
+        assert offload  # a brain request is in flight
+        await asyncio.sleep(0.01)
+        return local_result
+
+    router._local_handlers = local_handlers
+    return router
+
+
+def test_speculative_stream_is_cancelled_when_an_organ_answers(monkeypatch):
+    router = _router(monkeypatch, ("Opening monads.app", "Kinetic System"))
+
+    async def scenario():
+        result = await router._dispatch(PROMPT)
+        # Closed by the router, not by event loop shutdown
+        assert router.brain.closed
+        return result
+
+    result = asyncio.run(scenario())
+    assert result == ("Opening monads.app", "Kinetic System", False)
+    assert router.brain.calls == 1
+    assert router.stream_stats["speculative_cancelled"] == 1
+    assert router.memory.stored == []
+
+
+def test_speculative_stream_is_reused_by_the_neural_core(monkeypatch):
+    router = _router(monkeypatch, (None, None))
+
+    async def scenario():
+        stream, source, is_stream = await router._dispatch(PROMPT)
+        assert (source, is_stream) == ("Neural Core", True)
+        return [chunk async for chunk in stream]
+
+    assert asyncio.run(scenario()) == ["Monads ", "chain effects."]
+    assert router.brain.calls == 1  # the prefetched request, not a second one
+    assert router.stream_stats["speculative_used"] == 1
+    assert len(router.ttft_samples["speculative"]) == 1
+    assert router.memory.stored[1] == ("venom", "Monads chain effects.")
@@ -0,0 +1,72 @@
+import asyncio
+import json
+
+import pytest
+
+from ai_core.brain.streaming import NDJSONDecoder, coalesce, strip_overlap
+
+
+def test_decoder_handles_frames_split_across_chunks():
+    frames = [
+        {"model": "phi3", "response": "Hel", "done": False},
+        {"model": "phi3", "response": 'lo "\\n\u00e9', "done": False},
+        {"model": "phi3", "response": "", "done": True, "context": [1, 2]},
+    ]
+    raw = b"".join(json.dumps(f).encode() + b"\n" for f in frames)
+
+    decoder = NDJSONDecoder()
+    out = []
+    for i in range(0, len(raw), 7):
+        out.extend(decoder.feed(raw[i : i + 7]))
+
+    assert [text for text, _ in out] == ["Hel", 'lo "\\n\u00e9', ""]
+    assert out[-1][1]["context"] == [1, 2]
+    assert out[0][1] is None
+
+
+def test_decoder_raises_on_error_frame():
+    with pytest.raises(ConnectionError):
+        NDJSONDecoder().feed(b'{"error":"model not found"}\n')
+
+
+def test_coalesce_keeps_first_chunk_and_merges_the_rest():
+    async def tokens():
+        for t in ["a", "b", "c", "d", "e"]:
+            yield t
+
+    async def collect():
+        return [c async for c in coalesce(tokens(), size=2, interval=60)]
+
+    assert asyncio.run(collect()) == ["a", "bc", "de"]
+
+
+def _strip(chunks, partial):
+    async def stream():
+        for chunk in chunks:
+            yield chunk
+
+    async def collect():
+        return [text async for text in strip_overlap(stream(), partial)]
+
+    return asyncio.run(collect())
+
+
+@pytest.mark.parametrize(
+    "chunks, partial, expected",
+    [
+        # No overlap: the continuation passes through untouched
+        (["a test.", " Done."], "Hello world, this is", ["a test.", " Done."]),
+        # The continuation repeats the tail of what was emitted
+        (["answer is forty-two."], "The answer is forty", ["-two."]),
+        # The whole first chunk is a repeat: dropped, later chunks kept
+        (["The answer is forty", "-two."], "The answer is forty", ["-two."]),
+        # Overlaps shorter than min_overlap are left alone
+        (["is it"], "what is", ["is it"]),
+        # Only the first chunk is checked
+        (["fresh", "The answer"], "The answer", ["fresh", "The answer"]),
+        # Nothing emitted yet: nothing to strip
+        (["The answer"], "", ["The answer"]),
+    ],
+)
+def test_strip_overlap(chunks, partial, expected):
+    assert _strip(chunks, partial) == expected
@@ -0,0 +1,141 @@
+import numpy as np
+import pytest
+
+from ai_core.core.vector_store import (
+    NumpyVectorStore,
+    VectorStore,
+    hashing_embedding_function,
+)
+
+
+def _store(path, **options):
+    return NumpyVectorStore(str(path), hashing_embedding_function(), **options)
+
+
+def test_add_query_round_trip(tmp_path):
+    store = _store(tmp_path)
+    store.add(
+        ["a", "b"],
+        ["python decorators wrap functions", "the weather is sunny"],
+        [{"role": "user"}, {"role": "venom"}],
+    )
+
+    result = store.query(query_texts=["how do python decorators work"], n_results=1)
+    assert result["ids"] == [["a"]]
+    assert 0.0 <= result["distances"][0][0] < 1.0
+
+    filtered = store.query(query_texts=["python"], n_results=2, where={"role": "venom"})
+    assert filtered["ids"] == [["b"]]
+
+
+def test_delete_compact_and_reopen(tmp_path):
+    store = _store(tmp_path)
+    store.add(["a", "b", "c"], ["one", "two", "three"], [{}, {}, {}])
+    store.delete(["b"])
+    assert store.count() == 2
+
+    store.compact()
+    reopened = _store(tmp_path)
+    assert reopened.count() == 2
+    assert reopened.get()["documents"] == ["one", "three"]
+
+
+def test_readonly_opener_sees_new_rows(tmp_path):
+    writer = _store(tmp_path)
+    writer.add(["a"], ["first memory"], [{}])
+    reader = _store(tmp_path, readonly=True)
+    assert reader.count() == 1
+
+    writer.add(["b"], ["second memory"], [{}])
+    assert reader.count() == 2
+    assert reader.query(query_texts=["second memory"], n_results=1)["ids"] == [["b"]]
+
+
+def test_ivf_search_finds_nearest(tmp_path):
+    rng = np.random.default_rng(1)
+    vectors = rng.normal(size=(128, 16)).astype(np.float32)
+    store = _store(tmp_path, dtype="float32", ivf_lists=4, nprobe=2)
+    ids = [str(i) for i in range(len(vectors))]
+    store.add(ids, ids, [{} for _ in ids], embeddings=vectors)
+
+    result = store.query(query_embeddings=[vectors[42]], n_results=1)
+    assert store.centroids is not None
+    assert result["ids"] == [["42"]]
+
+
+def test_compaction_keeps_the_ivf_centroids(tmp_path):
+    rng = np.random.default_rng(2)
+    vectors = rng.normal(size=(128, 16)).astype(np.float32)
+    store = _store(tmp_path, dtype="float32", ivf_lists=4, nprobe=2)
+    ids = [str(i) for i in range(len(vectors))]
+    store.add(ids, ids, [{} for _ in ids], embeddings=vectors)
+    store.build_ivf()
+    centroids = store.centroids.copy()
+
+    store.delete(ids[:64])
+    store.compact()
+    assert np.array_equal(store.centroids, centroids)
+    assert len(store.assignments) == 64
+    result = store.query(query_embeddings=[vectors[100]], n_results=1)
+    assert result["ids"] == [["100"]]
+
+    reopened = _store(tmp_path, dtype="float32", ivf_lists=4, nprobe=2)
+    assert np.array_equal(reopened.centroids, centroids)
+
+
+def test_writes_append_to_the_log_until_a_checkpoint(tmp_path):
+    store = _store(tmp_path)
+    store.add(["a", "b"], ["one", "two"], [{}, {}])
+    checkpoint = (tmp_path / "columns.json").read_bytes()
+
+    store.add(["c"], ["three"], [{}])
+    store.update(["a"], [{"hits": 2}])
+    store.delete(["b"])
+    assert (tmp_path / "columns.json").read_bytes() == checkpoint
+    assert len((tmp_path / "columns.log").read_text().splitlines()) == 4
+
+    reopened = _store(tmp_path)
+    assert reopened.get()["ids"] == ["a", "c"]
+    assert reopened.get(ids=["a"])["metadatas"] == [{"hits": 2}]
+
+    reopened.CHECKPOINT_BYTES = 0
+    reopened.add(["d"], ["four"], [{}])  # log outgrew the checkpoint
+    reopened.add(["e"], ["five"], [{}])
+    assert (tmp_path / "columns.json").read_bytes() != checkpoint
+    assert len((tmp_path / "columns.log").read_text().splitlines()) == 2
+    assert _store(tmp_path).get()["ids"] == ["a", "c", "d", "e"]
+
+
+def test_log_from_before_a_checkpoint_is_ignored(tmp_path):
+    store = _store(tmp_path)
+    store.add(["a"], ["one"], [{}])
+    store.add(["b"], ["two"], [{}])
+    stale = (tmp_path / "columns.log").read_bytes()
+    store.compact()
+
+    # Crash between writing the checkpoint and resetting the log
+    (tmp_path / "columns.log").write_bytes(stale)
+    reopened = _store(tmp_path)
+    assert reopened.get()["ids"] == ["a", "b"]
+    reopened.add(["c"], ["three"], [{}])
+    assert _store(tmp_path).get()["ids"] == ["a", "b", "c"]
+
+
+def test_readonly_opener_replays_updates_and_deletes(tmp_path):
+    writer = _store(tmp_path)
+    writer.add(["a", "b"], ["first memory", "second memory"], [{}, {}])
+    reader = _store(tmp_path, readonly=True)
+
+    writer.update(["a"], [{"role": "user"}])
+    writer.delete(["b"])
+    assert reader.get()["metadatas"] == [{"role": "user"}]
+    assert reader.count() == 1
+
+    with pytest.raises(PermissionError):
+        reader.delete(["a"])
+    assert writer.count() == 1
+
+
+def test_vector_store_is_abstract():
+    with pytest.raises(TypeError):
+        VectorStore()
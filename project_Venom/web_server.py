@@ -89,6 +89,17 @@ async def get_system_state():
     }
 
 
+@app.get("/api/metrics")
+async def get_metrics():
+    """Routing statistics and cache/streaming telemetry from the brain process."""
+    if HAS_CORE:
+        snapshot = synapse.get_metrics()
+        if snapshot:
+            return snapshot
+
+    return {"metrics": {}, "timestamp": None}
+
+
 @app.websocket("/ws/system-stream")
 async def websocket_endpoint(websocket: WebSocket):
     """WebSocket endpoint for real-time system state streaming."""